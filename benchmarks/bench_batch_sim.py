@@ -0,0 +1,29 @@
+# benchmarks/bench_batch_sim.py
+"""
+Throughput of the NumPy batch simulator on 1e6 battles.
+Run from the repo root:  python -m benchmarks.bench_batch_sim
+"""
+import time
+
+from game.player import Player
+from game.companion import Companion
+from game.pet import Pet
+from game import batch_sim
+
+BATTLES = 1_000_000
+TURN = 8
+
+
+if __name__ == "__main__":
+    player = Player("Bench", "Warrior")
+    player.companions.append(Companion("Arthur", 70, 8, 0, 4))
+    player.pets.append(Pet("Spike", 35, 100, 6, "Arcane"))
+
+    start = time.perf_counter()
+    result = batch_sim.simulate(player, TURN, BATTLES, area="Volcano", seed=1)
+    elapsed = time.perf_counter() - start
+
+    print(f"{BATTLES} battles in {elapsed:.2f}s ({BATTLES / elapsed:,.0f} battles/s)")
+    for k, v in result.summary().items():
+        print(f"  {k}: {v}")
+    print("  win rate by wave:", result.win_rate_by_wave())
@@ -0,0 +1,58 @@
+# benchmarks/bench_catalog.py
+"""
+Catalog queries vs scanning SHOP_TIERS on every call (the old way), on the
+real item data and on a catalog blown up to 20k items.
+Run from the repo root:  python -m benchmarks.bench_catalog
+"""
+import time
+
+from game.catalog import Catalog, CATALOG
+from game.data import SHOP_TIERS
+from game.items import ITEM_TEMPLATES
+
+REPEAT = 2_000
+COPIES = 1_000  # per template, for the big catalog
+
+
+def scan_relics(tiers):
+    return [it for tier_list in tiers.values() for it in tier_list if it["type"] == "relic"]
+
+
+def scan_thief_weapons(tiers):
+    return [
+        it for tier_list in tiers.values() for it in tier_list
+        if it["type"] == "weapon" and "Thief" in it.get("class_req", ["Thief"]) and it["cost"] <= 200
+    ]
+
+
+def big_data():
+    """Each shop item COPIES times under new names, spread over the same tiers."""
+    tiers = {
+        tier: [dict(it, name=f"{it['name']} #{i}") for it in tier_list for i in range(COPIES)]
+        for tier, tier_list in SHOP_TIERS.items()
+    }
+    templates = {it["name"]: it for tier_list in tiers.values() for it in tier_list}
+    return tiers, Catalog(templates, tiers)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn(*args)
+    return (time.perf_counter() - start) / REPEAT * 1e6
+
+
+if __name__ == "__main__":
+    big_tiers, big = big_data()
+    print(f"mean us per query ({len(ITEM_TEMPLATES)} / {len(big.items)} catalog items)")
+    print(f"{'query':<22} {'scan':>9} {'catalog':>9} {'scan 20k':>10} {'catalog 20k':>12}")
+    rows = [
+        ("all relics", scan_relics, lambda c: c.by_type["relic"]),
+        ("Thief weapons <= 200", scan_thief_weapons,
+         lambda c: c.find(type="weapon", player_class="Thief", max_cost=200)),
+    ]
+    for name, scan, query in rows:
+        everything = {None: list(ITEM_TEMPLATES.values())}
+        assert list(query(CATALOG)) == sorted(scan(everything), key=lambda it: it["cost"])
+        print(f"{name:<22} {timed(scan, SHOP_TIERS):9.2f} {timed(query, CATALOG):9.2f} "
+              f"{timed(scan, big_tiers):10.1f} {timed(query, big):12.1f}")
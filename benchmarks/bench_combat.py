@@ -0,0 +1,75 @@
+# benchmarks/bench_combat.py
+"""
+Battles per second: interactive Game.battle_enemies loop (events formatted
+by a TerminalSink writing to /dev/null, as a terminal UI would) vs the
+headless engine. Each side is timed REPEAT times with the garbage collector
+off (as timeit does) and the best run counts.
+Run from the repo root:  python -m benchmarks.bench_combat
+"""
+import gc
+import os
+import random
+import time
+
+from game.game import Game
+from game.decisions import ScriptedDecisions
+from game.enemy import Enemy
+from game.combat import resolve_battle
+from game.events import TerminalSink
+
+BATTLES = 2000
+REPEAT = 3
+
+
+def setup(n):
+    """Build n (game, wave) pairs up front so only the fighting is timed."""
+    pairs = []
+    for _ in range(n):
+        g = Game(seed=1, decisions=ScriptedDecisions())  # skip talent picks
+        g.start_new_game("Bench", "1")
+        g.player.gold = 1000
+        g.hire_companion("1")
+        g.hire_pet("2")
+        g.player.gold = 100
+        wave = [Enemy("Goblin", 10), Enemy("Skeleton", 10)]
+        pairs.append((g, wave))
+    return pairs
+
+
+def timed(run, n):
+    gc.collect()
+    gc.disable()
+    try:
+        return run(n)
+    finally:
+        gc.enable()
+
+
+def interactive(n):
+    with open(os.devnull, "w") as sink:
+        pairs = setup(n)
+        out = TerminalSink(sink)
+        start = time.perf_counter()
+        for g, wave in pairs:
+            rounds = 0
+            while g.player.is_alive() and any(e.is_alive() for e in wave) and rounds < 1000:
+                out.write(g.battle_enemies(wave))
+                rounds += 1
+        out.flush()
+        return time.perf_counter() - start
+
+
+def headless(n):
+    pairs = setup(n)
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for g, wave in pairs:
+        resolve_battle(g.player, wave, rng)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    t_int = min(timed(interactive, BATTLES) for _ in range(REPEAT))
+    t_head = min(timed(headless, BATTLES) for _ in range(REPEAT))
+    print(f"interactive: {BATTLES / t_int:10.0f} battles/s")
+    print(f"headless:    {BATTLES / t_head:10.0f} battles/s  ({t_int / t_head:.1f}x)")
@@ -0,0 +1,82 @@
+# benchmarks/bench_crafting.py
+"""
+Crafting N Healing Potions next to 5k other items: the old list code
+(recount + pop loop per craft, reproduced below) vs Game.craft_item_by_name
+one at a time vs one bulk craft, plus max_craftable for a two-level recipe.
+Run from the repo root:  python -m benchmarks.bench_crafting
+"""
+import random
+import time
+
+from game.game import Game
+from game.data import CRAFTING_RECIPES
+from game.decisions import ScriptedDecisions
+from game.items import ITEM_TEMPLATES
+
+N = 500
+FILLER = 5_000
+RECIPE = CRAFTING_RECIPES["Healing Potion"]
+GEAR = [it for it in ITEM_TEMPLATES.values() if it["type"] in ("weapon", "armor", "relic")]
+
+
+def filler():
+    rng = random.Random(1)
+    return [rng.choice(GEAR) for _ in range(FILLER)]
+
+
+def list_craft(inventory, recipe):
+    mats = {}
+    for it in inventory:
+        if it["type"] == "material":
+            mats[it["name"]] = mats.get(it["name"], 0) + 1
+    if any(mats.get(k, 0) < v for k, v in recipe["ingredients"].items()):
+        return False
+    for mat, count_needed in recipe["ingredients"].items():
+        removed = idx = 0
+        while removed < count_needed and idx < len(inventory):
+            it = inventory[idx]
+            if it["type"] == "material" and it["name"] == mat:
+                inventory.pop(idx)
+                removed += 1
+            else:
+                idx += 1
+    inventory.append(recipe["result"].copy())
+    return True
+
+
+def game_with_materials():
+    g = Game(seed=1, decisions=ScriptedDecisions())
+    g.start_new_game("Bench", "1")
+    for it in filler():
+        g.player.inventory.add(it)
+    g.player.inventory.add(ITEM_TEMPLATES["Herb"], 2 * N)
+    g.player.inventory.add(ITEM_TEMPLATES["Water"], N)
+    return g
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+
+if __name__ == "__main__":
+    flat = filler() + [ITEM_TEMPLATES["Herb"]] * (2 * N) + [ITEM_TEMPLATES["Water"]] * N
+    one, bulk = game_with_materials(), game_with_materials()
+
+    t_list = timed(lambda: [list_craft(flat, RECIPE) for _ in range(N)])
+    t_one = timed(lambda: [one.craft_item_by_name("Healing Potion") for _ in range(N)])
+    t_bulk = timed(lambda: bulk.craft_item_by_name("Healing Potion", N))
+    assert one.player.inventory.name_counts() == bulk.player.inventory.name_counts()
+
+    print(f"{N} Healing Potions next to {FILLER} other items, ms")
+    print(f"list, one at a time   {t_list:9.2f}")
+    print(f"Game, one at a time   {t_one:9.2f}")
+    print(f"Game, bulk            {t_bulk:9.2f}")
+
+    g = game_with_materials()
+    g.player.inventory.add(ITEM_TEMPLATES["Healing Potion"], 7)
+    start = time.perf_counter()
+    most = g.max_craftable("Greater Healing Potion")
+    print(f"max_craftable Greater Healing Potion: {most} "
+          f"({(time.perf_counter() - start) * 1e6:.0f} us)")
@@ -0,0 +1,83 @@
+# benchmarks/bench_equip.py
+"""
+auto_equip_all on a five-member party with a 10k-item inventory: the old
+per-entity greedy pass (reproduced below) vs the party-wide equip_party.
+Reports time per call, gear changes reported on a repeat call with nothing
+new, and the summed weapon damage / armor defense of the party.
+Run from the repo root:  python -m benchmarks.bench_equip
+"""
+import random
+import time
+
+from game.game import Game
+from game.decisions import ScriptedDecisions
+from game.equip import can_equip
+from game.events import ItemEquipped
+from game.items import ITEM_TEMPLATES
+
+ITEMS = 10_000
+REPEAT = 50
+GEAR = [it for it in ITEM_TEMPLATES.values() if it["type"] in ("weapon", "armor", "relic")]
+
+
+def party(g):
+    p = g.player
+    return [p, *p.companions, *p.pets]
+
+
+def greedy_equip_all(g):
+    """The old auto_equip_all: each entity dumps its gear, then takes the best left."""
+    inventory = g.player.inventory
+    logs = []
+    for entity in party(g):
+        for slot in ("weapon", "armor", "relic"):
+            if getattr(entity, "equipped_" + slot):
+                inventory.add(getattr(entity, "equipped_" + slot))
+                setattr(entity, "equipped_" + slot, None)
+        for slot, stat in (("weapon", "damage"), ("armor", "defense"), ("relic", "cost")):
+            best, best_val = None, -1
+            for handle, it in inventory.bucket(slot).items():
+                if it.get(stat, 0) > best_val and can_equip(entity, it):
+                    best_val, best = it.get(stat, 0), handle
+            if best is not None:
+                item = inventory.remove(best)
+                setattr(entity, "equipped_" + slot, item)
+                logs.append(ItemEquipped(entity.name, slot, item["name"]))
+    return logs
+
+
+def setup(class_key):
+    g = Game(seed=1, decisions=ScriptedDecisions())
+    g.start_new_game("Bench", class_key)
+    g.player.gold = 10_000
+    g.hire_companion("1")
+    g.hire_companion("2")
+    g.hire_pet("1")
+    g.hire_pet("2")
+    rng = random.Random(1)
+    for _ in range(ITEMS):
+        g.player.inventory.add(rng.choice(GEAR))
+    return g
+
+
+def gear_score(g):
+    return sum((e.equipped_weapon or {}).get("damage", 0) + (e.equipped_armor or {}).get("defense", 0)
+               for e in party(g))
+
+
+def timed(fn, g):
+    fn(g)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        changes = len(fn(g))
+    return (time.perf_counter() - start) / REPEAT * 1e6, changes
+
+
+if __name__ == "__main__":
+    print(f"{ITEMS} items, party of 5, mean us per call / events on a repeat call")
+    for class_key in ("1", "2"):
+        old, new = setup(class_key), setup(class_key)
+        t_old, n_old = timed(greedy_equip_all, old)
+        t_new, n_new = timed(Game.auto_equip_all, new)
+        print(f"{old.player.player_class:<8} greedy  {t_old:9.1f} us  {n_old:2} events  score {gear_score(old)}")
+        print(f"{'':<8} party   {t_new:9.1f} us  {n_new:2} events  score {gear_score(new)}")
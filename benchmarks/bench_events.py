@@ -0,0 +1,50 @@
+# benchmarks/bench_events.py
+"""
+Cost of consuming the same battle events through each sink: NullSink
+(nothing is formatted), TerminalSink and JsonLinesSink (both to /dev/null).
+Run from the repo root:  python -m benchmarks.bench_events
+"""
+import os
+import time
+
+from game.game import Game
+from game.decisions import ScriptedDecisions
+from game.enemy import Enemy
+from game.events import NullSink, TerminalSink, JsonLinesSink
+
+BATTLES = 2000
+
+
+def battle_events():
+    """Event lists of BATTLES short fights, produced once up front."""
+    batches = []
+    for _ in range(BATTLES):
+        g = Game(seed=1, decisions=ScriptedDecisions())  # skip talent picks
+        g.start_new_game("Bench", "1")
+        g.player.gold = 1000
+        g.hire_companion("1")
+        g.hire_pet("2")
+        wave = [Enemy("Goblin", 10), Enemy("Skeleton", 10)]
+        rounds = 0
+        while g.player.is_alive() and any(e.is_alive() for e in wave) and rounds < 1000:
+            batches.append(g.battle_enemies(wave))
+            rounds += 1
+    return batches
+
+
+def consume(sink, batches):
+    start = time.perf_counter()
+    for events in batches:
+        sink.write(events)
+    sink.flush()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    batches = battle_events()
+    n = sum(len(b) for b in batches)
+    with open(os.devnull, "w") as devnull:
+        for name, sink in (("null", NullSink()), ("terminal", TerminalSink(devnull)),
+                           ("json-lines", JsonLinesSink(devnull))):
+            t = consume(sink, batches)
+            print(f"{name:<11} {n / t:12,.0f} events/s")
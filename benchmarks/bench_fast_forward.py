@@ -0,0 +1,44 @@
+# benchmarks/bench_fast_forward.py
+"""
+Advancing many turns with Game.fast_forward vs calling next_turn in a loop.
+Also shows a rare-event setting, where skipping quiet turns matters most.
+Run from the repo root:  python -m benchmarks.bench_fast_forward
+"""
+import math
+import time
+
+import game.game as game_module
+from game.game import Game
+
+TURNS = 200_000
+
+
+def fresh():
+    g = Game(seed=1)
+    g.start_new_game("Bench", "1")
+    g.player.hp = 10 ** 12  # traps must not end the run
+    return g
+
+
+def compare(label):
+    g = fresh()
+    start = time.perf_counter()
+    for _ in range(TURNS):
+        g.next_turn()
+    t_loop = time.perf_counter() - start
+
+    g = fresh()
+    start = time.perf_counter()
+    summary = g.fast_forward(TURNS)
+    t_ff = time.perf_counter() - start
+    print(f"{label}: next_turn loop {t_loop * 1e3:7.1f} ms, fast_forward {t_ff * 1e3:6.1f} ms "
+          f"({t_loop / t_ff:.1f}x, {sum(summary.events.values())} events)")
+
+
+if __name__ == "__main__":
+    compare("30% events")
+
+    # 1% event chance: patch both paths the same way
+    game_module.RANDOM_EVENT_CHANCE = 0.01
+    game_module._LOG_QUIET = math.log(1 - 0.01)
+    compare(" 1% events")
@@ -0,0 +1,65 @@
+# benchmarks/bench_fork.py
+"""
+Forks per second of a mid-game session: Game.fork vs copy.deepcopy.
+Also checks that a fork replays exactly like its source.
+Run from the repo root:  python -m benchmarks.bench_fork
+"""
+import copy
+import time
+
+from game.game import Game
+from game.decisions import ScriptedDecisions
+from game.enemy import Enemy
+from game.status_effect import StatusEffect
+from game.replay import state_hash
+
+FORKS = 20_000
+DEEPCOPIES = 2_000
+
+
+def mid_game():
+    """Player with gear, an inventory, companions, pets, enemies and effects."""
+    g = Game(seed=1, decisions=ScriptedDecisions())  # skip talent picks
+    g.start_new_game("Bench", "1")
+    g.player.gold = 10_000
+    g.hire_companion("1")
+    g.hire_companion("2")
+    g.hire_pet("1")
+    g.hire_pet("2")
+    for _ in range(3):
+        for i in range(1, len(g.shop_inventory) + 1):
+            g.buy_item_from_shop(i)
+    g.auto_equip_all()
+    g.current_enemies = [Enemy("Goblin", 10), Enemy("Skeleton", 10), Enemy("Zombie", 10)]
+    g.add_status_effect(g.current_enemies[0], StatusEffect("Poison", 5, "poison", 3))
+    g.add_status_effect(g.player, StatusEffect("Regen", 4, "regen", 2))
+    return g
+
+
+def rate(fn, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return n / (time.perf_counter() - start)
+
+
+def playout(g):
+    for _ in range(20):
+        g.next_turn()
+        g.normal_battle()
+    return state_hash(g)
+
+
+if __name__ == "__main__":
+    g = mid_game()
+    print(f"inventory {len(g.player.inventory)} items, "
+          f"{len(g.player.companions)} companions, {len(g.player.pets)} pets")
+
+    fork_rate = rate(g.fork, FORKS)
+    deep_rate = rate(lambda: copy.deepcopy(g), DEEPCOPIES)
+    print(f"Game.fork:     {fork_rate:9,.0f} forks/s")
+    print(f"copy.deepcopy: {deep_rate:9,.0f} forks/s ({fork_rate / deep_rate:.1f}x slower)")
+
+    before = state_hash(g)
+    same = playout(g.fork()) == playout(g.fork())
+    print(f"forks replay identically: {same}, source untouched: {state_hash(g) == before}")
@@ -0,0 +1,52 @@
+# benchmarks/bench_initiative.py
+"""
+Producing agility-based turn order for a large mixed battle:
+InitiativeQueue (heap, one O(log n) pop per action) vs the naive ATB loop
+that scans every unit for the earliest next-action time before each action.
+Run from the repo root:  python -m benchmarks.bench_initiative
+"""
+import random
+import time
+
+from game.companion import Companion
+from game.enemy import Enemy
+from game.initiative import InitiativeQueue, action_delay
+
+UNITS = 10_000
+ACTIONS = 5_000
+
+
+def units():
+    rng = random.Random(1)
+    out = [Companion(f"C{i}", 50, 5, 0, rng.randint(1, 15)) for i in range(UNITS // 2)]
+    out += [Enemy(rng.choice(["Goblin", "Skeleton", "Zombie"]), 10) for _ in range(UNITS // 2)]
+    return out
+
+
+def scan_each_action(all_units):
+    due = [action_delay(u) for u in all_units]
+    order = []
+    start = time.perf_counter()
+    for _ in range(ACTIONS):
+        i = min(range(len(due)), key=due.__getitem__)
+        order.append(all_units[i])
+        due[i] += action_delay(all_units[i])
+    return order, time.perf_counter() - start
+
+
+def heap_queue(all_units):
+    q = InitiativeQueue(all_units)
+    order = []
+    start = time.perf_counter()
+    for _ in range(ACTIONS):
+        order.append(q.pop())
+    return order, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    all_units = units()
+    _, t_scan = scan_each_action(all_units)
+    _, t_heap = heap_queue(all_units)
+    print(f"{UNITS} units, {ACTIONS} actions")
+    print(f"scan per action: {ACTIONS / t_scan:12,.0f} actions/s")
+    print(f"initiative heap: {ACTIONS / t_heap:12,.0f} actions/s  ({t_scan / t_heap:.0f}x)")
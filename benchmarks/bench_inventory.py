@@ -0,0 +1,133 @@
+# benchmarks/bench_inventory.py
+"""
+Inventory operations on a 10k-item inventory: the old flat-list code paths
+(reproduced below) vs the indexed Inventory behind the Game methods.
+
+Selling is a few microseconds either way at 10k items: list.remove is a
+scan and a memmove in C, while sell_item also keeps the Inventory's
+buckets and views up to date and builds its log events. The list cost
+grows with the inventory and the Inventory's does not, which the 100k row
+shows.
+Run from the repo root:  python -m benchmarks.bench_inventory
+"""
+import random
+import time
+
+from game.game import Game
+from game.data import CRAFTING_RECIPES
+from game.decisions import ScriptedDecisions
+from game.equip import can_equip
+from game.items import ITEM_TEMPLATES
+
+ITEMS = 10_000
+BIG = 100_000
+REPEAT = 200
+
+CATALOG = list(ITEM_TEMPLATES.values())
+BY_NAME = ITEM_TEMPLATES
+RECIPE = CRAFTING_RECIPES["Iron Sword"]
+
+
+def items(n):
+    rng = random.Random(1)
+    return [rng.choice(CATALOG) for _ in range(n)]
+
+
+# --- the list-based versions ---------------------------------------------
+
+def list_auto_equip(inventory, can_equip):
+    for slot, stat in (("weapon", "damage"), ("armor", "defense"), ("relic", "cost")):
+        best_val, best_idx = -1, -1
+        for i, it in enumerate(inventory):
+            if it["type"] == slot and can_equip(it) and it.get(stat, 0) > best_val:
+                best_val, best_idx = it.get(stat, 0), i
+        if best_idx >= 0:
+            inventory.append(inventory.pop(best_idx))  # equip, then put back
+
+
+def list_use_item(inventory, index):
+    usable = [i for i in inventory if i["type"] in ["potion", "scroll", "ring"]]
+    selected = usable[index]
+    inventory.pop(inventory.index(selected))
+    inventory.append(selected)
+
+
+def list_can_craft(inventory, recipe):
+    mats = {}
+    for it in inventory:
+        if it["type"] == "material":
+            mats[it["name"]] = mats.get(it["name"], 0) + 1
+    return all(mats.get(k, 0) >= v for k, v in recipe["ingredients"].items())
+
+
+def list_sorted_page(inventory):
+    """Old sort_inventory + listing the first page: a full sort every time."""
+    inventory.sort(key=lambda i: i["name"])
+    return inventory[:20]
+
+
+def list_sell(inventory, index):
+    sel = inventory[index]
+    inventory.remove(sel)
+    inventory.append(sel)
+
+
+# --- the Inventory versions, through Game ----------------------------------
+
+def indexed_auto_equip(g):
+    g.auto_equip_character(g.player)
+
+
+def indexed_use_item(g, index):
+    used = g.use_item(index)[0]
+    g.player.inventory.add(BY_NAME[used.item])
+
+
+def indexed_sell(g, index):
+    sold = g.sell_item(index)[0]
+    g.player.inventory.add(BY_NAME[sold.item])
+
+
+def indexed_sorted_page(g):
+    g.sort_inventory("name")
+    return g.list_player_inventory(page=1)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn(*args)
+    return (time.perf_counter() - start) / REPEAT * 1e6
+
+
+if __name__ == "__main__":
+    g = Game(seed=1, decisions=ScriptedDecisions())
+    g.start_new_game("Bench", "1")
+    for it in items(ITEMS):
+        g.player.inventory.add(it)
+    flat = items(ITEMS)
+    inv = g.player.inventory
+    assert inv.total() == ITEMS
+    assert sorted(it["name"] for it, n in inv.stacks() for _ in range(n)) == sorted(it["name"] for it in flat)
+    player_can_equip = lambda it: can_equip(g.player, it)
+    n_usable = sum(1 for it in flat if it["type"] in ("potion", "scroll", "ring"))
+    n_usable_entries = len(inv.of_types(("potion", "scroll", "ring")))
+
+    print(f"{ITEMS} items ({len(inv)} inventory entries), mean us per call")
+    print(f"{'operation':<14} {'list':>10} {'Inventory':>10}")
+    rows = [
+        ("auto-equip", timed(list_auto_equip, flat, player_can_equip), timed(indexed_auto_equip, g)),
+        ("use item", timed(list_use_item, flat, n_usable - 1), timed(indexed_use_item, g, n_usable_entries - 1)),
+        ("can craft", timed(list_can_craft, flat, RECIPE), timed(g.can_craft, RECIPE)),
+        ("sell item", timed(list_sell, flat, ITEMS // 2), timed(indexed_sell, g, len(inv) // 2)),
+        ("sorted page", timed(list_sorted_page, flat), timed(indexed_sorted_page, g)),
+    ]
+    big_game = Game(seed=1, decisions=ScriptedDecisions())
+    big_game.start_new_game("Bench", "1")
+    for it in items(BIG):
+        big_game.player.inventory.add(it)
+    big_flat = items(BIG)
+    rows.append((f"sell ({BIG // 1000}k)", timed(list_sell, big_flat, BIG // 2),
+                 timed(indexed_sell, big_game, len(big_game.player.inventory) // 2)))
+    for name, t_list, t_inv in rows:
+        print(f"{name:<14} {t_list:>10.1f} {t_inv:>10.1f}")
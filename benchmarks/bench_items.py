@@ -0,0 +1,45 @@
+# benchmarks/bench_items.py
+"""
+Memory and save size of a 10k-item inventory: one dict copy per item in a
+list saved with indent=4 (the old layout) vs template flyweights with
+stacked quantities saved as compact JSON (what save_game_slot writes).
+Run from the repo root:  python -m benchmarks.bench_items
+"""
+import json
+import random
+import tracemalloc
+
+from game.inventory import Inventory
+from game.items import ITEM_TEMPLATES
+
+ITEMS = 10_000
+CATALOG = list(ITEM_TEMPLATES.values())
+
+
+def picks(n):
+    rng = random.Random(1)
+    return [rng.choice(CATALOG) for _ in range(n)]
+
+
+def allocated(build):
+    """(bytes still allocated after build(), its result)."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+if __name__ == "__main__":
+    chosen = picks(ITEMS)
+    old_bytes, old = allocated(lambda: [it.copy() for it in chosen])
+    new_bytes, new = allocated(lambda: Inventory(chosen))
+    old_save = len(json.dumps(old, indent=4))
+    new_save = len(json.dumps(new.to_list(), separators=(",", ":")))
+    assert Inventory.from_list(new.to_list()).stacks() == new.stacks()
+    assert Inventory.from_list(old).stacks() == new.stacks()  # old saves still load
+
+    print(f"{ITEMS} items, {len(new)} inventory entries")
+    print(f"{'':<12} {'copies':>12} {'flyweights':>12}")
+    print(f"{'memory':<12} {old_bytes:>12,} {new_bytes:>12,}  ({old_bytes / new_bytes:.1f}x)")
+    print(f"{'save bytes':<12} {old_save:>12,} {new_save:>12,}  ({old_save / new_save:.1f}x)")
@@ -0,0 +1,54 @@
+# benchmarks/bench_loot.py
+"""
+Weighted drop sampling: random.choices (cumulative weights + bisect, the
+usual stdlib way) vs the alias tables behind loot.py, one at a time and in
+batches, on the real loot table and on a 20k-entry one.
+Run from the repo root:  python -m benchmarks.bench_loot
+"""
+import itertools
+import random
+import time
+
+from game.loot import AliasTable, loot_table, USE_NUMPY, np
+
+SAMPLES = 200_000
+BIG = 20_000
+
+
+def choices_one(outcomes, weights, rng):
+    cum = list(itertools.accumulate(weights))
+    for _ in range(SAMPLES):
+        rng.choices(outcomes, cum_weights=cum)
+
+
+def alias_one(table, rng):
+    sample = table.sample
+    for _ in range(SAMPLES):
+        sample(rng)
+
+
+def rate(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return SAMPLES / (time.perf_counter() - start) / 1e6
+
+
+if __name__ == "__main__":
+    real = loot_table("Volcano", "Boss Monster", 5)
+    weights = [1.0] * len(real)  # bisect cost does not depend on the weights
+    rng = random.Random(1)
+    big_weights = [rng.random() for _ in range(BIG)]
+    big = AliasTable(list(range(BIG)), big_weights)
+
+    print(f"million samples/s ({SAMPLES:,} draws)")
+    print(f"{'':<28} {len(real):>8} {BIG:>8}")
+    print(f"{'random.choices, one by one':<28} "
+          f"{rate(choices_one, real.outcomes, weights, rng):8.2f} "
+          f"{rate(choices_one, big.outcomes, big_weights, rng):8.2f}")
+    print(f"{'alias, one by one':<28} {rate(alias_one, real, rng):8.2f} {rate(alias_one, big, rng):8.2f}")
+    print(f"{'alias, sample_many':<28} "
+          f"{rate(real.sample_many, rng, SAMPLES):8.2f} {rate(big.sample_many, rng, SAMPLES):8.2f}")
+    if USE_NUMPY:
+        np_rng = np.random.default_rng(1)
+        print(f"{'alias, sample_indices':<28} "
+              f"{rate(real.sample_indices, np_rng, SAMPLES):8.2f} {rate(big.sample_indices, np_rng, SAMPLES):8.2f}")
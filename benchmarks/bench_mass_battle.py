@@ -0,0 +1,65 @@
+# benchmarks/bench_mass_battle.py
+"""
+1k vs 1k units: per-round cost of the normal battle path (Game.battle_enemies,
+which rebuilds the target list for every enemy) vs MassBattle's alive-sets.
+Run from the repo root:  python -m benchmarks.bench_mass_battle
+"""
+import random
+import time
+
+from game.game import Game
+from game.decisions import ScriptedDecisions
+from game.companion import Companion
+from game.enemy import Enemy
+from game.mass_battle import MassBattle
+
+UNITS = 1000
+ROUNDS = 5
+
+
+def armies():
+    g = Game(seed=1, decisions=ScriptedDecisions())  # skip talent picks
+    g.start_new_game("Bench", "1")
+    g.player.hp = 10 ** 6  # keep the leader standing for the timed rounds
+    for i in range(UNITS - 1):
+        g.player.companions.append(Companion(f"Soldier {i}", 200, 6, 0, 3))
+    horde = [Enemy(random.choice(["Goblin", "Skeleton", "Zombie"]), 20) for _ in range(UNITS)]
+    for e in horde:
+        e.hp *= 50  # nobody should fall over in a handful of rounds
+    return g, horde
+
+
+def normal_path():
+    random.seed(1)
+    g, horde = armies()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        g.battle_enemies(horde)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def mass_path():
+    random.seed(1)
+    g, horde = armies()
+    battle = MassBattle([g.player] + g.player.companions, horde, random.Random(1))
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        battle.play_round()
+    return (time.perf_counter() - start) / ROUNDS
+
+
+if __name__ == "__main__":
+    t_normal = normal_path()
+    t_mass = mass_path()
+    print(f"{UNITS} vs {UNITS} units")
+    print(f"battle_enemies: {t_normal * 1e3:8.2f} ms/round")
+    print(f"MassBattle:     {t_mass * 1e3:8.2f} ms/round  ({t_normal / t_mass:.0f}x)")
+
+    random.seed(2)
+    g, horde = armies()
+    for e in horde:
+        e.hp //= 50
+    g.player.hp = 100
+    start = time.perf_counter()
+    outcome = MassBattle([g.player] + g.player.companions, horde, random.Random(2)).run()
+    print(f"full 1k vs 1k siege: {outcome} in {time.perf_counter() - start:.2f}s")
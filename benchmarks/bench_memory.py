@@ -0,0 +1,66 @@
+# benchmarks/bench_memory.py
+"""
+Bytes per instance of the __slots__ entity classes vs the same classes with
+a per-instance __dict__ (a plain subclass brings the __dict__ back), and the
+total allocated for 100k enemies, each carrying one status effect.
+Run from the repo root:  python -m benchmarks.bench_memory
+"""
+import sys
+import tracemalloc
+
+from game.player import Player
+from game.companion import Companion
+from game.pet import Pet
+from game.enemy import Enemy
+from game.status_effect import StatusEffect
+
+ENEMIES = 100_000
+
+
+def with_dict(cls):
+    """Same class, but instances get a __dict__ again (the 'before' layout)."""
+    return type(cls.__name__ + "WithDict", (cls,), {})
+
+
+def instance_size(obj) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def make(cls):
+    if issubclass(cls, Player):
+        return cls("Bench", "Warrior")
+    if issubclass(cls, Enemy):
+        return cls("Goblin", 10)
+    if issubclass(cls, StatusEffect):
+        return cls("Poison", 3, "poison", 2)
+    return cls("Bench")
+
+
+def horde_bytes(enemy_cls, effect_cls) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    horde = []
+    for _ in range(ENEMIES):
+        e = enemy_cls("Goblin", 10)
+        e.status_effects.append(effect_cls("Poison", 3, "poison", 2))
+        horde.append(e)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del horde
+    return used
+
+
+if __name__ == "__main__":
+    print(f"{'class':<14}{'__dict__':>10}{'__slots__':>11}")
+    for cls in (Player, Companion, Pet, Enemy, StatusEffect):
+        old = instance_size(make(with_dict(cls)))
+        new = instance_size(make(cls))
+        print(f"{cls.__name__:<14}{old:>10}{new:>11}")
+
+    old = horde_bytes(with_dict(Enemy), with_dict(StatusEffect))
+    new = horde_bytes(Enemy, StatusEffect)
+    print(f"\n{ENEMIES} enemies + effects: {old / 1e6:.1f} MB with __dict__, "
+          f"{new / 1e6:.1f} MB with __slots__ ({100 * (1 - new / old):.0f}% less)")
@@ -0,0 +1,45 @@
+# benchmarks/bench_progression.py
+"""
+Applying a large XP grant in closed form vs one level per step (what
+repeated calls to the old gain_xp amounted to, minus its lost overflow).
+Both are timed with timeit: enough calls for a measurable run, REPEAT runs,
+best per-call time reported. The closed form costs about the same at any
+grant size; for a handful of levels the plain loop is as fast or faster.
+Run from the repo root:  python -m benchmarks.bench_progression
+"""
+import timeit
+
+from game.companion import Companion
+from game.progression import levels_for_xp, COMPANION_XP_PER_LEVEL
+
+GRANTS = [10 ** k for k in range(3, 10)]
+REPEAT = 5
+
+
+def stepwise(level, xp, per_level):
+    levels = 0
+    while xp >= per_level * level:
+        xp -= per_level * level
+        level += 1
+        levels += 1
+    return levels, xp
+
+
+def per_call(fn, *args):
+    """Best time of one fn(*args) call, in seconds."""
+    timer = timeit.Timer(lambda: fn(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(REPEAT, number)) / number
+
+
+if __name__ == "__main__":
+    print(f"{'XP':>12} {'levels':>8} {'stepwise':>12} {'closed form':>12}")
+    for amount in GRANTS:
+        expected = stepwise(1, amount, COMPANION_XP_PER_LEVEL)
+        summary = Companion("Bench").gain_xp(amount)
+        assert (summary.levels, summary.xp) == expected
+        assert levels_for_xp(1, amount, COMPANION_XP_PER_LEVEL) == expected
+
+        t_step = per_call(stepwise, 1, amount, COMPANION_XP_PER_LEVEL)
+        t_closed = per_call(levels_for_xp, 1, amount, COMPANION_XP_PER_LEVEL)
+        print(f"{amount:>12} {summary.levels:>8} {t_step * 1e6:>10.2f}us {t_closed * 1e6:>10.2f}us")
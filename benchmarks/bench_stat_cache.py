@@ -0,0 +1,44 @@
+# benchmarks/bench_stat_cache.py
+"""
+Per-hit cost in a long fight with cached combat stats vs recomputing them
+on every hit (what party_attack/enemies_attack used to do).
+Run from the repo root:  python -m benchmarks.bench_stat_cache
+"""
+import time
+
+from game.game import Game
+from game.enemy import Enemy
+
+HITS = 50_000
+
+
+def party():
+    g = Game(seed=1)
+    g.start_new_game("Bench", "1")
+    g.player.gold = 10_000
+    g.hire_companion("1")
+    g.hire_companion("3")
+    g.hire_pet("2")
+    g.player.equipped_weapon = {"name": "Long Sword", "type": "weapon", "cost": 100, "damage": 8}
+    return g
+
+
+def long_fight(g, recompute):
+    members = [g.player] + g.player.companions + g.player.pets
+    boss = Enemy("Boss Monster", 50)
+    boss.hp = 10 ** 12
+    start = time.perf_counter()
+    for _ in range(HITS):
+        if recompute:
+            for m in members:
+                m.invalidate_stats()
+        g.party_attack(boss)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    t_old = long_fight(party(), recompute=True)
+    t_new = long_fight(party(), recompute=False)
+    per = HITS * 4  # four attackers per party_attack
+    print(f"recompute every hit: {t_old / per * 1e9:8.0f} ns/hit")
+    print(f"cached stats:        {t_new / per * 1e9:8.0f} ns/hit  ({t_old / t_new:.2f}x)")
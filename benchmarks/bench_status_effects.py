@@ -0,0 +1,67 @@
+# benchmarks/bench_status_effects.py
+"""
+Per-turn cost of status effects on a large party with many stacked effects:
+the per-entity list scan (copy the list, tick every effect, list.remove on
+expiry) vs StatusEffectManager's timing wheel. Both paths run silently.
+Run from the repo root:  python -m benchmarks.bench_status_effects
+"""
+import random
+import time
+
+from game.companion import Companion
+from game.status_effect import StatusEffect
+from game.effect_manager import StatusEffectManager
+
+ENTITIES = 500
+EFFECTS_EACH = 40
+TURNS = 200
+
+
+def stacked_effects(rng):
+    """Mostly long non-damaging effects, some short poison/burn/regen."""
+    out = []
+    for _ in range(EFFECTS_EACH):
+        kind = rng.random()
+        if kind < 0.8:
+            out.append(StatusEffect("Stun", rng.randint(50, 400), "stun"))
+        elif kind < 0.9:
+            out.append(StatusEffect("Poison", rng.randint(1, 20), "poison", 1))
+        else:
+            out.append(StatusEffect("Regen", rng.randint(1, 20), "regen", 1))
+    return out
+
+
+def list_scan():
+    rng = random.Random(1)
+    party = [Companion(f"C{i}", 10 ** 6) for i in range(ENTITIES)]
+    for c in party:
+        c.status_effects.extend(stacked_effects(rng))
+    start = time.perf_counter()
+    for _ in range(TURNS):
+        for c in party:
+            for eff in c.status_effects[:]:
+                eff.tick(c)
+                if eff.duration <= 0:
+                    c.status_effects.remove(eff)
+    return time.perf_counter() - start
+
+
+def timing_wheel():
+    rng = random.Random(1)
+    party = [Companion(f"C{i}", 10 ** 6) for i in range(ENTITIES)]
+    manager = StatusEffectManager()
+    for c in party:
+        for eff in stacked_effects(rng):
+            manager.add(c, eff)
+    start = time.perf_counter()
+    for _ in range(TURNS):
+        manager.advance()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    t_list = list_scan()
+    t_wheel = timing_wheel()
+    print(f"{ENTITIES} entities x {EFFECTS_EACH} effects, {TURNS} turns")
+    print(f"list scan:    {t_list / TURNS * 1e3:7.2f} ms/turn")
+    print(f"timing wheel: {t_wheel / TURNS * 1e3:7.2f} ms/turn  ({t_list / t_wheel:.1f}x)")
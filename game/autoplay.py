@@ -0,0 +1,255 @@
+# game/autoplay.py
+"""
+Monte Carlo tree search autoplayer.
+
+The bot drives a Game only through its public commands (battles, skills,
+items, shopping, hiring, next_turn). For every move it searches from the
+current state: each playout forks the game (Game.fork), reseeds the fork's
+RNG so every playout samples a different future, walks the tree by UCB1,
+then plays random legal commands up to a fixed horizon and scores the
+state it ends in. The tree is open-loop - its nodes are command sequences,
+not states - which fits a game where the same command has random outcomes.
+
+The search stops at a per-move time budget (or after a fixed number of
+playouts, which keeps runs reproducible). With workers > 1 every worker
+process grows its own tree from the same state and the root visit counts
+are summed (root parallelism).
+
+Talent picks inside the search are random; in the real game they go to the
+game's own decision provider (the command line uses RandomDecisions).
+
+Run from the repo root:  python -m game.autoplay --runs 20 --moves 200 --budget 0.02
+"""
+import argparse
+import math
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .data import SKILLS
+from .decisions import RandomDecisions
+from .game import Game
+
+# One call of a public Game method
+Action = namedtuple("Action", ["command", "args"])
+
+# Result of Autoplayer.play
+RunSummary = namedtuple("RunSummary", ["moves", "turn", "level", "gold", "alive", "playouts", "seconds"])
+
+USABLE_TYPES = ("potion", "scroll", "ring")
+EQUIPMENT_TYPES = ("weapon", "armor", "relic")
+
+ALWAYS = [Action("next_turn", ()), Action("normal_battle", ()), Action("special_battle", ())]
+HIRE_COMPANION = [Action("hire_companion", (k,)) for k in ("1", "2", "3")]
+HIRE_PET = [Action("hire_pet", (k,)) for k in ("1", "2", "3")]
+EQUIP = Action("auto_equip_all", ())
+
+
+def legal_actions(game) -> list:
+    """Commands worth trying in this state (duplicate shop/inventory entries only once)."""
+    p = game.player
+    actions = ALWAYS[:]
+
+    if any(e.is_alive() for e in game.current_enemies):
+        for i, name in enumerate(p.skills):
+            if p.mana >= SKILLS[name]["mana_cost"]:
+                actions.append(Action("use_skill", (i,)))
+
+    seen = set()
+    for i, (_, it) in enumerate(p.inventory.of_types(USABLE_TYPES)):
+        if it["name"] not in seen:
+            seen.add(it["name"])
+            actions.append(Action("use_item", (i,)))
+    if any(p.inventory.count(t) for t in EQUIPMENT_TYPES):
+        actions.append(EQUIP)
+
+    seen = set()
+    for i, it in enumerate(game.shop_inventory, start=1):
+        if it["cost"] <= p.gold and it["name"] not in seen:
+            seen.add(it["name"])
+            actions.append(Action("buy_item_from_shop", (i,)))
+
+    # Same prices as Game.hire_companion / Game.hire_pet
+    if p.gold >= 150 * game.current_tier:
+        actions.extend(HIRE_COMPANION)
+    if p.gold >= 80 * game.current_tier:
+        actions.extend(HIRE_PET)
+    return actions
+
+
+def apply_action(game, action):
+    return getattr(game, action.command)(*action.args)
+
+
+def evaluate(game) -> float:
+    """Heuristic worth of a state: 0 once the player is dead, else grows with progress."""
+    p = game.player
+    if p is None or not p.is_alive():
+        return 0.0
+    party = sum(5 for c in p.companions if c.is_alive()) + sum(3 for pt in p.pets if pt.is_alive())
+    return 10 * p.level + game.turn + p.gold / 20 + p.hp / 10 + party + 1
+
+
+class Node:
+    __slots__ = ("children", "visits", "total")
+
+    def __init__(self):
+        self.children = {}
+        self.visits = 0
+        self.total = 0.0
+
+
+def search(game, budget=0.1, seed=None, horizon=20, exploration=1.4, max_playouts=None):
+    """
+    Grow a search tree from 'game' for 'budget' seconds (or 'max_playouts'
+    playouts). Returns ({action: (visits, total reward)} at the root, playouts).
+    Rewards are in [0, 1): a playout's final evaluate() relative to the root's.
+    """
+    rng = random.Random(seed)
+    talents = RandomDecisions(rng)
+    root = Node()
+    baseline = evaluate(game)
+    deadline = time.perf_counter() + budget
+    playouts = 0
+    while True:
+        sim = game.fork(talents)
+        sim.rng.seed(rng.getrandbits(64))
+        node = root
+        path = [root]
+        depth = 0
+
+        # Selection / expansion
+        while depth < horizon and not sim.is_game_over():
+            actions = legal_actions(sim)
+            untried = [a for a in actions if a not in node.children]
+            if untried:
+                action = rng.choice(untried)
+                child = Node()
+                node.children[action] = child
+                node = child
+            else:
+                log_n = math.log(node.visits)
+                children = node.children
+                action = max(actions, key=lambda a: children[a].total / children[a].visits
+                             + exploration * math.sqrt(log_n / children[a].visits))
+                node = children[action]
+            apply_action(sim, action)
+            path.append(node)
+            depth += 1
+            if node.visits == 0:
+                break
+
+        # Random rollout
+        while depth < horizon and not sim.is_game_over():
+            apply_action(sim, rng.choice(legal_actions(sim)))
+            depth += 1
+
+        value = evaluate(sim)
+        reward = value / (value + baseline)
+        for n in path:
+            n.visits += 1
+            n.total += reward
+        playouts += 1
+        if max_playouts is not None:
+            if playouts >= max_playouts:
+                break
+        elif time.perf_counter() >= deadline:
+            break
+    return {a: (child.visits, child.total) for a, child in root.children.items()}, playouts
+
+
+class Autoplayer:
+    """
+    Plays a Game move by move with MCTS.
+
+        with Autoplayer(budget=0.05, workers=4, seed=1) as bot:
+            summary = bot.play(game, max_moves=500)
+            print(bot.playouts_per_sec)
+    """
+
+    def __init__(self, budget=0.1, workers=1, horizon=20, exploration=1.4, seed=None, max_playouts=None):
+        self.budget = budget
+        self.workers = workers
+        self.horizon = horizon
+        self.exploration = exploration
+        self.max_playouts = max_playouts
+        self.rng = random.Random(seed)
+        self.pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        self.playouts = 0
+        self.search_time = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    @property
+    def playouts_per_sec(self) -> float:
+        return self.playouts / self.search_time if self.search_time else 0.0
+
+    def choose(self, game) -> Action:
+        """The most visited root command after searching from 'game'."""
+        start = time.perf_counter()
+        params = (self.horizon, self.exploration, self.max_playouts)
+        if self.pool is None:
+            results = [search(game, self.budget, self.rng.getrandbits(64), *params)]
+        else:
+            state = game.fork()  # a plain Game, even if 'game' is a replay.Recorder
+            futures = [
+                self.pool.submit(search, state, self.budget, self.rng.getrandbits(64), *params)
+                for _ in range(self.workers)
+            ]
+            results = [f.result() for f in futures]
+        self.search_time += time.perf_counter() - start
+
+        visits = {}
+        for stats, playouts in results:
+            self.playouts += playouts
+            for action, (n, _total) in stats.items():
+                visits[action] = visits.get(action, 0) + n
+        return max(visits, key=visits.get)
+
+    def play(self, game, max_moves=200) -> RunSummary:
+        """Play until the player dies or 'max_moves' commands were issued."""
+        start = time.perf_counter()
+        playouts_before = self.playouts
+        moves = 0
+        while moves < max_moves and not game.is_game_over():
+            action = self.choose(game)
+            apply_action(game, action)
+            moves += 1
+        p = game.player
+        return RunSummary(moves, game.turn, p.level, p.gold, p.is_alive(),
+                          self.playouts - playouts_before, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Let the MCTS bot play full runs")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--moves", type=int, default=200, help="commands per run")
+    parser.add_argument("--budget", type=float, default=0.02, help="search seconds per move")
+    parser.add_argument("--playouts", type=int, default=None, help="fixed playouts per move instead of a time budget")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--horizon", type=int, default=20)
+    parser.add_argument("--class", dest="class_key", default="1", help="1=Warrior 2=Mage 3=Thief 4=Cleric")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    survived = 0
+    with Autoplayer(args.budget, args.workers, args.horizon, seed=args.seed, max_playouts=args.playouts) as bot:
+        for run in range(args.runs):
+            game = Game(args.seed + run, RandomDecisions(random.Random(args.seed + run)))
+            game.start_new_game("Bot", args.class_key)
+            s = bot.play(game, args.moves)
+            survived += s.alive
+            print(f"run {run}: {s.moves} moves, turn {s.turn}, level {s.level}, gold {s.gold}, "
+                  f"{'alive' if s.alive else 'dead'}, {s.playouts / s.seconds:,.0f} playouts/s")
+        print(f"{survived}/{args.runs} runs survived, {bot.playouts:,} playouts, "
+              f"{bot.playouts_per_sec:,.0f} playouts/s")
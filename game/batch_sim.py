@@ -0,0 +1,233 @@
+# game/batch_sim.py
+"""
+Monte Carlo batch battle simulator.
+
+N battles of the same party against a wave are stored side by side as
+struct-of-arrays (HP, attack, damage-type code, weapon damage) and every
+round is resolved for all of them at once with NumPy. The rules follow
+combat.resolve_battle: the party hits the first living enemy in a fixed
+order, then every living enemy hits a random living party member, with the
+TYPE_WEAKNESSES doubling and the per-turn enemy scaling of Enemy.__init__.
+Status effects are not simulated.
+"""
+from .data import AREA_DATA, ENEMY_TYPES, TYPE_WEAKNESSES
+from .combat import XP_PER_KILL, XP_PER_WAVE
+
+########################################
+#   Attempt to import numpy
+########################################
+try:
+    import numpy as np
+    USE_NUMPY = True
+except ImportError:
+    np = None
+    USE_NUMPY = False
+
+
+DAMAGE_TYPES = sorted(set(TYPE_WEAKNESSES) | set(TYPE_WEAKNESSES.values()))
+TYPE_CODES = {t: i for i, t in enumerate(DAMAGE_TYPES)}
+
+
+def _type_matrix():
+    """MULT[attack_code, defend_code] is 2 where the attack hits a weakness."""
+    mult = np.ones((len(DAMAGE_TYPES), len(DAMAGE_TYPES)), dtype=np.int32)
+    for defend, attack in TYPE_WEAKNESSES.items():
+        mult[TYPE_CODES[attack], TYPE_CODES[defend]] = 2
+    return mult
+
+
+def scaled_enemy(type_key, turn):
+    """(hp, attack, damage_type, gold) of an enemy, scaled like Enemy.__init__."""
+    data = ENEMY_TYPES[type_key]
+    return (
+        data["base_hp"] + (turn * 5),
+        data["base_attack"] + (turn // 2),
+        data["damage_type"],
+        data["gold_drop"] + (turn // 2),
+    )
+
+
+class BatchResult:
+    """Per-battle outcome arrays plus summary helpers."""
+
+    def __init__(self, won, lost, rounds, gold, xp, wave_ids, waves):
+        self.won = won
+        self.lost = lost
+        self.rounds = rounds
+        self.gold = gold
+        self.xp = xp
+        self.wave_ids = wave_ids
+        self.waves = waves
+
+    @property
+    def n(self) -> int:
+        return len(self.won)
+
+    @property
+    def win_rate(self) -> float:
+        return float(self.won.mean()) if self.n else 0.0
+
+    def win_rate_ci(self, z=1.96):
+        """Normal-approximation confidence interval for the win rate."""
+        p = self.win_rate
+        half = z * (p * (1 - p) / max(self.n, 1)) ** 0.5
+        return max(0.0, p - half), min(1.0, p + half)
+
+    def win_rate_by_wave(self) -> dict:
+        """Win rate for every wave composition that was rolled."""
+        out = {}
+        for i, wave in enumerate(self.waves):
+            mask = self.wave_ids == i
+            if mask.any():
+                out[tuple(wave)] = float(self.won[mask].mean())
+        return out
+
+    def rounds_to_kill(self):
+        """Histogram of rounds needed to win: counts[r] = wins after r rounds."""
+        return np.bincount(self.rounds[self.won])
+
+    def rounds_percentiles(self, qs=(5, 25, 50, 75, 95)) -> dict:
+        wins = self.rounds[self.won]
+        if not len(wins):
+            return {}
+        return dict(zip(qs, np.percentile(wins, qs).tolist()))
+
+    def summary(self) -> dict:
+        lo, hi = self.win_rate_ci()
+        return {
+            "battles": self.n,
+            "win_rate": self.win_rate,
+            "win_rate_ci": (lo, hi),
+            "loss_rate": float(self.lost.mean()) if self.n else 0.0,
+            "rounds_to_kill": self.rounds_percentiles(),
+            "avg_gold": float(self.gold.mean()) if self.n else 0.0,
+            "avg_xp": float(self.xp.mean()) if self.n else 0.0,
+        }
+
+
+def party_arrays(player):
+    """
+    Flatten a Player and their companions/pets into per-member arrays:
+    (hp, base damage, extra 0..roll per hit, damage-type code).
+    Member 0 is always the player.
+    """
+    members = [player] + list(player.companions) + list(player.pets)
+    hp = [m.hp for m in members]
+    dmg = [m.combat_stats.attack for m in members]
+    rolls = [m.attack_roll for m in members]
+    types = [m.damage_type for m in members]
+    return (
+        np.array(hp, dtype=np.int32),
+        np.array(dmg, dtype=np.int32),
+        np.array(rolls, dtype=np.int32),
+        np.array([TYPE_CODES[t] for t in types], dtype=np.intp),
+    )
+
+
+def simulate(player, turn, n, wave=None, area=None, seed=None, max_rounds=200, rng=None) -> BatchResult:
+    """
+    Simulate 'n' independent battles of 'player''s party (current HP and gear)
+    against a wave at 'turn'.
+
+    Pass either 'wave' (a fixed list of ENEMY_TYPES keys) or 'area' (an
+    AREA_DATA key: each battle rolls its own wave the way get_enemy_wave does).
+    """
+    if not USE_NUMPY:
+        raise ImportError("numpy is required for the batch simulator")
+    if rng is None:
+        rng = np.random.default_rng(seed)
+
+    # Wave compositions
+    if wave is not None:
+        waves = [list(wave)]
+        wave_ids = np.zeros(n, dtype=np.intp)
+    else:
+        area_enemies = AREA_DATA[area or "Forest"]["enemies"]
+        how_many = 2 if turn > 5 else 1
+        picks = rng.integers(0, len(area_enemies), size=(n, how_many))
+        # encode each roll as a base-len(area_enemies) number
+        codes = np.zeros(n, dtype=np.intp)
+        for j in range(how_many):
+            codes = codes * len(area_enemies) + picks[:, j]
+        uniq, wave_ids = np.unique(codes, return_inverse=True)
+        waves = []
+        for code in uniq.tolist():
+            w = []
+            for _ in range(how_many):
+                w.append(area_enemies[code % len(area_enemies)])
+                code //= len(area_enemies)
+            waves.append(w[::-1])
+    E = len(waves[0])
+
+    # Enemy struct-of-arrays, shape (n, E)
+    stats = [[scaled_enemy(k, turn) for k in w] for w in waves]
+    e_hp = np.array([[s[0] for s in w] for w in stats], dtype=np.int32)[wave_ids]
+    e_atk = np.array([[s[1] for s in w] for w in stats], dtype=np.int32)[wave_ids]
+    e_type = np.array([[TYPE_CODES[s[2]] for s in w] for w in stats], dtype=np.intp)[wave_ids]
+    e_gold = np.array([[s[3] for s in w] for w in stats], dtype=np.int32)[wave_ids]
+
+    # Party struct-of-arrays, shape (n, M)
+    p_hp0, p_dmg, p_rolls, p_type = party_arrays(player)
+    M = len(p_hp0)
+    p_hp = np.tile(p_hp0, (n, 1))
+
+    mult = _type_matrix()
+    # hit multiplier of each party member against each enemy slot: (n, M, E)
+    party_vs_enemy = mult[p_type[None, :, None], e_type[:, None, :]]
+    # hit multiplier of each enemy slot against each party member: (n, E, M)
+    enemy_vs_party = mult[e_type[:, :, None], p_type[None, None, :]]
+
+    rows = np.arange(n)
+    active = np.ones(n, dtype=bool)
+    won = np.zeros(n, dtype=bool)
+    lost = np.zeros(n, dtype=bool)
+    rounds = np.zeros(n, dtype=np.int32)
+    gold = np.zeros(n, dtype=np.int64)
+    xp = np.zeros(n, dtype=np.int64)
+
+    for r in range(1, max_rounds + 1):
+        idx = rows[active]
+        if not len(idx):
+            break
+        rounds[idx] = r
+        ehp = e_hp[idx]
+        php = p_hp[idx]
+
+        # Party attacks the first alive enemy
+        e_alive = ehp > 0
+        t = e_alive.argmax(axis=1)
+        sub = np.arange(len(idx))
+        t_hp = ehp[sub, t]
+        for m in range(M):
+            dmg = np.full(len(idx), p_dmg[m], dtype=np.int32)
+            if p_rolls[m]:
+                dmg += rng.integers(0, p_rolls[m] + 1, size=len(idx), dtype=np.int32)
+            dmg *= party_vs_enemy[idx, m, t]
+            hit = (php[:, m] > 0) & (t_hp > 0)
+            t_hp -= dmg * hit
+        killed = (t_hp <= 0) & e_alive[sub, t]
+        ehp[sub, t] = t_hp
+        gold[idx] += np.where(killed, e_gold[idx, t], 0)
+        xp[idx] += killed * XP_PER_KILL
+
+        # Enemies retaliate against a random living party member
+        for e in range(E):
+            p_alive = php > 0
+            n_alive = p_alive.sum(axis=1)
+            attacking = (ehp[:, e] > 0) & (n_alive > 0)
+            k = (rng.random(len(idx)) * n_alive).astype(np.intp)
+            pick = (p_alive.cumsum(axis=1) > k[:, None]).argmax(axis=1)
+            dmg = e_atk[idx, e] * enemy_vs_party[idx, e, pick]
+            php[sub, pick] -= dmg * attacking
+
+        e_hp[idx] = ehp
+        p_hp[idx] = php
+
+        cleared = ~(ehp > 0).any(axis=1)
+        xp[idx] += cleared * XP_PER_WAVE
+        dead = php[:, 0] <= 0
+        lost[idx] = dead
+        won[idx] = cleared & ~dead
+        active[idx] = ~(dead | cleared)
+
+    return BatchResult(won, lost, rounds, gold, xp, wave_ids, waves)
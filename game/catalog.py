@@ -0,0 +1,95 @@
+# game/catalog.py
+"""
+The item catalog: every item template (items.py) indexed once at import.
+
+  CATALOG.by_type["relic"]          all relics
+  CATALOG.by_rarity["Epic"]         all Epic items
+  CATALOG.by_tier[3]                the tier-3 shop stock (crafted items,
+                                    materials etc. have no tier)
+  CATALOG.by_class["Thief"]         items a Thief may use (no class_req, or
+                                    Thief among them)
+  CATALOG.by_effect["holy_light"]   items with that effect
+  CATALOG.find(type="weapon", player_class="Thief", max_cost=200)
+
+Every bucket is a tuple sorted by cost (ties keep catalog order), so a
+price limit is a bisect. find() starts from the smallest bucket among the
+filters given and checks the others by set membership. The indexes are
+read-only mappings of tuples; the item dicts are the shared templates and
+must not be modified either.
+"""
+from bisect import bisect_right
+from types import MappingProxyType
+
+from .data import SHOP_TIERS
+from .items import ITEM_TEMPLATES
+
+
+class Catalog:
+    __slots__ = ("items", "by_type", "by_rarity", "by_tier", "by_class", "by_effect",
+                 "_by_type_class", "_unrestricted", "_costs", "_names")
+
+    def __init__(self, templates, tiers):
+        items = sorted(templates.values(), key=lambda it: it["cost"])
+        tier_of = {it["name"]: tier for tier, tier_list in tiers.items() for it in tier_list}
+        classes = {cls for it in items for cls in it.get("class_req", ())}
+
+        self._costs = {}  # id(bucket) -> its costs, for bisecting
+        self._names = {}  # id(bucket) -> frozenset of its item names
+        self.items = self._bucket(items)
+        self.by_type = self._index(items, lambda it: (it["type"],))
+        self.by_rarity = self._index(items, lambda it: (it.get("rarity", "Common"),))
+        self.by_tier = self._index(items, lambda it: (tier_of[it["name"]],) if it["name"] in tier_of else ())
+        self.by_effect = self._index(items, lambda it: (it["effect"],) if "effect" in it else ())
+        self.by_class = self._index(items, lambda it: it.get("class_req", classes))
+        self._unrestricted = self._bucket([it for it in items if "class_req" not in it])
+        # (type, class) -> bucket, and (type, None) for types no class restricts
+        self._by_type_class = self._index(
+            items, lambda it: [(it["type"], cls) for cls in it.get("class_req", classes | {None})])
+
+    def _index(self, items, keys_of):
+        index = {}
+        for it in items:
+            for key in keys_of(it):
+                index.setdefault(key, []).append(it)
+        return MappingProxyType({key: self._bucket(bucket) for key, bucket in index.items()})
+
+    def _bucket(self, items):
+        bucket = tuple(items)
+        self._costs[id(bucket)] = tuple(it["cost"] for it in bucket)
+        self._names[id(bucket)] = frozenset(it["name"] for it in bucket)
+        return bucket
+
+    def usable_by(self, player_class) -> tuple:
+        """Items a player of this class may use."""
+        return self.by_class.get(player_class, self._unrestricted)
+
+    def find(self, type=None, rarity=None, tier=None, player_class=None, effect=None, max_cost=None) -> list:
+        """Items matching every filter given, cheapest first."""
+        buckets = []
+        if type is not None and player_class is not None:
+            # The common shop/loot question gets its own index
+            cls = player_class if player_class in self.by_class else None
+            buckets.append(self._by_type_class.get((type, cls), ()))
+        elif type is not None:
+            buckets.append(self.by_type.get(type, ()))
+        elif player_class is not None:
+            buckets.append(self.usable_by(player_class))
+        for index, key in ((self.by_rarity, rarity), (self.by_tier, tier), (self.by_effect, effect)):
+            if key is not None:
+                buckets.append(index.get(key, ()))
+        if not buckets:
+            buckets.append(self.items)
+        if not all(buckets):
+            return []
+
+        buckets.sort(key=len)
+        first = buckets[0]
+        if max_cost is not None:
+            first = first[:bisect_right(self._costs[id(first)], max_cost)]
+        names = [self._names[id(b)] for b in buckets[1:]]
+        if not names:
+            return list(first)
+        return [it for it in first if all(it["name"] in n for n in names)]
+
+
+CATALOG = Catalog(ITEM_TEMPLATES, SHOP_TIERS)
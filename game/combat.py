@@ -0,0 +1,243 @@
+# game/combat.py
+"""
+Combat rules shared by the interactive battle path in Game and a headless
+engine that resolves whole battles without producing any output.
+"""
+import random
+from collections import namedtuple
+
+from .data import TYPE_WEAKNESSES
+from .status_effect import blocks_action
+
+# Winner codes used in BattleOutcome
+WINNER_NONE = 0      # round limit reached
+WINNER_PARTY = 1
+WINNER_ENEMIES = 2
+
+# XP handed out by Game.battle_enemies
+XP_PER_KILL = 20
+XP_PER_WAVE = 50
+
+# Nobody is stunned
+NO_ONE = frozenset()
+
+BattleOutcome = namedtuple(
+    "BattleOutcome",
+    ["winner", "rounds", "damage_dealt", "damage_taken", "gold", "xp"],
+)
+
+
+########################################
+#   Damage rules
+########################################
+
+def type_multiplier(attack_type, defender_type) -> int:
+    """2 if 'attack_type' is the weakness of 'defender_type', else 1."""
+    return 2 if TYPE_WEAKNESSES.get(defender_type) == attack_type else 1
+
+
+_TYPE_ROWS = {}
+
+
+def type_row(attack_type) -> dict:
+    """
+    Multiplier of an 'attack_type' hit against every known defender type.
+    Rows are built once per type and shared.
+    """
+    row = _TYPE_ROWS.get(attack_type)
+    if row is None:
+        types = set(TYPE_WEAKNESSES) | set(TYPE_WEAKNESSES.values())
+        row = _TYPE_ROWS[attack_type] = {d: type_multiplier(attack_type, d) for d in types}
+    return row
+
+
+def weakness_row(defender_type) -> dict:
+    """Multiplier of every known attack type against 'defender_type'."""
+    key = ("defend", defender_type)
+    row = _TYPE_ROWS.get(key)
+    if row is None:
+        types = set(TYPE_WEAKNESSES) | set(TYPE_WEAKNESSES.values())
+        row = _TYPE_ROWS[key] = {a: type_multiplier(a, defender_type) for a in types}
+    return row
+
+
+def calculate_damage(entity) -> int:
+    """
+    Base damage for a Player/Companion/Pet (Strength + weapon damage).
+    """
+    base = 5
+    if hasattr(entity, 'stats'):
+        base = entity.stats.get("Strength", 5)
+        if entity.equipped_weapon:
+            base += entity.equipped_weapon.get("damage", 0)
+    return base
+
+
+def companion_base_damage(c) -> int:
+    """Fixed part of a companion hit; its attack_roll adds 0-3 on top."""
+    base = c.strength
+    if c.equipped_weapon:
+        base += c.equipped_weapon.get("damage", 0)//2
+    return base
+
+
+def pet_damage(p) -> int:
+    dmg = p.damage
+    if p.equipped_weapon:
+        dmg += p.equipped_weapon.get("damage", 0)//2
+    return dmg
+
+
+########################################
+#   Headless engine
+########################################
+
+def _tick_all(entities):
+    """
+    Tick every status effect on 'entities'. Returns those still affected
+    and the eids of those blocked from acting this turn.
+    """
+    still = []
+    blocked = set()
+    for ent in entities:
+        for eff in ent.status_effects[:]:
+            if blocks_action(eff.effect_type):
+                blocked.add(ent.eid)
+            eff.tick(ent)
+            if eff.duration <= 0:
+                ent.status_effects.remove(eff)
+        if ent.status_effects:
+            still.append(ent)
+    return still, blocked
+
+
+def resolve_battle(player, enemies, rng=random, max_rounds=1000, effects=None) -> BattleOutcome:
+    """
+    Fight 'enemies' with the player's party until one side is beaten, using
+    the same per-round rules as Game.battle_enemies but without any output.
+
+    HP changes and status effects are applied to the combatants. Rewards are
+    only reported: the caller decides whether to add the gold to the player
+    and hand out the XP (per party member) with Game.distribute_xp.
+
+    Pass the session's StatusEffectManager as 'effects' to advance it once
+    per round; otherwise effects sitting in the entities' own lists are
+    ticked directly.
+    """
+    # Everything that stays fixed for the wave is worked out once: attack
+    # order is fixed (player, companions, pets), so each enemy damage type
+    # gets a flat list of (eid, hit, roll, multiplier) with the type bonus
+    # already applied, and each enemy a list of its hit on every party
+    # member. Only HP (the world's hp column) changes while fighting.
+    party = [player]
+    party.extend(player.companions)
+    party.extend(player.pets)
+    world = player.world
+    hp = world.hp
+    cached = world.stats
+    status = world.status
+    damage_types = world.damage_type
+    tick_directly = effects is None
+    ticking = []
+    party_ids = []
+    party_stats = []
+    living = []
+    for k, m in enumerate(party):
+        eid = m.eid
+        cs = cached[eid]
+        if cs is None:
+            cs = m.combat_stats
+        party_ids.append(eid)
+        party_stats.append((eid, cs, m.attack_roll + 1))
+        if hp[eid] > 0:
+            living.append(k)
+        if tick_directly and status[eid]:
+            ticking.append(m)
+
+    hit_lists = {}
+    foes = []
+    standing = []
+    for e in enemies:
+        eid = e.eid
+        e_type = damage_types[eid]
+        hits = hit_lists.get(e_type)
+        if hits is None:
+            hits = hit_lists[e_type] = []
+            for m_id, cs, roll in party_stats:
+                mult = cs.attack_row.get(e_type, 1)
+                hits.append((m_id, cs.attack * mult, roll if roll > 1 else 0, mult))
+        atk = e.attack
+        dmg_to = []
+        for _, cs, _ in party_stats:
+            dmg_to.append(atk * cs.defense_row.get(e_type, 1))
+        foe = (eid, hits, e.gold_drop, dmg_to)
+        foes.append(foe)
+        if hp[eid] > 0:
+            standing.append(foe)
+        if tick_directly and status[eid]:
+            ticking.append(e)
+
+    rand = rng.random
+    dealt = taken = gold = xp = 0
+    rounds = 0
+    winner = WINNER_NONE
+    leader = player.eid
+    blocked = NO_ONE  # eids of stunned units, who skip this round
+
+    while rounds < max_rounds:
+        rounds += 1
+        if effects is not None:
+            if len(effects) or effects.blocked:
+                effects.advance()
+                blocked = effects.blocked
+                living = [k for k, eid in enumerate(party_ids) if hp[eid] > 0]
+                standing = [f for f in foes if hp[f[0]] > 0]
+        elif ticking or blocked:
+            ticking, blocked = _tick_all(ticking)
+            living = [k for k, eid in enumerate(party_ids) if hp[eid] > 0]
+            standing = [f for f in foes if hp[f[0]] > 0]
+        if not standing:
+            winner = WINNER_PARTY
+            break
+
+        # Party attacks the first alive enemy
+        t_id, hits, t_gold, _ = standing[0]
+        t_hp = hp[t_id]
+        for eid, dmg, rolls, mult in hits:
+            if hp[eid] > 0 and eid not in blocked:
+                if rolls:
+                    dmg += int(rand() * rolls) * mult
+                t_hp -= dmg
+                dealt += dmg
+                if t_hp <= 0:
+                    break
+        hp[t_id] = t_hp
+        if t_hp <= 0:
+            gold += t_gold
+            xp += XP_PER_KILL
+            del standing[0]
+
+        # Enemies retaliate against a random living party member
+        for e_id, _, _, dmg_to in standing:
+            if not living:
+                break
+            if e_id in blocked:
+                continue
+            k = living[int(rand() * len(living))]
+            dmg = dmg_to[k]
+            pid = party_ids[k]
+            hp[pid] -= dmg
+            taken += dmg
+            if hp[pid] <= 0:
+                living.remove(k)
+
+        if not standing:
+            xp += XP_PER_WAVE
+        if hp[leader] <= 0:
+            winner = WINNER_ENEMIES
+            break
+        if not standing:
+            winner = WINNER_PARTY
+            break
+
+    return BattleOutcome(winner, rounds, dealt, taken, gold, xp)
@@ -0,0 +1,278 @@
+# game/combatant.py
+from collections import namedtuple
+
+from .combat import calculate_damage, type_row, weakness_row
+from .ecs import WORLD
+from .progression import LevelUpSummary, grant_xp
+from .status_effect import speed_factor, fork_effect
+
+# Derived stats used on every hit:
+#   attack      - fixed damage of a normal hit (before rolls and type bonus)
+#   defense     - defense of the equipped armor
+#   attack_row  - {defender damage_type: multiplier} for this entity's hits
+#   defense_row - {attacker damage_type: multiplier} for hits taken
+#   speed       - agility scaled by active haste/slow effects
+CombatStats = namedtuple("CombatStats", ["attack", "defense", "attack_row", "defense_row", "speed"])
+
+
+class Combatant:
+    """
+    Shared base for Player, Companion, Pet and Enemy.
+
+    An instance is a view over one row of an ecs.World: HP, level, XP,
+    damage type, equipment and the status effect list are stored in the
+    world's columns and reached through the properties below. Only
+    kind-specific attributes live on the instance itself. Status effects
+    are added, ticked and expired by a StatusEffectManager (Game.effects,
+    through Game.add_status_effect), never on the unit directly.
+
+    Keeps a cached CombatStats (the world's "stats" column) that is only
+    rebuilt after something it depends on changes: equipment, level, damage
+    type, the stats feeding attack, or the status effect list. Subclasses
+    override base_attack() where their hits follow their own rule and call
+    invalidate_stats() when their own attack inputs change.
+    """
+
+    __slots__ = ("name", "eid", "world")
+
+    # Hits add a random 0..attack_roll on top of combat_stats.attack
+    attack_roll = 0
+    # XP cost of going from level L to L+1 is xp_per_level * L (0: never levels)
+    xp_per_level = 0
+
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls)
+        self.world = WORLD
+        self.eid = WORLD.spawn()
+        return self
+
+    def __del__(self):
+        try:
+            self.world.despawn(self.eid)
+        except (AttributeError, TypeError):
+            pass  # never fully built, or the interpreter is shutting down
+
+    def __getstate__(self):
+        state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name not in ("eid", "world") and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state["components"] = self.world.row(self.eid)
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        self.world.set_row(self.eid, state.pop("components"))
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def fork(self, memo=None):
+        """
+        Independent copy in the same world, for lookahead (see Game.fork).
+        Immutable parts - item dicts, the cached CombatStats - are shared;
+        the status effects are cloned. 'memo' maps id(original) -> copy so
+        a unit or effect reached twice is only copied once.
+        """
+        if memo is None:
+            memo = {}
+        twin = memo.get(id(self))
+        if twin is not None:
+            return twin
+        cls = type(self)
+        twin = memo[id(self)] = cls.__new__(cls)
+        for name in _instance_slots(cls):
+            try:
+                setattr(twin, name, getattr(self, name))
+            except AttributeError:
+                pass
+        world = self.world
+        world.copy_row(self.eid, twin.eid)
+        effects = world.status[twin.eid]
+        for i, eff in enumerate(effects):
+            effects[i] = fork_effect(eff, memo)
+        return twin
+
+    def base_attack(self) -> int:
+        """Fixed damage of a normal hit; the plain rule unless a kind has its own."""
+        return calculate_damage(self)
+
+    def base_agility(self) -> int:
+        return 5
+
+    def level_gains(self, levels):
+        """Apply the stat gains of 'levels' level-ups; returns (gains, log notes)."""
+        return {}, ()
+
+    def invalidate_stats(self):
+        self.world.stats[self.eid] = None
+
+    @property
+    def combat_stats(self) -> CombatStats:
+        world = self.world
+        eid = self.eid
+        cs = world.stats[eid]
+        if cs is None:
+            armor = world.armor[eid]
+            damage_type = world.damage_type[eid]
+            status = world.status[eid]
+            cs = world.stats[eid] = CombatStats(
+                self.base_attack(),
+                armor.get("defense", 0) if armor else 0,
+                type_row(damage_type),
+                weakness_row(damage_type),
+                self.base_agility() * (speed_factor(status) if status else 1.0),
+            )
+        return cs
+
+    # --- components ---------------------------------------------------
+
+    @property
+    def hp(self):
+        return self.world.hp[self.eid]
+
+    @hp.setter
+    def hp(self, value):
+        self.world.hp[self.eid] = value
+
+    @property
+    def xp(self):
+        return self.world.xp[self.eid]
+
+    @xp.setter
+    def xp(self, value):
+        self.world.xp[self.eid] = value
+
+    @property
+    def status_effects(self):
+        return self.world.status[self.eid]
+
+    @status_effects.setter
+    def status_effects(self, effects):
+        self.world.status[self.eid] = effects
+        self.invalidate_stats()
+
+    @property
+    def equipped_weapon(self):
+        return self.world.weapon[self.eid]
+
+    @equipped_weapon.setter
+    def equipped_weapon(self, item):
+        self.world.weapon[self.eid] = item
+        self.invalidate_stats()
+
+    @property
+    def equipped_armor(self):
+        return self.world.armor[self.eid]
+
+    @equipped_armor.setter
+    def equipped_armor(self, item):
+        self.world.armor[self.eid] = item
+        self.invalidate_stats()
+
+    @property
+    def equipped_relic(self):
+        return self.world.relic[self.eid]
+
+    @equipped_relic.setter
+    def equipped_relic(self, item):
+        self.world.relic[self.eid] = item
+        self.invalidate_stats()
+
+    @property
+    def level(self):
+        return self.world.level[self.eid]
+
+    @level.setter
+    def level(self, value):
+        self.world.level[self.eid] = value
+        self.invalidate_stats()
+
+    @property
+    def damage_type(self):
+        return self.world.damage_type[self.eid]
+
+    @damage_type.setter
+    def damage_type(self, value):
+        self.world.damage_type[self.eid] = value
+        self.invalidate_stats()
+
+    # --- shared behaviour ---------------------------------------------
+
+    def is_alive(self):
+        return self.hp > 0
+
+    def take_damage(self, dmg):
+        self.hp -= dmg
+        return self.hp <= 0
+
+    def gain_xp(self, amount) -> LevelUpSummary:
+        """Add XP and apply every level-up it pays for at once."""
+        return grant_xp((self,), amount)[0]
+
+_SLOTS = {}
+
+
+def _instance_slots(cls) -> tuple:
+    """Slot names holding a class's own attributes (not eid/world)."""
+    names = _SLOTS.get(cls)
+    if names is None:
+        names = _SLOTS[cls] = tuple(
+            name for klass in cls.__mro__ for name in getattr(klass, "__slots__", ())
+            if name not in ("eid", "world")
+        )
+    return names
+
+
+class TrackedStats(dict):
+    """Stats dict that drops its owner's cached CombatStats when written to."""
+
+    def __init__(self, owner=None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.owner = owner
+
+    def _changed(self):
+        # owner is None while pickle/copy is still filling the dict in
+        if self.owner is not None:
+            self.owner.invalidate_stats()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def pop(self, key, *default):
+        value = super().pop(key, *default)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def __reduce__(self):
+        return (TrackedStats, (), {"owner": self.owner}, None, iter(self.items()))
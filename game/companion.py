@@ -1,8 +1,14 @@
 # game/companion.py
-from .data import colored_text, COLOR_GREEN
-from .status_effect import StatusEffect
+from .combat import companion_base_damage
+from .combatant import Combatant
+from .progression import COMPANION_XP_PER_LEVEL
+
+class Companion(Combatant):
+    __slots__ = ("_strength", "magic", "_agility")
+
+    attack_roll = 3
+    xp_per_level = COMPANION_XP_PER_LEVEL
 
-class Companion:
     def __init__(self, name, hp=50, strength=5, magic=2, agility=3, damage_type="Physical"):
         self.name = name
         self.hp = hp
@@ -19,26 +25,34 @@ class Companion:
 
         self.status_effects = []
 
-    def is_alive(self):
-        return self.hp > 0
-
-    def gain_xp(self, amount):
-        self.xp += amount
-        required_xp = 50 * self.level
-        if self.xp >= required_xp:
-            self.level += 1
-            self.xp = 0
-            self.hp += 10
-            self.strength += 2
-            self.magic += 2
-            self.agility += 1
-            print(colored_text(
-                f"{self.name} (Companion) leveled up to {self.level}!",
-                COLOR_GREEN
-            ))
-
-    def process_status_effects(self):
-        for eff in self.status_effects[:]:
-            eff.apply_effect(self)
-            if eff.duration <= 0:
-                self.status_effects.remove(eff)
+    @property
+    def strength(self):
+        return self._strength
+
+    @strength.setter
+    def strength(self, value):
+        self._strength = value
+        self.invalidate_stats()
+
+    @property
+    def agility(self):
+        return self._agility
+
+    @agility.setter
+    def agility(self, value):
+        self._agility = value
+        self.invalidate_stats()
+
+    def base_attack(self) -> int:
+        return companion_base_damage(self)
+
+    def base_agility(self) -> int:
+        return self.agility
+
+    def level_gains(self, levels):
+        gains = {"HP": 10 * levels, "Strength": 2 * levels, "Magic": 2 * levels, "Agility": levels}
+        self.hp += gains["HP"]
+        self.strength += gains["Strength"]
+        self.magic += gains["Magic"]
+        self.agility += gains["Agility"]
+        return gains, ()
@@ -0,0 +1,139 @@
+# game/crafting.py
+"""
+Crafting planner over CRAFTING_RECIPES.
+
+An ingredient may be the result of another recipe ("Steel Sword" needs an
+"Iron Sword"). Planning N crafts of a recipe walks its tree once:
+ingredients already in the inventory are used first, the shortfall of a
+craftable ingredient is crafted from its own ingredients, and anything
+else missing makes the plan fail. The resulting CraftPlan says how many
+units of each item to take and how many times to run each recipe, so a
+bulk craft takes everything in one pass instead of one craft at a time.
+
+The per-recipe parts that do not depend on the inventory - the flattened
+base materials per craft and the ingredient tree - are computed once per
+recipe and memoized.
+"""
+from collections import namedtuple
+
+from .data import CRAFTING_RECIPES
+
+# result item name -> recipe name
+RECIPE_FOR = {recipe["result"]["name"]: name for name, recipe in CRAFTING_RECIPES.items()}
+
+# take: {item name: units from the inventory}; crafts: {recipe name: times},
+# ingredients before the recipes that use them (the last one is the target)
+CraftPlan = namedtuple("CraftPlan", ["take", "crafts"])
+
+# One node of a material tree: 'children' is () for a base material
+CraftNode = namedtuple("CraftNode", ["name", "qty", "children"])
+
+_RAW = {}   # recipe name -> {base material: units per craft}
+_TREE = {}  # recipe name -> ((ingredient, units per craft, its recipe or None), ...)
+
+
+def _ingredients(recipe_name, path=()):
+    """Memoized ((ingredient, units, recipe name or None), ...) of one recipe."""
+    entry = _TREE.get(recipe_name)
+    if entry is None:
+        if recipe_name in path:
+            raise ValueError(f"crafting recipe cycle: {' -> '.join(path + (recipe_name,))}")
+        entry = tuple(
+            (ing, n, RECIPE_FOR.get(ing))
+            for ing, n in CRAFTING_RECIPES[recipe_name]["ingredients"].items()
+        )
+        for _, _, sub in entry:
+            if sub is not None:
+                _ingredients(sub, path + (recipe_name,))
+        _TREE[recipe_name] = entry
+    return entry
+
+
+def raw_materials(recipe_name) -> dict:
+    """{base material: units} for one craft with every ingredient crafted from scratch."""
+    raw = _RAW.get(recipe_name)
+    if raw is None:
+        raw = {}
+        for ing, n, sub in _ingredients(recipe_name):
+            if sub is None:
+                raw[ing] = raw.get(ing, 0) + n
+            else:
+                for mat, m in raw_materials(sub).items():
+                    raw[mat] = raw.get(mat, 0) + n * m
+        _RAW[recipe_name] = raw
+    return raw
+
+
+def material_tree(recipe_name, qty=1) -> CraftNode:
+    """The full ingredient tree for 'qty' crafts, down to base materials."""
+    children = tuple(
+        material_tree(sub, n * qty) if sub is not None else CraftNode(ing, n * qty, ())
+        for ing, n, sub in _ingredients(recipe_name)
+    )
+    return CraftNode(CRAFTING_RECIPES[recipe_name]["result"]["name"], qty, children)
+
+
+def plan(recipe_name, qty, have) -> CraftPlan:
+    """
+    Plan 'qty' crafts of 'recipe_name' from what the inventory holds
+    ('have' maps an item name to its unit count, e.g. Inventory.name_count).
+    Returns None if the inventory cannot cover it.
+    """
+    take, crafts = {}, {}
+    if not _need(recipe_name, qty, have, take, crafts):
+        return None
+    return CraftPlan(take, crafts)
+
+
+def _need(recipe_name, qty, have, take, crafts) -> bool:
+    for ing, n, sub in _ingredients(recipe_name):
+        units = n * qty
+        used = take.get(ing, 0)
+        from_stock = min(units, have(ing) - used)
+        if from_stock > 0:
+            take[ing] = used + from_stock
+            units -= from_stock
+        if units:
+            if sub is None or not _need(sub, units, have, take, crafts):
+                return False
+    crafts[recipe_name] = crafts.get(recipe_name, 0) + qty
+    return True
+
+
+def max_craftable(recipe_name, have) -> int:
+    """
+    How many times 'recipe_name' can be crafted from the inventory. Crafting
+    from base materials only gives a lower bound and counting stocked
+    intermediates at their full material worth an upper one; a binary
+    search over plan() settles the range in between.
+    """
+    raw = raw_materials(recipe_name)
+    if not raw:
+        return 0
+    lo = min(have(mat) // n for mat, n in raw.items())
+    worth = {mat: have(mat) for mat in raw}
+    for sub in _intermediates(recipe_name):
+        stocked = have(CRAFTING_RECIPES[sub]["result"]["name"])
+        if stocked:
+            for mat, m in raw_materials(sub).items():
+                worth[mat] += stocked * m
+    hi = min(worth[mat] // n for mat, n in raw.items())
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if plan(recipe_name, mid, have) is not None:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _intermediates(recipe_name) -> set:
+    """Recipes anywhere below 'recipe_name' in its tree."""
+    found = set()
+    stack = [recipe_name]
+    while stack:
+        for _, _, sub in _ingredients(stack.pop()):
+            if sub is not None and sub not in found:
+                found.add(sub)
+                stack.append(sub)
+    return found
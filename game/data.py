@@ -84,9 +84,31 @@ CRAFTING_RECIPES = {
         "ingredients": {"Herb":2,"Water":1},
         "result":{"name":"Healing Potion","type":"potion","cost":10,"heal":50,"rarity":"Common"}
     },
+    # Ingredients can be crafted items too
+    "Steel Sword": {
+        "ingredients": {"Iron Sword": 1, "Iron Ore": 2},
+        "result": {"name": "Steel Sword","type":"weapon","cost":160,"damage":11,"rarity":"Rare"},
+    },
+    "Greater Healing Potion": {
+        "ingredients": {"Healing Potion": 2, "Herb": 1},
+        "result": {"name": "Greater Healing Potion","type":"potion","cost":30,"heal":120,"rarity":"Uncommon"},
+    },
     # Add more...
 }
 
+# Crafting ingredients (the keys of every recipe's "ingredients")
+MATERIALS = [
+    {"name": "Iron Ore", "type": "material", "cost": 10, "rarity": "Common"},
+    {"name": "Herb", "type": "material", "cost": 4, "rarity": "Common"},
+    {"name": "Water", "type": "material", "cost": 2, "rarity": "Common"},
+]
+
+# Rarity rank for sorting (unknown rarities count as Common)
+RARITY_ORDER = {"Common": 1, "Uncommon": 2, "Rare": 3, "Epic": 4, "Legendary": 5}
+
+# Sold only by the special merchant (Game.merchant_buy_secret_potion)
+SECRET_POTION = {"name": "Secret Potion", "type": "potion", "cost": 0, "heal": 150, "rarity": "Rare"}
+
 AREA_DATA = {
     "Forest": {
         "enemies": ["Goblin", "Skeleton"],
@@ -102,6 +124,9 @@ AREA_DATA = {
     },
 }
 
+# Chance per turn that one of RANDOM_EVENTS happens
+RANDOM_EVENT_CHANCE = 0.3
+
 RANDOM_EVENTS = [
     {"text": "A wandering merchant appears, offering a unique potion for 30 gold.", 
      "trigger": "special_merchant"},
@@ -124,35 +149,41 @@ ENEMY_TYPES = {
         "base_hp": 30,
         "base_attack": 5,
         "damage_type": "Physical",
-        "gold_drop": 10
+        "gold_drop": 10,
+        "agility": 6
     },
     "Skeleton": {
         "name": "Skeleton",
         "base_hp": 40,
         "base_attack": 7,
         "damage_type": "Physical",
-        "gold_drop": 15
+        "gold_drop": 15,
+        "agility": 4
     },
     "Fire Elemental": {
         "name": "Fire Elemental",
         "base_hp": 35,
         "base_attack": 6,
         "damage_type": "Arcane",
-        "gold_drop": 20
+        "gold_drop": 20,
+        "agility": 7
     },
     "Zombie": {
         "name": "Zombie",
         "base_hp": 50,
         "base_attack": 4,
         "damage_type": "Physical",
-        "gold_drop": 18
+        "gold_drop": 18,
+        "agility": 2
     },
     "Boss Monster": {
         "name": "Boss Monster",
         "base_hp": 150,
         "base_attack": 12,
         "damage_type": "Physical",
-        "gold_drop": 100
+        "gold_drop": 100,
+        "agility": 5,
+        "loot_mod": 2.0
     },
 }
 
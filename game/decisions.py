@@ -0,0 +1,123 @@
+# game/decisions.py
+"""
+Decision providers: who answers the choices the game asks the player to
+make (currently the talent pick on every player level-up).
+
+A choice is a prompt plus a list of option labels; the provider returns the
+index of the picked option, or None to skip. Game holds one provider
+(Game.decisions) and hands it down to wherever a choice comes up, so the
+game code never reads stdin itself.
+
+  TerminalDecisions  asks on the terminal (the default, same prompt as before)
+  ScriptedDecisions  answers from a list (tests, replays); skips when it runs out
+  RandomDecisions    picks uniformly at random from its own RNG (bots, simulations)
+  RecordingDecisions passes choices to another provider and keeps the answers
+  AsyncDecisions     awaits an async callback, e.g. a remote client
+
+A provider with deferred = True is never asked in the middle of a command.
+The player banks the pick instead (Player.talent_points) and the caller
+settles it afterwards, with Game.spend_talent_points() or, for async
+providers, await Game.aspend_talent_points(). A server can therefore run
+many sessions on one event loop without any of them blocking.
+"""
+import random
+
+
+class DecisionProvider:
+    """Base class. Subclasses implement choose() (or achoose() when deferred)."""
+
+    # True: don't ask during a command; the game banks the choice
+    deferred = False
+
+    def choose(self, prompt, options):
+        """Index into 'options' of the pick, or None to skip."""
+        raise NotImplementedError
+
+    async def achoose(self, prompt, options):
+        return self.choose(prompt, options)
+
+
+def parse_choice(answer, n_options):
+    """'2' -> 1; anything that is not a valid 1-based number -> None."""
+    answer = str(answer).strip()
+    if answer.isdigit() and 1 <= int(answer) <= n_options:
+        return int(answer) - 1
+    return None
+
+
+class TerminalDecisions(DecisionProvider):
+    def choose(self, prompt, options):
+        print(f"\n{prompt}")
+        for i, label in enumerate(options, start=1):
+            print(f"{i}. {label}")
+        return parse_choice(input("Pick # or 'skip': "), len(options))
+
+
+class ScriptedDecisions(DecisionProvider):
+    """
+    Answers with the given indices (None = skip) in order. Pass deferred=True
+    to stand in for a deferred provider (the picks are then asked for by
+    Game.spend_talent_points instead of mid-command).
+    """
+
+    def __init__(self, answers=(), deferred=False):
+        self.answers = iter(answers)
+        self.deferred = deferred
+
+    def choose(self, prompt, options):
+        answer = next(self.answers, None)
+        if answer is None or not 0 <= answer < len(options):
+            return None
+        return answer
+
+
+class RandomDecisions(DecisionProvider):
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random.Random()
+
+    def choose(self, prompt, options):
+        return self.rng.randrange(len(options)) if options else None
+
+
+class RecordingDecisions(DecisionProvider):
+    """Asks 'inner' and appends every answer to 'answers'."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.answers = []
+
+    @property
+    def deferred(self):
+        return self.inner.deferred
+
+    def choose(self, prompt, options):
+        answer = self.inner.choose(prompt, options)
+        self.answers.append(answer)
+        return answer
+
+    async def achoose(self, prompt, options):
+        answer = await self.inner.achoose(prompt, options)
+        self.answers.append(answer)
+        return answer
+
+
+class AsyncDecisions(DecisionProvider):
+    """
+    Forwards each choice to 'ask', an async function (prompt, options) ->
+    index or None - typically a round trip to a remote client.
+    """
+
+    deferred = True
+
+    def __init__(self, ask):
+        self.ask = ask
+
+    def choose(self, prompt, options):
+        raise RuntimeError("AsyncDecisions is deferred; use Game.aspend_talent_points()")
+
+    async def achoose(self, prompt, options):
+        return await self.ask(prompt, options)
+
+
+# Shared default for code that has no Game (e.g. Player.gain_xp called directly)
+TERMINAL = TerminalDecisions()
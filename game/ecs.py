@@ -0,0 +1,114 @@
+# game/ecs.py
+"""
+Component storage for every combatant (Player, Companion, Pet, Enemy).
+
+Components live in parallel columns - plain lists indexed by entity id -
+instead of on each object:
+
+  Health        hp
+  DamageType    damage_type
+  Equipment     weapon, armor, relic
+  StatusEffects status (one list per entity)
+  XP            level, xp
+  Attack        stats (cached CombatStats, None when it must be rebuilt)
+
+The entity classes are thin views: a view only holds its id plus the
+attributes specific to its kind (player stats, enemy gold drop, ...) and
+reads/writes the shared components through properties. Systems that run
+over many units (battles, XP grants) read the columns directly, which keeps
+hordes of hundreds of units cheap to iterate.
+
+Ids are recycled: when a view is garbage collected its row is cleared and
+handed to the next spawned entity.
+"""
+
+
+class World:
+    """Column store for combatant components."""
+
+    COLUMNS = ("hp", "damage_type", "weapon", "armor", "relic", "status", "level", "xp", "stats")
+
+    def __init__(self):
+        self.hp = []
+        self.damage_type = []
+        self.weapon = []
+        self.armor = []
+        self.relic = []
+        self.status = []
+        self.level = []
+        self.xp = []
+        self.stats = []
+        self._free = []
+
+    def __len__(self):
+        return len(self.hp) - len(self._free)
+
+    def spawn(self) -> int:
+        """Allocate a row with default components; returns the entity id."""
+        if self._free:
+            eid = self._free.pop()
+            self.status[eid] = []
+            self.level[eid] = 1
+            return eid
+        eid = len(self.hp)
+        self.hp.append(0)
+        self.damage_type.append(None)
+        self.weapon.append(None)
+        self.armor.append(None)
+        self.relic.append(None)
+        self.status.append([])
+        self.level.append(1)
+        self.xp.append(0)
+        self.stats.append(None)
+        return eid
+
+    def despawn(self, eid):
+        """Clear a row (dropping its references) and recycle the id."""
+        self.hp[eid] = 0
+        self.damage_type[eid] = None
+        self.weapon[eid] = None
+        self.armor[eid] = None
+        self.relic[eid] = None
+        self.status[eid] = None
+        self.level[eid] = 1
+        self.xp[eid] = 0
+        self.stats[eid] = None
+        self._free.append(eid)
+
+    def row(self, eid) -> dict:
+        """All stored components of one entity (except the cache)."""
+        return {
+            "hp": self.hp[eid],
+            "damage_type": self.damage_type[eid],
+            "weapon": self.weapon[eid],
+            "armor": self.armor[eid],
+            "relic": self.relic[eid],
+            "status": self.status[eid],
+            "level": self.level[eid],
+            "xp": self.xp[eid],
+        }
+
+    def copy_row(self, src, dst):
+        """
+        Give 'dst' the components of 'src'. The status list is copied (its
+        effects are still the originals); everything else is immutable and
+        shared, including the cached CombatStats.
+        """
+        self.hp[dst] = self.hp[src]
+        self.damage_type[dst] = self.damage_type[src]
+        self.weapon[dst] = self.weapon[src]
+        self.armor[dst] = self.armor[src]
+        self.relic[dst] = self.relic[src]
+        self.status[dst] = self.status[src][:]
+        self.level[dst] = self.level[src]
+        self.xp[dst] = self.xp[src]
+        self.stats[dst] = self.stats[src]
+
+    def set_row(self, eid, components):
+        for name, value in components.items():
+            getattr(self, name)[eid] = value
+        self.stats[eid] = None
+
+
+# Entities are spawned here unless a view is moved elsewhere
+WORLD = World()
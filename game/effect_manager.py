@@ -0,0 +1,188 @@
+# game/effect_manager.py
+"""
+Status effect bookkeeping on a hashed timing wheel.
+
+Instead of every entity copying its status_effects list each turn and
+decrementing every duration, the manager stores each effect once under the
+turn it expires. A turn then only touches:
+  - the periodic effects (see EFFECT_TYPES) that actually change HP, applied
+    in one grouped pass per effect type across every combatant,
+  - the units under an effect that blocks actions (stun): the turn's
+    'blocked' set of entity ids, which battles check before a unit acts,
+    is only rebuilt after such an effect was added or removed, and
+  - the wheel bucket for the current turn, which holds the effects that
+    expire now (plus, for durations longer than the wheel, entries that
+    are still waiting for a later lap).
+After a turn, hp_changed and speed_changed name the units whose HP or
+haste/slow effects it touched, so a battle updates only those.
+Removal from the target's status_effects list is a swap-with-last, so
+expiry is O(1) per effect.
+"""
+from .status_effect import EFFECT_TYPES, EffectEvent, fork_effect
+
+
+class StatusEffectManager:
+    WHEEL_SIZE = 64
+
+    def __init__(self):
+        self.turn = 0
+        self._wheel = [[] for _ in range(self.WHEEL_SIZE)]
+        self._groups = {}     # effect_type -> {effect: target} for periodic effects
+        self._blocking = {}   # effect_type -> {target: its effects of that type} for stuns etc.
+        self._blocking_changed = False
+        self._count = 0
+        # Units that lose their action this turn (set by advance) and their eids
+        self._stunned = ()
+        self.blocked = frozenset()
+        # Units whose HP the last advance changed (targets of periodic effects)
+        self.hp_changed = []
+        # Units whose haste/slow effects started or ended since the last advance began
+        self.speed_changed = []
+
+    def __len__(self):
+        return self._count
+
+    def fork(self, memo):
+        """
+        Copy of the wheel over forked effects and targets. 'memo' is the one
+        used to fork the game's units (see Game.fork); units only the manager
+        still references are forked here.
+        """
+        twin = StatusEffectManager.__new__(StatusEffectManager)
+        twin.turn = self.turn
+        twin._count = self._count
+        twin._wheel = [
+            [(fork_effect(eff, memo), target.fork(memo)) for eff, target in bucket if eff.expires_at is not None]
+            if bucket else []
+            for bucket in self._wheel
+        ]
+        twin._groups = {
+            effect_type: {fork_effect(eff, memo): target.fork(memo) for eff, target in group.items()}
+            for effect_type, group in self._groups.items()
+        }
+        twin._blocking = {
+            effect_type: {target.fork(memo): n for target, n in group.items()}
+            for effect_type, group in self._blocking.items()
+        }
+        twin._blocking_changed = self._blocking_changed
+        twin._stunned = tuple(unit.fork(memo) for unit in self._stunned)
+        twin.blocked = frozenset(unit.eid for unit in twin._stunned)
+        twin.hp_changed = []
+        twin.speed_changed = []
+        return twin
+
+    def add(self, target, effect):
+        """Start 'effect' on 'target'; it fires on the next 'duration' turns."""
+        if effect.duration <= 0:
+            return
+        effect.expires_at = self.turn + effect.duration
+        self._wheel[effect.expires_at % self.WHEEL_SIZE].append((effect, target))
+        effect.slot = len(target.status_effects)
+        target.status_effects.append(effect)
+        et = EFFECT_TYPES.get(effect.effect_type)
+        if et is not None and et.periodic:
+            self._groups.setdefault(effect.effect_type, {})[effect] = target
+        if et is not None and et.blocks_action:
+            group = self._blocking.setdefault(effect.effect_type, {})
+            if target not in group:
+                group[target] = 0
+                self._blocking_changed = True
+            group[target] += 1
+        if et is not None and et.speed != 1.0:
+            self.speed_changed.append(target)
+        self._count += 1
+        target.invalidate_stats()
+
+    def remove(self, target, effect):
+        """Cancel an effect early. Its wheel entry is dropped lazily."""
+        if effect.expires_at is None:
+            return
+        self._detach(target, effect)
+
+    def clear(self, target):
+        """Cancel every effect on 'target' (e.g. a unit leaving the battle)."""
+        for effect in target.status_effects[:]:
+            self.remove(target, effect)
+
+    def advance(self) -> list[EffectEvent]:
+        """
+        Move to the next turn: apply each periodic effect type to all of its
+        targets in one pass, work out who is blocked from acting this turn,
+        then expire whatever ends this turn.
+        Returns one EffectEvent per effect type that fired (nothing is printed);
+        the units it hit or healed are left in self.hp_changed, those whose
+        haste or slow ran out in self.speed_changed.
+        """
+        self.turn += 1
+        events = []
+        self.speed_changed = []
+        changed = self.hp_changed = []
+        for effect_type, group in self._groups.items():
+            if not group:
+                continue
+            total = EFFECT_TYPES[effect_type].apply(group.items())
+            names = []
+            for eff, target in group.items():
+                eff.duration -= 1
+                names.append(target.name)
+            changed.extend(group.values())
+            events.append(EffectEvent(effect_type, len(group), total, tuple(names)))
+
+        if self._blocking_changed:
+            self._blocking_changed = False
+            stunned = []
+            for group in self._blocking.values():
+                stunned.extend(group)
+            self._stunned = tuple(stunned)
+            self.blocked = frozenset(unit.eid for unit in stunned)
+        if self._stunned:
+            for effect_type, group in self._blocking.items():
+                if group and effect_type not in self._groups:  # periodic ones are reported above
+                    names = tuple(target.name for target in group)
+                    events.append(EffectEvent(effect_type, sum(group.values()), 0, names))
+
+        idx = self.turn % self.WHEEL_SIZE
+        bucket = self._wheel[idx]
+        if not bucket:
+            return events
+        later = []
+        for entry in bucket:
+            eff, target = entry
+            if eff.expires_at == self.turn:
+                self._detach(target, eff)
+            elif eff.expires_at is not None and eff.expires_at > self.turn:
+                later.append(entry)   # due on a later lap of the wheel
+        self._wheel[idx] = later
+        return events
+
+    def _detach(self, target, effect):
+        effect.expires_at = None
+        effect.duration = 0
+        group = self._groups.get(effect.effect_type)
+        if group is not None:
+            group.pop(effect, None)
+        group = self._blocking.get(effect.effect_type)
+        if group is not None and target in group:
+            if group[target] > 1:
+                group[target] -= 1
+            else:
+                del group[target]
+                self._blocking_changed = True
+        et = EFFECT_TYPES.get(effect.effect_type)
+        if et is not None and et.speed != 1.0:
+            self.speed_changed.append(target)
+        self._count -= 1
+
+        effects = target.status_effects
+        i = effect.slot
+        effect.slot = None
+        if i is None or i >= len(effects) or effects[i] is not effect:
+            # list was edited outside the manager
+            if effect in effects:
+                effects.remove(effect)
+        else:
+            last = effects.pop()
+            if last is not effect:
+                effects[i] = last
+                last.slot = i
+        target.invalidate_stats()
@@ -0,0 +1,160 @@
+# game/equip.py
+"""
+Party-wide auto-equip.
+
+For each slot (weapon by damage, armor by defense, relic by cost) the
+candidates are the inventory's items of that slot plus what the party
+already wears. Each candidate falls into one group by who may wear it
+(item_group; can_equip, also behind Game.can_equip, answers the same
+question for one entity):
+
+  "player"     class_req items of the player's class
+  "companion"  companion_only items
+  "pet"        pet_only items
+  "any"        everything else
+
+One pass over the candidates, best first, picks the set with the highest
+total: a candidate is taken unless its group (or the party) is already
+full. Because "any" items fit everyone, that greedy pass is optimal and
+does not depend on party order. The picks are then dealt out - an item
+stays on whoever wears it where possible, the rest go in party order -
+and only entities whose gear actually changed get an event.
+"""
+from .companion import Companion
+from .pet import Pet
+from .player import Player
+from .events import ItemEquipped, ItemUnequipped
+
+# slot -> stat that ranks it (same as before: the first of equal items wins)
+SLOTS = (("weapon", "damage"), ("armor", "defense"), ("relic", "cost"))
+
+GROUPS = ("player", "companion", "pet", "any")
+
+
+def item_group(item, player_class):
+    """Who may wear 'item' (one of GROUPS), or None if nobody in the party can."""
+    if "class_req" in item:
+        if item.get("pet_only") or item.get("companion_only") or player_class not in item["class_req"]:
+            return None
+        return "player"
+    if item.get("pet_only"):
+        return None if item.get("companion_only") else "pet"
+    if item.get("companion_only"):
+        return "companion"
+    return "any"
+
+
+def entity_group(entity):
+    if isinstance(entity, Pet):
+        return "pet"
+    if isinstance(entity, Companion):
+        return "companion"
+    return "player" if isinstance(entity, Player) else None
+
+
+def can_equip(entity, item) -> bool:
+    """True if 'entity' (Player/Companion/Pet) may wear 'item'."""
+    player_class = entity.player_class if isinstance(entity, Player) else None
+    group = item_group(item, player_class)
+    return group == "any" or (group is not None and group == entity_group(entity))
+
+
+def equip_party(party, inventory, player_class) -> list:
+    """
+    Give every entity in 'party' the best gear from 'inventory' and each
+    other's slots; unused gear goes back into the inventory. Returns events.
+    """
+    members = {g: [] for g in GROUPS}
+    for e in party:
+        group = entity_group(e)
+        if group is not None:
+            members[group].append(e)
+        members["any"].append(e)
+
+    logs = []
+    for slot, stat in SLOTS:
+        attr = "equipped_" + slot
+        # (-value, 0 = worn / 1 = inventory, position, item, wearer, handle);
+        # worn gear sorts first among equals so it is not swapped for a twin
+        candidates = []
+        worn = {}  # id(entity) -> its candidate
+        for i, e in enumerate(party):
+            it = getattr(e, attr)
+            if it:
+                worn[id(e)] = (-it.get(stat, 0), 0, i, it, e, None)
+                candidates.append(worn[id(e)])
+        candidates.extend(_inventory_candidates(inventory, slot, stat, len(party)))
+        candidates.sort(key=lambda c: c[:3])
+
+        taken = {g: [] for g in GROUPS}
+        room = len(party)
+        for cand in candidates:
+            if not room:
+                break
+            group = item_group(cand[3], player_class)
+            if group is None or len(taken[group]) >= len(members[group]):
+                continue
+            taken[group].append(cand)
+            room -= 1
+
+        new = {}  # id(entity) -> candidate
+        for group in GROUPS:
+            free = [e for e in members[group] if id(e) not in new]
+            _deal(taken[group], free, new)
+
+        # Apply: pull the picked items out of the inventory, then return
+        # whatever was worn and not picked
+        picked = set()
+        for group in GROUPS:
+            for cand in taken[group]:
+                picked.add(id(cand))
+                if cand[5] is not None:
+                    inventory.remove(cand[5])
+        for e in party:
+            old = getattr(e, attr)
+            cand = new.get(id(e))
+            if cand is not None and cand[4] is e:
+                continue  # keeps its own item
+            if old and id(worn[id(e)]) not in picked:
+                inventory.add(old)
+            if cand is not None:
+                setattr(e, attr, cand[3])
+                logs.append(ItemEquipped(e.name, slot, cand[3]["name"]))
+            elif old:
+                setattr(e, attr, None)
+                logs.append(ItemUnequipped(e.name, slot, old["name"]))
+    return logs
+
+
+def _inventory_candidates(inventory, slot, stat, limit):
+    """
+    Candidate tuples for the inventory's 'slot' items. Items are mostly
+    shared templates, so the bucket is grouped by item first; no more than
+    'limit' (the party size) copies of one item can ever be picked.
+    """
+    copies = {}  # id(item) -> [item, (position, handle), ...]
+    for pos, (handle, it) in enumerate(inventory.bucket(slot).items()):
+        entry = copies.get(id(it))
+        if entry is None:
+            entry = copies[id(it)] = [it]
+        elif len(entry) > limit:
+            continue
+        for _ in range(min(inventory.quantity(handle), limit + 1 - len(entry))):
+            entry.append((pos, handle))
+    return [(-entry[0].get(stat, 0), 1, p, entry[0], None, h)
+            for entry in copies.values() for p, h in entry[1:]]
+
+
+def _deal(cands, free, new):
+    """Hand 'cands' (best first) to 'free' entities: wearers keep theirs, the rest in order."""
+    free_ids = {id(e) for e in free}
+    rest = []
+    for cand in cands:
+        wearer = cand[4]
+        if wearer is not None and id(wearer) in free_ids and id(wearer) not in new:
+            new[id(wearer)] = cand
+        else:
+            rest.append(cand)
+    others = [e for e in free if id(e) not in new]
+    for cand, e in zip(rest, others):
+        new[id(e)] = cand
@@ -0,0 +1,211 @@
+# game/events.py
+"""
+Typed game events and the sinks that consume them.
+
+Game methods return lists of event records instead of finished strings.
+An event only keeps the raw values (names, amounts, HP, ...); it becomes a
+coloured line when str() is called on it, which is what a sink does when it
+consumes it. A run whose output nobody reads (NullSink) never formats
+anything, and a JsonLinesSink writes the raw fields without any ANSI codes.
+
+    sink = TerminalSink()
+    sink.write(game.normal_battle())
+    sink.flush()
+"""
+import json
+import sys
+from collections import namedtuple
+
+from .data import colored_text, COLOR_RED, COLOR_GREEN, COLOR_YELLOW
+
+
+def event_type(name, fields, template, color=None):
+    """
+    Define an event record: a namedtuple whose str() renders 'template' -
+    a str.format pattern over the fields, or a function(event) -> str - in
+    'color'.
+    """
+    if isinstance(template, str):
+        render = lambda ev: template.format(**ev._asdict())
+    else:
+        render = template
+
+    def __str__(self):
+        text = render(self)
+        return colored_text(text, color) if color else text
+
+    return type(name, (namedtuple(name, fields),), {"__slots__": (), "__str__": __str__})
+
+
+def _damage_text(ev):
+    if ev.source == "player":
+        return f"Damage dealt: {ev.amount} (Enemy HP: {ev.target_hp})"
+    if ev.source == "skill":
+        return f"It dealt {ev.amount} damage. (Enemy HP: {ev.target_hp})"
+    if ev.source == "enemy":
+        return f"{ev.attacker} hits {ev.target} for {ev.amount}! (HP: {ev.target_hp})"
+    return f"{ev.attacker} dealt {ev.amount} (Enemy HP: {ev.target_hp})"
+
+
+def _damage_color(ev):
+    return COLOR_RED if ev.source in ("player", "enemy") else None
+
+
+def _super_effective_text(ev):
+    if ev.attacker is None:
+        return "It's super effective!"
+    if ev.target_type is None:
+        return f"{ev.attacker}'s attack is super effective!"
+    return f"{ev.attacker}'s attack is super effective vs {ev.target_type}!"
+
+
+def _loot_text(ev):
+    if ev.source is None:
+        return f"{ev.looter} looted {ev.amount} gold."
+    return f"{ev.looter} looted {ev.amount} gold from {ev.source}!"
+
+
+def _level_up_text(ev):
+    gained = f"{ev.levels} levels" if ev.levels > 1 else "a level"
+    stats = ", ".join(f"{stat} +{v}" for stat, v in ev.gains.items())
+    return f"{ev.name}{ev.label} gained {gained} and is now level {ev.level}! ({stats})"
+
+
+def _item_used_text(ev):
+    if ev.heal_from is not None:
+        return f"You used {ev.item} and healed from {ev.heal_from} to {ev.heal_to} HP!"
+    if ev.equipped:
+        return f"You equipped {ev.item} and gained its effect: {ev.effect}!"
+    return f"You used {ev.item} and activated its effect: {ev.effect}!"
+
+
+class Message(namedtuple("Message", ["text", "color"])):
+    """Free-form line (menus, listings, refusals) with an optional colour."""
+    __slots__ = ()
+
+    def __new__(cls, text, color=None):
+        return super().__new__(cls, text, color)
+
+    def __str__(self):
+        return colored_text(self.text, self.color) if self.color else self.text
+
+
+TurnStarted = event_type("TurnStarted", ["turn"], "\n===== Turn {turn} =====", COLOR_YELLOW)
+RandomEvent = event_type("RandomEvent", ["trigger", "text"], "{text}", COLOR_GREEN)
+TierUnlocked = event_type("TierUnlocked", ["tier"], "*** Tier {tier} Items Unlocked! ***", COLOR_YELLOW)
+Travelled = event_type("Travelled", ["area"], "You travel to the {area}!")
+
+Attack = event_type("Attack", ["attacker", "target"], "{attacker} attacks {target}!", COLOR_YELLOW)
+SkillUsed = event_type("SkillUsed", ["user", "skill", "target"], "{user} uses {skill} on {target}!", COLOR_YELLOW)
+SuperEffective = event_type("SuperEffective", ["attacker", "target_type"], _super_effective_text, COLOR_RED)
+
+
+class DamageDealt(namedtuple("DamageDealt", ["attacker", "target", "amount", "target_hp", "source"])):
+    """One hit. source is "player", "ally", "enemy" or "skill"."""
+    __slots__ = ()
+
+    def __str__(self):
+        color = _damage_color(self)
+        text = _damage_text(self)
+        return colored_text(text, color) if color else text
+
+
+UnitFell = event_type("UnitFell", ["name"], "{name} has fallen!", COLOR_RED)
+EnemyDefeated = event_type("EnemyDefeated", ["name"], "You defeated {name}!")
+WaveCleared = event_type("WaveCleared", [], "All enemies are defeated!", COLOR_GREEN)
+PlayerDefeated = event_type("PlayerDefeated", [], "You have been defeated!", COLOR_RED)
+GoldLooted = event_type("GoldLooted", ["looter", "amount", "source"], _loot_text, COLOR_YELLOW)
+SiegeStarted = event_type("SiegeStarted", ["size"], "A siege wave of {size} enemies attacks!", COLOR_RED)
+SiegeResult = event_type(
+    "SiegeResult", ["rounds", "killed", "size", "dealt", "taken"],
+    "Rounds: {rounds}, enemies slain: {killed}/{size}, damage dealt: {dealt}, damage taken: {taken}",
+)
+SiegeBroken = event_type("SiegeBroken", [], "The siege is broken!", COLOR_GREEN)
+
+LevelUp = event_type("LevelUp", ["name", "label", "levels", "level", "gains"], _level_up_text, COLOR_GREEN)
+TalentLearned = event_type("TalentLearned", ["name", "talent"], "{name} gained the talent: {talent}", COLOR_YELLOW)
+PetEvolved = event_type("PetEvolved", ["old_name", "new_name"], "{old_name} evolved into {new_name}!", COLOR_RED)
+StatusApplied = event_type(
+    "StatusApplied", ["target", "effect", "duration"],
+    "{target} is affected by {effect} ({duration} turns).",
+)
+
+ItemBought = event_type("ItemBought", ["item", "cost"], "You bought {item}!", COLOR_GREEN)
+ItemSold = event_type("ItemSold", ["item", "price"], "Sold {item} for {price} gold!", COLOR_GREEN)
+ItemReceived = event_type("ItemReceived", ["item"], "You received {item}!")
+LootDropped = event_type(
+    "LootDropped", ["source", "item", "count"],
+    lambda ev: f"{ev.source} dropped {ev.item}!" if ev.count == 1 else f"{ev.source} dropped {ev.count}x {ev.item}!",
+    COLOR_YELLOW,
+)
+ItemEquipped = event_type("ItemEquipped", ["who", "slot", "item"], "{who} auto-equipped {slot}: {item}")
+ItemUnequipped = event_type("ItemUnequipped", ["who", "slot", "item"], "{who} took off {slot}: {item}")
+ItemUsed = event_type(
+    "ItemUsed", ["item", "effect", "equipped", "heal_from", "heal_to"], _item_used_text, COLOR_GREEN,
+)
+ItemCrafted = event_type(
+    "ItemCrafted", ["item", "count"],
+    lambda ev: f"You crafted {ev.item}!" if ev.count == 1 else f"You crafted {ev.count}x {ev.item}!",
+    COLOR_GREEN,
+)
+Hired = event_type("Hired", ["name", "role", "cost"], "You hired {name} the {role}!", COLOR_GREEN)
+GameSaved = event_type("GameSaved", ["filename"], "Game saved to {filename}!", COLOR_GREEN)
+GameLoaded = event_type("GameLoaded", ["filename"], "Game loaded from {filename}!", COLOR_GREEN)
+
+
+def event_record(ev) -> dict:
+    """Plain-data form of an event: its type name plus its fields."""
+    record = {"event": type(ev).__name__}
+    record.update(ev._asdict())
+    return record
+
+
+########################################
+#   Sinks
+########################################
+
+class NullSink:
+    """Drops every event unformatted (benchmarks, headless runs)."""
+
+    def write(self, events):
+        pass
+
+    def flush(self):
+        pass
+
+
+class TerminalSink:
+    """
+    Formats events and writes them to 'stream' (stdout by default) in
+    batches of 'buffer_lines', so a busy battle is one write, not one per line.
+    """
+
+    def __init__(self, stream=None, buffer_lines=64):
+        self.stream = stream if stream is not None else sys.stdout
+        self.buffer_lines = buffer_lines
+        self._lines = []
+
+    def write(self, events):
+        self._lines.extend(map(str, events))
+        if len(self._lines) >= self.buffer_lines:
+            self.flush()
+
+    def flush(self):
+        if self._lines:
+            self.stream.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+        self.stream.flush()
+
+
+class JsonLinesSink:
+    """Writes one JSON object per event (see event_record) to 'stream'."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, events):
+        dumps = json.dumps
+        self.stream.write("".join(dumps(event_record(ev)) + "\n" for ev in events))
+
+    def flush(self):
+        self.stream.flush()
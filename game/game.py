@@ -2,57 +2,119 @@
 
 import random
 import json
+import math
 import os
+from collections import namedtuple
 
 # Import global data
 from .data import (
-    colored_text, USE_TABULATE, tabulate,
+    USE_TABULATE, tabulate,
     COLOR_RED, COLOR_GREEN, COLOR_YELLOW, COLOR_BLUE,
-    AREA_DATA, RANDOM_EVENTS, SHOP_TIERS, CRAFTING_RECIPES, TYPE_WEAKNESSES,
+    AREA_DATA, RANDOM_EVENTS, RANDOM_EVENT_CHANCE, CRAFTING_RECIPES,
+    SECRET_POTION,
 )
+from .items import item_ref, item_from_ref, is_stackable
+from .catalog import CATALOG
+from .equip import equip_party, can_equip
 from .player import Player
 from .enemy import Enemy
 from .companion import Companion
 from .pet import Pet
+from .effect_manager import StatusEffectManager
+from .mass_battle import MassBattle
+from .initiative import InitiativeBattle
+from .events import (
+    Message, TurnStarted, RandomEvent, TierUnlocked, Travelled,
+    Attack, SkillUsed, SuperEffective, DamageDealt, UnitFell, EnemyDefeated,
+    WaveCleared, PlayerDefeated, GoldLooted, SiegeStarted, SiegeResult, SiegeBroken,
+    StatusApplied, ItemBought, ItemSold, ItemReceived, ItemUsed,
+    ItemCrafted, Hired, GameSaved, GameLoaded, LootDropped,
+)
+from .progression import level_up_logs, grant_xp
+from .decisions import TerminalDecisions, ScriptedDecisions
+from . import combat, crafting, loot
+
+# Every relic a traveler can hand out
+RELICS = CATALOG.by_type.get("relic", ())
+
+# Entries per page of list_player_inventory(page)
+INVENTORY_PAGE_SIZE = 20
+
+# log(P(no event on a turn)), for drawing the gap to the next random event
+_LOG_QUIET = math.log(1 - RANDOM_EVENT_CHANCE)
+
+# Result of Game.fast_forward: turns advanced, {trigger: count} of random
+# events, tiers unlocked, net HP change and whether the player survived.
+FastForwardSummary = namedtuple("FastForwardSummary", ["turns", "events", "tiers", "hp_change", "alive"])
+
+
+def rng_state_to_json(state) -> list:
+    """random.Random.getstate() as nested lists (JSON has no tuples)."""
+    version, internal, gauss_next = state
+    return [version, list(internal), gauss_next]
+
+
+def rng_state_from_json(data) -> tuple:
+    version, internal, gauss_next = data
+    return (version, tuple(internal), gauss_next)
+
+
+def new_seed() -> int:
+    """A fresh seed from the OS, independent of the global random module."""
+    return int.from_bytes(os.urandom(8), "big")
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed: int = None, decisions=None):
+        # Every random draw of this session comes from self.rng, so two
+        # sessions never interfere and a seed reproduces a whole run.
+        self.seed = new_seed() if seed is None else seed
+        self.rng = random.Random(self.seed)
+        # Answers the player's choices (talent picks); see decisions.py
+        self.decisions = decisions if decisions is not None else TerminalDecisions()
+
         # Game state
         self.turn = 1
         self.player = None
         self.current_tier = 1
-        self.shop_inventory = SHOP_TIERS[1][:]
+        self.shop_inventory = list(CATALOG.by_tier[1])
         self.current_area = "Forest"
         self.current_enemies = []
+        self.effects = StatusEffectManager()
         self.running = False  # track if the game is "active"
 
     # ------------------------------------------------------------------
     # 1) GAME START & MAIN LOOP-LIKE FUNCTIONS
     # ------------------------------------------------------------------
 
-    def start_new_game(self, name: str, class_key: str) -> list[str]:
+    def start_new_game(self, name: str, class_key: str, seed: int = None) -> list:
         """
         Creates a new game with the given player name and class_key (e.g. '1' => 'Warrior').
+        Pass 'seed' to restart the session's RNG from a known seed.
         Returns a list of log messages about what happened.
         """
         logs = []
         class_map = {"1": "Warrior", "2": "Mage", "3": "Thief", "4": "Cleric"}
         if class_key not in class_map:
-            logs.append("Invalid class key. Cannot start new game.")
+            logs.append(Message("Invalid class key. Cannot start new game."))
             return logs
 
         chosen_class = class_map[class_key]
+        if seed is not None:
+            self.seed = seed
+            self.rng.seed(seed)
         self.player = Player(name, chosen_class)
         self.turn = 1
         self.current_tier = 1
-        self.shop_inventory = SHOP_TIERS[1][:]
+        self.shop_inventory = list(CATALOG.by_tier[1])
         self.current_area = "Forest"
+        self.current_enemies = []
+        self.effects = StatusEffectManager()
         self.running = True
 
-        logs.append(colored_text(f"New Game Started!", COLOR_GREEN))
-        logs.append(colored_text(f"Welcome, {name} the {chosen_class}!", COLOR_GREEN))
-        logs.append("Type 'help' to see a list of commands.")
+        logs.append(Message(f"New Game Started!", COLOR_GREEN))
+        logs.append(Message(f"Welcome, {name} the {chosen_class}!", COLOR_GREEN))
+        logs.append(Message("Type 'help' to see a list of commands."))
         return logs
 
     def is_game_over(self) -> bool:
@@ -63,7 +125,7 @@ class Game:
             return True
         return not self.player.is_alive()
 
-    def next_turn(self) -> list[str]:
+    def next_turn(self) -> list:
         """
         Called each time we move to the next turn.  
         Returns log messages (like a turn header, random event, etc.).
@@ -71,10 +133,10 @@ class Game:
         logs = []
         if not self.player or not self.player.is_alive():
             self.running = False
-            logs.append(colored_text("Game Over (player is dead or missing).", COLOR_RED))
+            logs.append(Message("Game Over (player is dead or missing).", COLOR_RED))
             return logs
 
-        logs.append(colored_text(f"\n===== Turn {self.turn} =====", COLOR_YELLOW))
+        logs.append(TurnStarted(self.turn))
         logs.extend(self.random_event_check())
         self.turn += 1
 
@@ -82,19 +144,72 @@ class Game:
         logs.extend(self.check_for_new_tier())
         return logs
 
+    def fast_forward(self, n: int) -> FastForwardSummary:
+        """
+        Advance up to 'n' turns without building per-turn logs. Quiet turns
+        are skipped in one step: the gap to the next random event is drawn
+        geometrically (same odds as rolling RANDOM_EVENT_CHANCE every turn)
+        and the next tier unlock turn is known in advance. Stops early if
+        the player dies.
+        """
+        if not self.player or not self.player.is_alive():
+            self.running = False
+            return FastForwardSummary(0, {}, [], 0, False)
+
+        player = self.player
+        hp_before = player.hp
+        events = {}
+        tiers = []
+        start = t = self.turn
+        end = start + n
+        rand = self.rng.random
+        next_event = t + int(math.log(1.0 - rand()) / _LOG_QUIET)
+
+        while True:
+            # next_turn on turn t unlocks a tier once t + 1 reaches 10 * tier
+            if self.current_tier + 1 in CATALOG.by_tier:
+                unlock_at = 10 * self.current_tier - 1
+            else:
+                unlock_at = end
+            t = max(t, min(next_event, unlock_at))
+            if t >= end:
+                t = end
+                break
+
+            if t == next_event:
+                event = self.rng.choice(RANDOM_EVENTS)
+                trigger = event["trigger"]
+                events[trigger] = events.get(trigger, 0) + 1
+                if hasattr(self, trigger):
+                    getattr(self, trigger)()
+                next_event = t + 1 + int(math.log(1.0 - rand()) / _LOG_QUIET)
+
+            t += 1
+            self.turn = t
+            if t >= 10 * self.current_tier and self.current_tier + 1 in CATALOG.by_tier:
+                self.current_tier += 1
+                self.shop_inventory = list(CATALOG.by_tier[self.current_tier])
+                tiers.append(self.current_tier)
+            if player.hp <= 0:
+                self.running = False
+                break
+
+        self.turn = t
+        return FastForwardSummary(t - start, events, tiers, player.hp - hp_before, player.is_alive())
+
     # ------------------------------------------------------------------
     # 2) RANDOM EVENTS
     # ------------------------------------------------------------------
 
-    def random_event_check(self) -> list[str]:
+    def random_event_check(self) -> list:
         """
         30% chance of a random event. Returns logs describing the event.
         """
         logs = []
-        if random.random() < 0.3:
-            event = random.choice(RANDOM_EVENTS)
-            logs.append(colored_text(event["text"], COLOR_GREEN))
+        if self.rng.random() < RANDOM_EVENT_CHANCE:
+            event = self.rng.choice(RANDOM_EVENTS)
             trigger = event["trigger"]
+            logs.append(RandomEvent(trigger, event["text"]))
             if hasattr(self, trigger):
                 # e.g. 'special_merchant', 'hidden_trap', 'gain_random_relic'
                 # Each of these can be a method returning logs
@@ -102,125 +217,162 @@ class Game:
                 logs.extend(method())
         return logs
 
-    def special_merchant(self) -> list[str]:
+    def special_merchant(self) -> list:
         """
         The merchant appears offering a secret potion for 30 gold.
         Returns logs. The actual yes/no choice is handled by a separate method:
         `merchant_buy_secret_potion()`.
         """
         logs = []
-        logs.append("A special merchant appears, offering a secret potion for 30 gold.")
-        logs.append("Use 'merchant_buy_secret_potion()' to buy or ignore otherwise.")
+        logs.append(Message("A special merchant appears, offering a secret potion for 30 gold."))
+        logs.append(Message("Use 'merchant_buy_secret_potion()' to buy or ignore otherwise."))
         return logs
 
-    def merchant_buy_secret_potion(self) -> list[str]:
+    def merchant_buy_secret_potion(self) -> list:
         """
         If the player decides to buy the secret potion from the merchant.
         """
         logs = []
         if self.player.gold >= 30:
             self.player.gold -= 30
-            item = {
-                "name": "Secret Potion",
-                "type": "potion",
-                "cost": 0,
-                "heal": 150,
-                "rarity": "Rare"
-            }
-            self.player.inventory.append(item)
-            logs.append("You bought the secret potion!")
+            self.player.inventory.add(SECRET_POTION)
+            logs.append(Message("You bought the secret potion!"))
         else:
-            logs.append("Not enough gold to buy the secret potion.")
+            logs.append(Message("Not enough gold to buy the secret potion."))
         return logs
 
-    def hidden_trap(self) -> list[str]:
+    def hidden_trap(self) -> list:
         """
         The player steps into a hidden trap, losing 10 HP.
         """
         logs = []
-        logs.append("A hidden trap triggers! You lose 10 HP.")
+        logs.append(Message("A hidden trap triggers! You lose 10 HP."))
         self.player.hp -= 10
         if self.player.hp <= 0:
-            logs.append("The trap proved fatal!")
+            logs.append(Message("The trap proved fatal!"))
             self.running = False
         return logs
 
-    def gain_random_relic(self) -> list[str]:
+    def gain_random_relic(self) -> list:
         """
         The player gains a random relic from a traveler.
         """
         logs = []
-        all_relics = []
-        for tier_list in SHOP_TIERS.values():
-            for it in tier_list:
-                if it["type"] == "relic":
-                    all_relics.append(it)
-        if all_relics:
-            relic = random.choice(all_relics).copy()
-            self.player.inventory.append(relic)
-            logs.append(f"You received {relic['name']}!")
+        if RELICS:
+            relic = self.rng.choice(RELICS)
+            self.player.inventory.add(relic)
+            logs.append(ItemReceived(relic["name"]))
         else:
-            logs.append("No relic found (strange...).")
+            logs.append(Message("No relic found (strange...)."))
         return logs
 
     # ------------------------------------------------------------------
     # 3) AREA / TRAVEL
     # ------------------------------------------------------------------
 
-    def show_area_info(self) -> list[str]:
+    def show_area_info(self) -> list:
         """
         Returns a list of areas and the current area.
         """
         logs = []
-        logs.append("Areas you can travel to:")
+        logs.append(Message("Areas you can travel to:"))
         for area in AREA_DATA.keys():
-            logs.append(f" - {area}")
-        logs.append(f"Currently in: {self.current_area}")
+            logs.append(Message(f" - {area}"))
+        logs.append(Message(f"Currently in: {self.current_area}"))
         return logs
 
-    def travel_to_area(self, area_name: str) -> list[str]:
+    def travel_to_area(self, area_name: str) -> list:
         """
         Tries to move the player to another area. Returns logs.
         """
         logs = []
         if area_name in AREA_DATA:
             self.current_area = area_name
-            logs.append(f"You travel to the {area_name}!")
+            logs.append(Travelled(area_name))
         else:
-            logs.append(f"'{area_name}' is not a valid area.")
+            logs.append(Message(f"'{area_name}' is not a valid area."))
         return logs
 
     # ------------------------------------------------------------------
     # 4) BATTLES
     # ------------------------------------------------------------------
 
-    def normal_battle(self) -> list[str]:
+    def normal_battle(self) -> list:
         """
         Initiates a normal battle (non-boss). Returns logs of the encounter.
         """
         logs = []
         wave = self.get_enemy_wave()
         if not wave:
-            logs.append("No enemies found in this area.")
+            logs.append(Message("No enemies found in this area."))
             return logs
 
-        logs.append("Enemies you face:")
+        logs.append(Message("Enemies you face:"))
         for e in wave:
-            logs.append(f" - {e.name} (HP={e.hp}, ATK={e.attack}, Type={e.damage_type})")
+            logs.append(Message(f" - {e.name} (HP={e.hp}, ATK={e.attack}, Type={e.damage_type})"))
 
         logs.extend(self.battle_enemies(wave))
         return logs
 
-    def special_battle(self) -> list[str]:
+    def special_battle(self) -> list:
         """
         Initiates a boss battle. Returns logs.
         """
         logs = []
-        logs.append(colored_text("A special boss appears!", COLOR_RED))
+        logs.append(Message("A special boss appears!", COLOR_RED))
         boss = Enemy("Boss Monster", self.turn)
         logs.extend(self.battle_enemies([boss]))
         return logs
 
+    def siege_battle(self, size: int = 100) -> list:
+        """
+        Fight a siege wave of 'size' enemies from the current area in
+        mass-battle mode. Only a summary is logged.
+        """
+        logs = []
+        if self.current_area not in AREA_DATA:
+            logs.append(Message("No enemies found in this area."))
+            return logs
+        area_enemies = AREA_DATA[self.current_area]["enemies"]
+        horde = [Enemy(self.rng.choice(area_enemies), self.turn) for _ in range(size)]
+        party = [self.player] + self.player.companions + self.player.pets
+        logs.append(SiegeStarted(size))
+
+        self.set_current_enemies(horde)
+        outcome = MassBattle(party, horde, self.rng, self.effects).run()
+        self.player.gold += outcome.gold
+        killed = sum(1 for e in horde if not e.is_alive())
+        logs.append(SiegeResult(outcome.rounds, killed, size, outcome.damage_dealt, outcome.damage_taken))
+        if outcome.gold:
+            logs.append(GoldLooted("You", outcome.gold, None))
+        logs.extend(self.roll_horde_loot([e for e in horde if not e.is_alive()]))
+        if outcome.winner == combat.WINNER_PARTY:
+            logs.append(SiegeBroken())
+        logs.extend(self.distribute_xp(outcome.xp))
+
+        if not self.player.is_alive():
+            logs.append(PlayerDefeated())
+            self.running = False
+        return logs
+
+    def initiative_battle(self, enemies: list[Enemy] = None) -> combat.BattleOutcome:
+        """
+        Resolve a battle headless with agility-based turn order (faster
+        units act more often; haste/slow effects apply). Gold and item
+        drops go to the player; XP is only reported in the outcome.
+        """
+        if enemies is None:
+            enemies = self.get_enemy_wave()
+        self.set_current_enemies(enemies)
+        standing = [e for e in enemies if e.is_alive()]
+        party = [self.player] + self.player.companions + self.player.pets
+        outcome = InitiativeBattle(party, enemies, self.rng, self.effects).run()
+        self.player.gold += outcome.gold
+        self.roll_horde_loot([e for e in standing if not e.is_alive()])
+        if not self.player.is_alive():
+            self.running = False
+        return outcome
+
     def get_enemy_wave(self) -> list[Enemy]:
         """
         Returns a list of enemies for a normal battle in the current area.
@@ -231,11 +383,11 @@ class Game:
         how_many = 2 if self.turn > 5 else 1
         wave = []
         for _ in range(how_many):
-            chosen_type = random.choice(area_enemies)
+            chosen_type = self.rng.choice(area_enemies)
             wave.append(Enemy(chosen_type, self.turn))
         return wave
 
-    def battle_enemies(self, enemies: list[Enemy]) -> list[str]:
+    def battle_enemies(self, enemies: list[Enemy]) -> list:
         """
         Simulate a single 'round' of battle with the given enemies.
         If you want turn-by-turn, you'd call separate methods like
@@ -243,93 +395,129 @@ class Game:
         For now, let's do a simplified single-round example.
         """
         logs = []
-        self.current_enemies = enemies
+        self.set_current_enemies(enemies)
 
-        # Process existing status effects
-        self.player.process_status_effects()
-        for c in self.player.companions:
-            c.process_status_effects()
-        for p in self.player.pets:
-            p.process_status_effects()
-        for e in enemies:
-            e.process_status_effects()
+        # Process existing status effects, one aggregated line per effect type
+        logs.extend(self.effects.advance())
 
         # Quick example: Player party attacks the first alive enemy, 
         # then enemies attack back
         alive_list = [e for e in enemies if e.is_alive()]
         if not alive_list:
-            logs.append("No alive enemies left.")
+            logs.append(Message("No alive enemies left."))
             return logs
 
         target = alive_list[0]
         logs.extend(self.party_attack(target))
         if not target.is_alive():
-            logs.append(f"You defeated {target.name}!")
-            target.on_defeated(self.player)
-            self.distribute_xp(20)
+            logs.append(EnemyDefeated(target.name))
+            logs.append(target.on_defeated(self.player))
+            logs.extend(self.roll_loot(target))
+            logs.extend(self.distribute_xp(20))
 
         # Let enemies retaliate if they're still alive
         if any(e.is_alive() for e in enemies):
             logs.extend(self.enemies_attack(enemies))
             # Check if any remain
             if not any(e.is_alive() for e in enemies):
-                logs.append(colored_text("All enemies are defeated!", COLOR_GREEN))
-                self.distribute_xp(50)
+                logs.append(WaveCleared())
+                logs.extend(self.distribute_xp(50))
         else:
             # If the target died and there are no more alive
             if not any(e.is_alive() for e in enemies):
-                logs.append(colored_text("All enemies are defeated!", COLOR_GREEN))
-                self.distribute_xp(50)
+                logs.append(WaveCleared())
+                logs.extend(self.distribute_xp(50))
 
         # Check if player died
         if not self.player.is_alive():
-            logs.append(colored_text("You have been defeated!", COLOR_RED))
+            logs.append(PlayerDefeated())
             self.running = False
 
         return logs
 
-    def party_attack(self, enemy: Enemy) -> list[str]:
+    def set_current_enemies(self, enemies: list[Enemy]):
+        """
+        Make 'enemies' the ones being fought. Status effects on enemies that
+        are no longer among them are dropped from self.effects.
+        """
+        if enemies is self.current_enemies:
+            return
+        staying = {id(e) for e in enemies}
+        for e in self.current_enemies:
+            if id(e) not in staying:
+                self.effects.clear(e)
+        self.current_enemies = enemies
+
+    def roll_loot(self, enemy: Enemy) -> list:
+        """
+        Roll the item drop of a defeated enemy (see loot.py); a drop goes
+        into the player's inventory. Returns logs.
+        """
+        table = loot.loot_table(self.current_area, enemy.name, self.current_tier)
+        item = table.sample(self.rng)
+        if item is None:
+            return []
+        self.player.inventory.add(item)
+        return [LootDropped(enemy.name, item["name"], 1)]
+
+    def roll_horde_loot(self, fallen: list[Enemy]) -> list:
+        """
+        Roll the drops of many defeated enemies at once, one batch per
+        enemy type. Returns one log per item kind.
+        """
+        by_type = {}
+        for e in fallen:
+            by_type[e.name] = by_type.get(e.name, 0) + 1
+        found = {}
+        for enemy_type, count in by_type.items():
+            table = loot.loot_table(self.current_area, enemy_type, self.current_tier)
+            for item in table.sample_many(self.rng, count):
+                if item is not None:
+                    self.player.inventory.add(item)
+                    found[item["name"]] = found.get(item["name"], 0) + 1
+        return [LootDropped("The horde", name, count) for name, count in found.items()]
+
+    def party_attack(self, enemy: Enemy) -> list:
         logs = []
-        if self.player.is_alive() and enemy.is_alive():
+        blocked = self.effects.blocked  # stunned this turn
+        if self.player.is_alive() and enemy.is_alive() and self.player.eid not in blocked:
             dmg = self.calculate_damage(self.player)
-            logs.append(colored_text(f"{self.player.name} attacks {enemy.name}!", COLOR_YELLOW))
-            if TYPE_WEAKNESSES.get(enemy.damage_type) == self.player.damage_type:
+            logs.append(Attack(self.player.name, enemy.name))
+            if self.player.combat_stats.attack_row.get(enemy.damage_type, 1) == 2:
                 dmg *= 2
-                logs.append(colored_text("It's super effective!", COLOR_RED))
+                logs.append(SuperEffective(None, None))
             enemy.take_damage(dmg)
-            logs.append(colored_text(f"Damage dealt: {dmg} (Enemy HP: {enemy.hp})", COLOR_RED))
+            logs.append(DamageDealt(self.player.name, enemy.name, dmg, enemy.hp, "player"))
 
         # Companions
         for c in self.player.companions:
-            if c.is_alive() and enemy.is_alive():
-                base = c.strength + random.randint(0,3)
-                if c.equipped_weapon:
-                    base += c.equipped_weapon.get("damage",0)//2
-                dmg = base
-                if TYPE_WEAKNESSES.get(enemy.damage_type) == c.damage_type:
+            if c.is_alive() and enemy.is_alive() and c.eid not in blocked:
+                cs = c.combat_stats
+                dmg = cs.attack + self.rng.randint(0,3)
+                if cs.attack_row.get(enemy.damage_type, 1) == 2:
                     dmg *= 2
-                    logs.append(colored_text(f"{c.name}'s attack is super effective!", COLOR_RED))
+                    logs.append(SuperEffective(c.name, None))
                 enemy.take_damage(dmg)
-                logs.append(f"{c.name} dealt {dmg} (Enemy HP: {enemy.hp})")
+                logs.append(DamageDealt(c.name, enemy.name, dmg, enemy.hp, "ally"))
 
         # Pets
         for p in self.player.pets:
-            if p.is_alive() and enemy.is_alive():
-                dmg = p.damage
-                if p.equipped_weapon:
-                    dmg += p.equipped_weapon.get("damage",0)//2
-                if TYPE_WEAKNESSES.get(enemy.damage_type) == p.damage_type:
+            if p.is_alive() and enemy.is_alive() and p.eid not in blocked:
+                cs = p.combat_stats
+                dmg = cs.attack
+                if cs.attack_row.get(enemy.damage_type, 1) == 2:
                     dmg *= 2
-                    logs.append(colored_text(f"{p.name}'s attack is super effective!", COLOR_RED))
+                    logs.append(SuperEffective(p.name, None))
                 enemy.take_damage(dmg)
-                logs.append(f"{p.name} dealt {dmg} (Enemy HP: {enemy.hp})")
+                logs.append(DamageDealt(p.name, enemy.name, dmg, enemy.hp, "ally"))
 
         return logs
 
-    def enemies_attack(self, enemies: list[Enemy]) -> list[str]:
+    def enemies_attack(self, enemies: list[Enemy]) -> list:
         logs = []
+        blocked = self.effects.blocked
         for e in enemies:
-            if e.is_alive():
+            if e.is_alive() and e.eid not in blocked:
                 # pick a random living target
                 living_targets = []
                 if self.player.is_alive():
@@ -338,63 +526,106 @@ class Game:
                 living_targets.extend([p for p in self.player.pets if p.is_alive()])
 
                 if not living_targets:
-                    logs.append("All party members have fallen.")
+                    logs.append(Message("All party members have fallen."))
                     self.running = False
                     return logs
 
-                target = random.choice(living_targets)
+                target = self.rng.choice(living_targets)
                 dmg = e.attack
-                t_type = getattr(target, 'damage_type', 'Physical')
-                if TYPE_WEAKNESSES.get(t_type) == e.damage_type:
+                t_type = target.damage_type
+                if target.combat_stats.defense_row.get(e.damage_type, 1) == 2:
                     dmg *= 2
-                    logs.append(colored_text(f"{e.name}'s attack is super effective vs {t_type}!", COLOR_RED))
+                    logs.append(SuperEffective(e.name, t_type))
 
                 target.hp -= dmg
-                logs.append(colored_text(f"{e.name} hits {target.name} for {dmg}! (HP: {target.hp})", COLOR_RED))
+                logs.append(DamageDealt(e.name, target.name, dmg, target.hp, "enemy"))
                 if target.hp <= 0:
-                    logs.append(colored_text(f"{target.name} has fallen!", COLOR_RED))
+                    logs.append(UnitFell(target.name))
         return logs
 
+    def add_status_effect(self, target, effect) -> list:
+        """
+        Put a StatusEffect on a party member or enemy. It is processed at the
+        start of each battle round until it runs out.
+        """
+        self.effects.add(target, effect)
+        return [StatusApplied(target.name, effect.name, effect.duration)]
+
     def calculate_damage(self, entity) -> int:
         """
         Helper to calculate base damage for a Player/Companion/Pet. 
         """
-        base = 5
-        if hasattr(entity, 'stats'):
-            base = entity.stats.get("Strength", 5)
-            if entity.equipped_weapon:
-                base += entity.equipped_weapon.get("damage", 0)
-        return base
+        return entity.combat_stats.attack
 
-    def distribute_xp(self, amount: int) -> None:
+    def simulate_battle(self, enemies: list[Enemy] = None) -> combat.BattleOutcome:
+        """
+        Resolve a whole battle headless (no logs, no prints) against 'enemies'
+        or a fresh wave from the current area. Gold and item drops go to the
+        player; XP is only reported in the outcome.
         """
-        Distribute XP to player, companions, and pets.
+        if enemies is None:
+            enemies = self.get_enemy_wave()
+        self.set_current_enemies(enemies)
+        standing = [e for e in enemies if e.is_alive()]
+        outcome = combat.resolve_battle(self.player, enemies, self.rng, effects=self.effects)
+        self.player.gold += outcome.gold
+        self.roll_horde_loot([e for e in standing if not e.is_alive()])
+        if not self.player.is_alive():
+            self.running = False
+        return outcome
+
+    def distribute_xp(self, amount: int, pick_talents: bool = True) -> list:
         """
+        Distribute XP to player, companions, and pets. Any number of
+        level-ups is applied at once; returns one log line per member that
+        leveled. Talent picks go to self.decisions; with pick_talents=False
+        (or a deferred provider) they are banked instead.
+        """
+        logs = []
         if not self.player:
-            return
-        self.player.gain_xp(amount)
-        for c in self.player.companions:
-            if c.is_alive():
-                c.gain_xp(amount)
-        for p in self.player.pets:
-            if p.is_alive():
-                p.gain_xp(amount)
+            return logs
+        logs.extend(level_up_logs(self.player.gain_xp(amount, pick_talents, self.decisions)))
+        for summary in grant_xp([c for c in self.player.companions if c.is_alive()], amount):
+            logs.extend(level_up_logs(summary, " (Companion)"))
+        for summary in grant_xp([p for p in self.player.pets if p.is_alive()], amount):
+            logs.extend(level_up_logs(summary, " (Pet)"))
+        return logs
+
+    def spend_talent_points(self) -> list:
+        """Ask self.decisions for a talent for every banked talent point."""
+        logs = []
+        while self.player and self.player.talent_points > 0:
+            self.player.talent_points -= 1
+            learned = self.player.pick_talent(self.decisions)
+            if learned:
+                logs.append(learned)
+        return logs
+
+    async def aspend_talent_points(self) -> list:
+        """spend_talent_points for async providers (see decisions.AsyncDecisions)."""
+        logs = []
+        while self.player and self.player.talent_points > 0:
+            self.player.talent_points -= 1
+            learned = await self.player.apick_talent(self.decisions)
+            if learned:
+                logs.append(learned)
+        return logs
 
     # ------------------------------------------------------------------
     # 5) SKILLS
     # ------------------------------------------------------------------
 
-    def use_skill(self, skill_index: int) -> list[str]:
+    def use_skill(self, skill_index: int) -> list:
         """
         Use one of the player's skills by index.
         Returns logs describing the outcome.
         """
         logs = []
         if not self.player or not self.player.skills:
-            logs.append("You have no skills to use!")
+            logs.append(Message("You have no skills to use!"))
             return logs
         if skill_index < 0 or skill_index >= len(self.player.skills):
-            logs.append("Invalid skill index.")
+            logs.append(Message("Invalid skill index."))
             return logs
 
         from .data import SKILLS
@@ -402,7 +633,7 @@ class Game:
         skill_data = SKILLS[skill_name]
 
         if self.player.mana < skill_data["mana_cost"]:
-            logs.append("Not enough mana!")
+            logs.append(Message("Not enough mana!"))
             return logs
 
         self.player.mana -= skill_data["mana_cost"]
@@ -410,7 +641,7 @@ class Game:
         # Must have enemies to use skill on
         alive_enemies = [e for e in self.current_enemies if e.is_alive()]
         if not alive_enemies:
-            logs.append("No enemies available!")
+            logs.append(Message("No enemies available!"))
             return logs
 
         # Attack the first enemy, or let the UI pass an enemy index, etc.
@@ -418,14 +649,15 @@ class Game:
         dmg = self.calculate_damage(self.player)
         dmg = int(dmg * skill_data["damage_multiplier"])
 
-        logs.append(colored_text(f"{self.player.name} uses {skill_name} on {target.name}!", COLOR_YELLOW))
+        logs.append(SkillUsed(self.player.name, skill_name, target.name))
         target.take_damage(dmg)
-        logs.append(f"It dealt {dmg} damage. (Enemy HP: {target.hp})")
+        logs.append(DamageDealt(self.player.name, target.name, dmg, target.hp, "skill"))
 
         if not target.is_alive():
-            logs.append(colored_text(f"{target.name} was defeated!", COLOR_GREEN))
-            target.on_defeated(self.player)
-            self.distribute_xp(20)
+            logs.append(EnemyDefeated(target.name))
+            logs.append(target.on_defeated(self.player))
+            logs.extend(self.roll_loot(target))
+            logs.extend(self.distribute_xp(20))
 
         return logs
 
@@ -435,208 +667,152 @@ class Game:
 
     def can_equip(self, entity, item: dict) -> bool:
         """
-        Checks if the given entity (Player/Companion/Pet) can equip this item.
-        """
-        if item.get("pet_only", False) and not isinstance(entity, Pet):
-            return False
-        if item.get("companion_only", False) and not isinstance(entity, Companion):
-            return False
-        if "class_req" in item:
-            # If entity is a Player
-            if isinstance(entity, Player):
-                if entity.player_class not in item["class_req"]:
-                    return False
-            else:
-                return False
-        return True
+        Checks if the given entity (Player/Companion/Pet) can equip this item
+        (the rules live in equip.py).
+        """
+        return can_equip(entity, item)
 
-    def auto_equip_all(self) -> list[str]:
-        logs = []
-        logs.extend(self.auto_equip_character(self.player))
-        for c in self.player.companions:
-            logs.extend(self.auto_equip_character(c))
-        for p in self.player.pets:
-            logs.extend(self.auto_equip_character(p))
-        return logs
+    def auto_equip_all(self) -> list:
+        """
+        Re-equip the whole party at once (see equip.py): the best gear from
+        the inventory and each other's slots, with events only for changes.
+        """
+        p = self.player
+        return equip_party([p, *p.companions, *p.pets], p.inventory, p.player_class)
 
-    def auto_equip_character(self, entity) -> list[str]:
+    def auto_equip_character(self, entity) -> list:
         """
-        Removes currently equipped items (put back into player inventory),
-        then tries to equip the best weapon/armor/relic from inventory.
+        Equip the best weapon/armor/relic for one entity from the inventory
+        (its current gear competes too and goes back if beaten).
         Returns a list of log messages.
         """
-        logs = []
-        # Move old gear to inventory
-        if entity.equipped_weapon:
-            self.player.inventory.append(entity.equipped_weapon)
-            entity.equipped_weapon = None
-        if entity.equipped_armor:
-            self.player.inventory.append(entity.equipped_armor)
-            entity.equipped_armor = None
-        if entity.equipped_relic:
-            self.player.inventory.append(entity.equipped_relic)
-            entity.equipped_relic = None
-
-        # Best weapon
-        best_wpn = None
-        best_val = -1
-        best_idx = -1
-        for i, it in enumerate(self.player.inventory):
-            if it["type"] == "weapon" and self.can_equip(entity, it):
-                dmg = it.get("damage", 0)
-                if dmg > best_val:
-                    best_val = dmg
-                    best_wpn = it
-                    best_idx = i
-        if best_wpn:
-            entity.equipped_weapon = best_wpn
-            self.player.inventory.pop(best_idx)
-            logs.append(f"{entity.name} auto-equipped weapon: {best_wpn['name']}")
-
-        # Best armor
-        best_arm = None
-        best_val = -1
-        best_idx = -1
-        for i, it in enumerate(self.player.inventory):
-            if it["type"] == "armor" and self.can_equip(entity, it):
-                dfs = it.get("defense", 0)
-                if dfs > best_val:
-                    best_val = dfs
-                    best_arm = it
-                    best_idx = i
-        if best_arm:
-            entity.equipped_armor = best_arm
-            self.player.inventory.pop(best_idx)
-            logs.append(f"{entity.name} auto-equipped armor: {best_arm['name']}")
-
-        # Best relic
-        best_rlc = None
-        best_val = -1
-        best_idx = -1
-        for i, it in enumerate(self.player.inventory):
-            if it["type"] == "relic" and self.can_equip(entity, it):
-                cost_val = it.get("cost", 0)
-                if cost_val > best_val:
-                    best_val = cost_val
-                    best_rlc = it
-                    best_idx = i
-        if best_rlc:
-            entity.equipped_relic = best_rlc
-            self.player.inventory.pop(best_idx)
-            logs.append(f"{entity.name} auto-equipped relic: {best_rlc['name']}")
-
-        return logs
-
-    def use_item(self, item_index: int) -> list[str]:
+        return equip_party([entity], self.player.inventory, self.player.player_class)
+
+    def use_item(self, item_index: int) -> list:
         """
         Use an item in the player's inventory by index (if it's a potion, ring, etc.).
         Returns logs describing what happened.
         """
         logs = []
-        usable_items = [i for i in self.player.inventory if i["type"] in ["potion", "scroll", "ring"]]
+        usable_items = self.player.inventory.of_types(("potion", "scroll", "ring"))
 
         if item_index < 0 or item_index >= len(usable_items):
-            logs.append("Invalid item choice.")
+            logs.append(Message("Invalid item choice."))
             return logs
 
-        selected = usable_items[item_index]
-        # We need to remove it from player.inventory properly
-        # i.e., find it by reference in the main inventory list
-        # not just by the sub-slice index
-        actual_idx = self.player.inventory.index(selected)
+        handle, selected = usable_items[item_index]
 
         if selected["type"] == "potion" and "heal" in selected:
             max_hp = 100 + 10 * (self.player.level - 1)
             old_hp = self.player.hp
             self.player.hp = min(self.player.hp + selected["heal"], max_hp)
-            logs.append(colored_text(f"You used {selected['name']} and healed from {old_hp} to {self.player.hp} HP!", COLOR_GREEN))
-            self.player.inventory.pop(actual_idx)
+            logs.append(ItemUsed(selected["name"], None, False, old_hp, self.player.hp))
+            self.player.inventory.remove(handle)
 
         elif selected["type"] == "scroll" and "effect" in selected:
-            logs.append(f"You used {selected['name']} and activated its effect: {selected['effect']}!")
-            self.player.inventory.pop(actual_idx)
+            logs.append(ItemUsed(selected["name"], selected["effect"], False, None, None))
+            self.player.inventory.remove(handle)
 
         elif selected["type"] == "ring" and "effect" in selected:
-            logs.append(f"You equipped {selected['name']} and gained its effect: {selected['effect']}!")
-            self.player.inventory.pop(actual_idx)
+            logs.append(ItemUsed(selected["name"], selected["effect"], True, None, None))
+            self.player.inventory.remove(handle)
 
         else:
-            logs.append("This item cannot be used right now.")
+            logs.append(Message("This item cannot be used right now."))
         return logs
 
     # ------------------------------------------------------------------
     # 7) SHOP & ECONOMY
     # ------------------------------------------------------------------
 
-    def list_shop_inventory(self) -> list[str]:
+    def list_shop_inventory(self, item_type: str = None, usable_only: bool = False) -> list:
         """
-        Return logs describing the items in the current shop_inventory.
+        Return logs describing the items in the current shop_inventory,
+        optionally only those of 'item_type' and/or those the player's class
+        can use. The numbers stay the ones buy_item_from_shop takes.
         """
         logs = []
         if not self.shop_inventory:
-            logs.append("Shop is empty!")
+            logs.append(Message("Shop is empty!"))
             return logs
 
-        logs.append("--- Shop Inventory ---")
+        wanted = None
+        if item_type is not None or usable_only:
+            player_class = self.player.player_class if usable_only and self.player else None
+            wanted = {it["name"] for it in CATALOG.find(type=item_type, player_class=player_class)}
+        logs.append(Message("--- Shop Inventory ---"))
         for i, it in enumerate(self.shop_inventory, start=1):
+            if wanted is not None and it["name"] not in wanted:
+                continue
             r = it.get("rarity", "Common")
-            logs.append(f"{i}. {it['name']} [{r}] (Type={it['type']}, Cost={it['cost']})")
+            logs.append(Message(f"{i}. {it['name']} [{r}] (Type={it['type']}, Cost={it['cost']})"))
         return logs
 
-    def buy_item_from_shop(self, index: int) -> list[str]:
+    def buy_item_from_shop(self, index: int) -> list:
         """
         Attempt to buy an item from shop_inventory by index (1-based).
         """
         logs = []
         idx = index - 1
         if idx < 0 or idx >= len(self.shop_inventory):
-            logs.append("Invalid shop item number.")
+            logs.append(Message("Invalid shop item number."))
             return logs
 
         selected = self.shop_inventory[idx]
         if self.player.gold >= selected["cost"]:
             self.player.gold -= selected["cost"]
-            self.player.inventory.append(selected)
-            logs.append(colored_text(f"You bought {selected['name']}!", COLOR_GREEN))
+            self.player.inventory.add(selected)
+            logs.append(ItemBought(selected["name"], selected["cost"]))
         else:
-            logs.append(f"Not enough gold! (You have {self.player.gold})")
+            logs.append(Message(f"Not enough gold! (You have {self.player.gold})"))
 
         return logs
 
-    def list_player_inventory(self) -> list[str]:
+    def list_player_inventory(self, page: int = None) -> list:
         """
-        Return lines describing the items in the player's inventory.
+        Return lines describing the items in the player's inventory, in the
+        order of the last sort_inventory. 'page' (1-based) shows only that
+        page of INVENTORY_PAGE_SIZE entries; the numbers stay the ones
+        sell_item takes.
         """
         logs = []
-        if not self.player.inventory:
-            logs.append("Your inventory is empty.")
+        inventory = self.player.inventory
+        if not inventory:
+            logs.append(Message("Your inventory is empty."))
             return logs
 
-        logs.append("--- Your Inventory ---")
-        for i, it in enumerate(self.player.inventory, start=1):
+        if page is None:
+            start, entries = 0, inventory.page()
+            logs.append(Message("--- Your Inventory ---"))
+        else:
+            start = (page - 1) * INVENTORY_PAGE_SIZE
+            entries = inventory.page(start, INVENTORY_PAGE_SIZE)
+            pages = -(-len(inventory) // INVENTORY_PAGE_SIZE)
+            logs.append(Message(f"--- Your Inventory (page {page}/{pages}) ---"))
+        for i, (it, qty) in enumerate(entries, start=start + 1):
             half = it["cost"] // 2
             r = it.get("rarity", "Common")
-            logs.append(f"{i}. {it['name']} [{r}] => Sell value ~ {half} gold")
+            count = f" x{qty}" if qty > 1 else ""
+            logs.append(Message(f"{i}. {it['name']}{count} [{r}] => Sell value ~ {half} gold"))
         return logs
 
-    def sell_item(self, index: int) -> list[str]:
+    def sell_item(self, index: int) -> list:
         """
-        Sell an item from the player's inventory (1-based index).
+        Sell an item from the player's inventory (1-based index; one unit of a stack).
         """
         logs = []
         idx = index - 1
         if idx < 0 or idx >= len(self.player.inventory):
-            logs.append("Invalid item choice.")
+            logs.append(Message("Invalid item choice."))
             return logs
 
-        sel = self.player.inventory[idx]
+        sel = self.player.inventory.remove(self.player.inventory.handle_at(idx))
         sp = sel["cost"] // 2
         self.player.gold += sp
-        self.player.inventory.remove(sel)
-        logs.append(colored_text(f"Sold {sel['name']} for {sp} gold!", COLOR_GREEN))
+        logs.append(ItemSold(sel["name"], sp))
         return logs
 
-    def hire_companion(self, choice_key: str) -> list[str]:
+    def hire_companion(self, choice_key: str) -> list:
         """
         Attempt to hire a companion at the current tier. 
         choice_key is '1', '2', or '3' for available companion types.
@@ -644,7 +820,7 @@ class Game:
         logs = []
         cost = 150 * self.current_tier
         if self.player.gold < cost:
-            logs.append("Not enough gold to hire companion.")
+            logs.append(Message("Not enough gold to hire companion."))
             return logs
 
         c_types = {
@@ -674,12 +850,11 @@ class Game:
             },
         }
         if choice_key not in c_types:
-            logs.append("Invalid companion choice.")
+            logs.append(Message("Invalid companion choice."))
             return logs
 
         data = c_types[choice_key]
-        import random
-        comp_name = random.choice(["Arthur", "Lancelot", "Guinevere", "Robin"])
+        comp_name = self.rng.choice(["Arthur", "Lancelot", "Guinevere", "Robin"])
         c = Companion(
             comp_name,
             data["hp"],
@@ -690,17 +865,17 @@ class Game:
         )
         self.player.companions.append(c)
         self.player.gold -= cost
-        logs.append(colored_text(f"You hired {c.name} the {data['name']}!", COLOR_GREEN))
+        logs.append(Hired(c.name, data["name"], cost))
         return logs
 
-    def hire_pet(self, choice_key: str) -> list[str]:
+    def hire_pet(self, choice_key: str) -> list:
         """
         Attempt to hire a pet at the current tier.
         """
         logs = []
         cost = 80 * self.current_tier
         if self.player.gold < cost:
-            logs.append("Not enough gold to hire a pet.")
+            logs.append(Message("Not enough gold to hire a pet."))
             return logs
 
         pet_list = {
@@ -709,19 +884,18 @@ class Game:
             "3": {"name": "Shadow Wolf",   "hp": 40 + (5*self.current_tier), "damage": 7 + self.current_tier, "type": "Poison"},
         }
         if choice_key not in pet_list:
-            logs.append("Invalid pet choice.")
+            logs.append(Message("Invalid pet choice."))
             return logs
 
         data = pet_list[choice_key]
-        import random
-        p_name = random.choice(["Fluffy", "Spike", "Shadow", "Ziggy"])
+        p_name = self.rng.choice(["Fluffy", "Spike", "Shadow", "Ziggy"])
         newp = Pet(p_name, data["hp"], 100, data["damage"], data["type"])
         self.player.pets.append(newp)
         self.player.gold -= cost
-        logs.append(colored_text(f"You hired {newp.name} the {data['name']}!", COLOR_GREEN))
+        logs.append(Hired(newp.name, data["name"], cost))
         return logs
 
-    def cheat_code(self, code: str) -> list[str]:
+    def cheat_code(self, code: str) -> list:
         """
         Process a cheat code. Return logs of what happened.
         """
@@ -729,69 +903,111 @@ class Game:
         code = code.lower()
         if code == "satoshi":
             self.player.gold += 1000
-            logs.append(colored_text("Cheat activated! +1000 Gold.", COLOR_YELLOW))
+            logs.append(Message("Cheat activated! +1000 Gold.", COLOR_YELLOW))
         elif code == "trump":
             self.player.hp = 1000
             self.player.stats["Strength"] = 1000
-            logs.append(colored_text("Cheat activated! HP and Strength maxed out!", COLOR_YELLOW))
+            logs.append(Message("Cheat activated! HP and Strength maxed out!", COLOR_YELLOW))
         else:
-            logs.append("Invalid cheat code.")
+            logs.append(Message("Invalid cheat code."))
         return logs
 
     # ------------------------------------------------------------------
     # 8) TIERS, SAVING, LOADING
     # ------------------------------------------------------------------
 
-    def check_for_new_tier(self) -> list[str]:
+    def check_for_new_tier(self) -> list:
         logs = []
         next_tier = self.current_tier + 1
         needed = 10 * self.current_tier
-        if self.turn >= needed and next_tier in SHOP_TIERS:
+        if self.turn >= needed and next_tier in CATALOG.by_tier:
             self.current_tier = next_tier
-            self.shop_inventory = SHOP_TIERS[next_tier][:]
-            logs.append(colored_text(f"*** Tier {next_tier} Items Unlocked! ***", COLOR_YELLOW))
+            self.shop_inventory = list(CATALOG.by_tier[next_tier])
+            logs.append(TierUnlocked(next_tier))
         return logs
 
-    def save_game_slot(self, slot: str) -> list[str]:
+    def fork(self, decisions=None) -> "Game":
+        """
+        Independent copy of the session for lookahead ("what if I fight
+        now?"). Much cheaper than copy.deepcopy: units get new world rows and
+        their own lists, while item dicts and cached combat stats are shared
+        (neither is ever modified in place). The copy continues the same RNG
+        stream, so forking and replaying the same commands gives the same
+        result.
+
+        The copy answers choices with 'decisions', never with this session's
+        provider (a recording or scripted one would be consumed by the copy).
+        By default it gets a deferred ScriptedDecisions: it never prompts and
+        level-up picks stay banked as talent points.
+        """
+        twin = Game.__new__(Game)
+        twin.seed = self.seed
+        twin.rng = random.Random.__new__(random.Random)  # skip seeding, the state is overwritten
+        twin.rng.setstate(self.rng.getstate())
+        twin.decisions = decisions if decisions is not None else ScriptedDecisions(deferred=True)
+        twin.turn = self.turn
+        twin.current_tier = self.current_tier
+        twin.shop_inventory = self.shop_inventory[:]
+        twin.current_area = self.current_area
+        twin.running = self.running
+        memo = {}
+        twin.player = self.player.fork(memo) if self.player else None
+        twin.current_enemies = [e.fork(memo) for e in self.current_enemies]
+        twin.effects = self.effects.fork(memo)
+        return twin
+
+    def state_dict(self) -> dict:
+        """The session state as plain JSON-compatible data (what a save file holds)."""
+        return {
+            "turn": self.turn,
+            "current_tier": self.current_tier,
+            "current_area": self.current_area,
+            "player": self.player.to_dict() if self.player else None,
+            "shop_inventory": [item_ref(it) for it in self.shop_inventory],
+            "seed": self.seed,
+            "rng_state": rng_state_to_json(self.rng.getstate()),
+        }
+
+    def save_game_slot(self, slot: str) -> list:
         """
         Save the current game state to 'savegame_{slot}.json'.
         Returns logs about success/failure.
         """
         logs = []
         if slot not in ["1", "2", "3"]:
-            logs.append("Invalid save slot. Must be '1','2', or '3'.")
+            logs.append(Message("Invalid save slot. Must be '1','2', or '3'."))
             return logs
 
         filename = f"savegame_{slot}.json"
-        data = {
-            "turn": self.turn,
-            "current_tier": self.current_tier,
-            "current_area": self.current_area,
-            "player": self.player.to_dict() if self.player else None,
-            "shop_inventory": self.shop_inventory
-        }
+        data = self.state_dict()
         with open(filename, "w") as f:
-            json.dump(data, f, indent=4)
-        logs.append(colored_text(f"Game saved to {filename}!", COLOR_GREEN))
+            json.dump(data, f, separators=(",", ":"))
+        logs.append(GameSaved(filename))
         return logs
 
-    def load_game_slot(self, slot: str) -> list[str]:
+    def load_game_slot(self, slot: str) -> list:
         """
         Load the game state from 'savegame_{slot}.json'.
         Returns logs about success/failure.
         """
         logs = []
         if slot not in ["1", "2", "3"]:
-            logs.append("Invalid load slot. Must be '1','2', or '3'.")
+            logs.append(Message("Invalid load slot. Must be '1','2', or '3'."))
             return logs
 
         filename = f"savegame_{slot}.json"
         if not os.path.exists(filename):
-            logs.append(f"No save file at {filename}.")
+            logs.append(Message(f"No save file at {filename}."))
             return logs
 
         with open(filename, "r") as f:
             data = json.load(f)
+        self.load_state(data)
+        logs.append(GameLoaded(filename))
+        return logs
+
+    def load_state(self, data: dict):
+        """Replace the session state with 'data' (what state_dict returns)."""
         self.turn = data["turn"]
         self.current_tier = data["current_tier"]
         self.current_area = data.get("current_area", "Forest")
@@ -799,135 +1015,155 @@ class Game:
             self.player = Player.from_dict(data["player"])
         else:
             self.player = None
-        self.shop_inventory = data.get("shop_inventory", [])
+        self.shop_inventory = [item_from_ref(r) for r in data.get("shop_inventory", [])]
+        # Effects are not saved; the old ones belong to the previous session's units
+        self.current_enemies = []
+        self.effects = StatusEffectManager()
+        self.seed = data.get("seed", self.seed)
+        if "rng_state" in data:
+            self.rng.setstate(rng_state_from_json(data["rng_state"]))
         self.running = True if self.player and self.player.is_alive() else False
 
-        logs.append(colored_text(f"Game loaded from {filename}!", COLOR_GREEN))
-        return logs
-
     # ------------------------------------------------------------------
     # 9) CRAFTING
     # ------------------------------------------------------------------
 
-    def list_crafting_recipes(self) -> list[str]:
+    def list_crafting_recipes(self) -> list:
         """
-        Return logs listing all crafting recipes.
+        Return logs listing all crafting recipes (with how many the player
+        could craft right now).
         """
         logs = []
-        logs.append("=== Crafting Recipes ===")
+        logs.append(Message("=== Crafting Recipes ==="))
         i = 1
         for rname, rdata in CRAFTING_RECIPES.items():
             ing_str = ", ".join(f"{k}x{v}" for k,v in rdata["ingredients"].items())
-            logs.append(f"{i}. {rname} => requires {ing_str}")
+            can = f" (can craft {self.max_craftable(rname)})" if self.player else ""
+            logs.append(Message(f"{i}. {rname} => requires {ing_str}{can}"))
             i += 1
         return logs
 
-    def craft_item_by_name(self, recipe_name: str) -> list[str]:
+    def show_crafting_tree(self, recipe_name: str, qty: int = 1) -> list:
         """
-        Attempt to craft the given recipe_name. Returns logs.
+        Return logs showing everything 'qty' crafts of recipe_name need,
+        down to base materials.
         """
         logs = []
         if recipe_name not in CRAFTING_RECIPES:
-            logs.append(f"No such recipe: {recipe_name}")
+            logs.append(Message(f"No such recipe: {recipe_name}"))
+            return logs
+
+        stack = [(crafting.material_tree(recipe_name, qty), 0)]
+        while stack:
+            node, depth = stack.pop()
+            logs.append(Message(f"{'  ' * depth}{node.name} x{node.qty}"))
+            stack.extend((child, depth + 1) for child in reversed(node.children))
+        return logs
+
+    def craft_item_by_name(self, recipe_name: str, qty: int = 1) -> list:
+        """
+        Attempt to craft the given recipe_name 'qty' times. Missing
+        ingredients that have a recipe themselves are crafted on the way.
+        Returns logs.
+        """
+        logs = []
+        if recipe_name not in CRAFTING_RECIPES:
+            logs.append(Message(f"No such recipe: {recipe_name}"))
             return logs
 
         recipe = CRAFTING_RECIPES[recipe_name]
-        if not self.can_craft(recipe):
-            logs.append("You lack the required materials.")
+        if qty < 1 or not self.can_craft(recipe, qty):
+            logs.append(Message("You lack the required materials."))
             return logs
 
-        logs.extend(self.do_craft(recipe))
+        logs.extend(self.do_craft(recipe, qty))
         return logs
 
-    def can_craft(self, recipe: dict) -> bool:
-        needed = recipe["ingredients"]
-        inv_mats = {}
-        for it in self.player.inventory:
-            if it["type"] == "material":
-                nm = it["name"]
-                inv_mats[nm] = inv_mats.get(nm, 0) + 1
-        for k, v in needed.items():
-            if inv_mats.get(k, 0) < v:
-                return False
-        return True
+    def can_craft(self, recipe: dict, qty: int = 1) -> bool:
+        name = crafting.RECIPE_FOR[recipe["result"]["name"]]
+        return crafting.plan(name, qty, self.player.inventory.name_count) is not None
 
-    def do_craft(self, recipe: dict) -> list[str]:
+    def max_craftable(self, recipe_name: str) -> int:
+        """How many times recipe_name can be crafted from the current inventory."""
+        return crafting.max_craftable(recipe_name, self.player.inventory.name_count)
+
+    def do_craft(self, recipe: dict, qty: int = 1) -> list:
         """
-        Remove required materials from inventory and add the result item.
+        Remove everything 'qty' crafts need from inventory in one pass and
+        add the results. The caller checks can_craft first.
         """
         logs = []
-        needed = recipe["ingredients"]
-        for mat, count_needed in needed.items():
-            removed = 0
-            idx = 0
-            while removed < count_needed and idx < len(self.player.inventory):
-                it = self.player.inventory[idx]
-                if it["type"] == "material" and it["name"] == mat:
-                    self.player.inventory.pop(idx)
-                    removed += 1
-                else:
-                    idx += 1
-
-        result = recipe["result"].copy()
-        self.player.inventory.append(result)
-        logs.append(colored_text(f"You crafted {result['name']}!", COLOR_GREEN))
+        inventory = self.player.inventory
+        name = crafting.RECIPE_FOR[recipe["result"]["name"]]
+        planned = crafting.plan(name, qty, inventory.name_count)
+        for item_name, units in planned.take.items():
+            inventory.take_named(item_name, units)
+
+        # Intermediate results go straight into the next recipe
+        for rname, times in planned.crafts.items():
+            logs.append(ItemCrafted(CRAFTING_RECIPES[rname]["result"]["name"], times))
+        result = recipe["result"]  # the item template itself, see items.py
+        if is_stackable(result):
+            inventory.add(result, qty)
+        else:
+            for _ in range(qty):
+                inventory.add(result)
         return logs
 
     # ------------------------------------------------------------------
     # 10) SORTING / HELP
     # ------------------------------------------------------------------
 
-    def sort_inventory(self, criterion: str) -> list[str]:
+    def sort_inventory(self, criterion: str) -> list:
         """
-        Sort the player's inventory by one of: 'type', 'rarity', or 'name'.
+        Sort the player's inventory by one of: 'type', 'rarity', 'name' or
+        'value' (sell value, highest first); 'added' goes back to the order
+        items came in. The order sticks: new items are slotted into place.
         Returns logs about the sort.
         """
         logs = []
-        if criterion == "type":
-            self.player.inventory.sort(key=lambda i: i["type"])
-            logs.append("Inventory sorted by item type.")
-        elif criterion == "rarity":
-            rarity_order = {"Common":1,"Uncommon":2,"Rare":3,"Epic":4,"Legendary":5}
-            self.player.inventory.sort(key=lambda i: rarity_order.get(i.get("rarity","Common"),1))
-            logs.append("Inventory sorted by rarity.")
-        elif criterion == "name":
-            self.player.inventory.sort(key=lambda i: i["name"])
-            logs.append("Inventory sorted by name.")
+        labels = {"type": "item type", "rarity": "rarity", "name": "name", "value": "sell value"}
+        if criterion in labels:
+            self.player.inventory.sort_by(criterion)
+            logs.append(Message(f"Inventory sorted by {labels[criterion]}."))
+        elif criterion == "added":
+            self.player.inventory.sort_by(None)
+            logs.append(Message("Inventory back in the order items were added."))
         else:
-            logs.append("Invalid sort criterion.")
+            logs.append(Message("Invalid sort criterion."))
         return logs
 
-    def show_help(self) -> list[str]:
+    def show_help(self) -> list:
         """
         Return a list of strings describing possible commands.
         """
         logs = []
-        logs.append(colored_text("=== GAME HELP ===", COLOR_BLUE))
-        logs.append("Commands you might implement in a UI:")
-        logs.append(" - help : Show this help text.")
-        logs.append(" - stats : Show character stats.")
-        logs.append(" - area : Show/Travel to areas.")
-        logs.append(" - shop : Open shop menu (buy, sell, hire).")
-        logs.append(" - battle : Start a fight (normal or special).")
-        logs.append(" - skill X : Use skill #X.")
-        logs.append(" - item X : Use item #X (potion, scroll, ring).")
-        logs.append(" - craft 'RecipeName' : Craft an item if you have mats.")
-        logs.append(" - cheat 'code' : Use a cheat code.")
-        logs.append(" - save [1-3], load [1-3].")
-        logs.append(" - end_turn : Move to next turn.")
+        logs.append(Message("=== GAME HELP ===", COLOR_BLUE))
+        logs.append(Message("Commands you might implement in a UI:"))
+        logs.append(Message(" - help : Show this help text."))
+        logs.append(Message(" - stats : Show character stats."))
+        logs.append(Message(" - area : Show/Travel to areas."))
+        logs.append(Message(" - shop : Open shop menu (buy, sell, hire)."))
+        logs.append(Message(" - battle : Start a fight (normal or special)."))
+        logs.append(Message(" - skill X : Use skill #X."))
+        logs.append(Message(" - item X : Use item #X (potion, scroll, ring)."))
+        logs.append(Message(" - craft 'RecipeName' : Craft an item if you have mats."))
+        logs.append(Message(" - cheat 'code' : Use a cheat code."))
+        logs.append(Message(" - save [1-3], load [1-3]."))
+        logs.append(Message(" - end_turn : Move to next turn."))
         return logs
 
     # ------------------------------------------------------------------
     # 11) DISPLAY STATS
     # ------------------------------------------------------------------
 
-    def display_stats_table(self) -> list[str]:
+    def display_stats_table(self) -> list:
         """
         Return a list of strings containing a table of the player's party stats.
         """
         logs = []
         if not self.player:
-            logs.append("No player found.")
+            logs.append(Message("No player found."))
             return logs
 
         headers = [
@@ -990,12 +1226,12 @@ class Game:
 
         if USE_TABULATE and tabulate:
             table_str = tabulate(table_data, headers=headers, tablefmt="fancy_grid")
-            logs.append(table_str)
+            logs.append(Message(table_str))
         else:
             hline = " | ".join(headers)
-            logs.append(hline)
-            logs.append("-" * len(hline))
+            logs.append(Message(hline))
+            logs.append(Message("-" * len(hline)))
             for row in table_data:
-                logs.append(" | ".join(str(x) for x in row))
+                logs.append(Message(" | ".join(str(x) for x in row)))
 
         return logs
@@ -0,0 +1,196 @@
+# game/initiative.py
+"""
+Agility-based initiative (active-time battle).
+
+Every combatant waits ROUND_TIME * BASE_AGILITY / speed time units between
+actions, so an agility-5 unit acts once per round and an agility-10 unit
+twice. Pending actions live in a heap keyed by the time they are due, so
+producing the next actor is O(log n). When a unit's speed changes (haste or
+slow), only that unit is rescheduled: a newer heap entry is pushed and the
+old one is skipped when it surfaces, so nobody else is re-sorted. The
+battle learns which units those are from the effect manager
+(speed_changed), so the end of a round does not look at every unit.
+"""
+import heapq
+import random
+
+from .combat import BattleOutcome, NO_ONE, WINNER_NONE, WINNER_PARTY, WINNER_ENEMIES, XP_PER_KILL, XP_PER_WAVE
+from .mass_battle import AliveSet
+
+ROUND_TIME = 100.0
+BASE_AGILITY = 5
+
+
+def unit_speed(unit) -> float:
+    """Action speed of any combatant (cached in its combat stats)."""
+    return unit.combat_stats.speed
+
+
+def action_delay(unit) -> float:
+    return delay_at(unit_speed(unit))
+
+
+def delay_at(speed) -> float:
+    return ROUND_TIME * BASE_AGILITY / max(speed, 0.1)
+
+
+class InitiativeQueue:
+    """Min-heap of (due time, order, unit) with lazy rescheduling."""
+
+    def __init__(self, units=()):
+        self.time = 0.0
+        self._heap = []
+        self._due = {}       # id(unit) -> due time of its live entry
+        self._speed = {}     # id(unit) -> speed that entry was scheduled at
+        self._order = 0      # tie-breaker: earlier scheduling acts first
+        for u in units:
+            speed = unit_speed(u)
+            self.schedule(u, self.time + delay_at(speed), speed)
+
+    def __len__(self):
+        return len(self._due)
+
+    def schedule(self, unit, due, speed=None):
+        self._order += 1
+        self._due[id(unit)] = due
+        self._speed[id(unit)] = unit_speed(unit) if speed is None else speed
+        heapq.heappush(self._heap, (due, self._order, unit))
+
+    def reschedule(self, unit):
+        """
+        Call after a unit's speed may have changed: its remaining wait is
+        scaled from the speed it was scheduled at to the new one. O(log n);
+        the stale entry is dropped lazily. No-op if the speed is the same.
+        """
+        old_due = self._due.get(id(unit))
+        if old_due is None:
+            return
+        old_speed = self._speed[id(unit)]
+        new_speed = unit_speed(unit)
+        if new_speed == old_speed:
+            return
+        remaining = (old_due - self.time) * max(old_speed, 0.1) / max(new_speed, 0.1)
+        self.schedule(unit, self.time + remaining, new_speed)
+
+    def remove(self, unit):
+        self._due.pop(id(unit), None)
+        self._speed.pop(id(unit), None)
+
+    def pop(self):
+        """Advance the clock to the next due unit and return it."""
+        heap = self._heap
+        while heap:
+            due, _, unit = heapq.heappop(heap)
+            if self._due.get(id(unit)) != due:
+                continue  # stale or removed
+            self.time = due
+            speed = unit_speed(unit)
+            self.schedule(unit, due + delay_at(speed), speed)
+            return unit
+        return None
+
+
+class InitiativeBattle:
+    """
+    Headless battle where turn order comes from an InitiativeQueue. A party
+    member hits the first living enemy; an enemy hits a random living party
+    member. Status effects (if a manager is passed) advance once every
+    ROUND_TIME, and units whose speed changed are rescheduled. A stunned
+    unit loses every action it gets during that round.
+    """
+
+    def __init__(self, party, enemies, rng=random, effects=None):
+        self.party = list(party)
+        self.enemies = list(enemies)
+        self.leader = self.party[0]
+        self.hp = self.leader.world.hp
+        self.rng = rng
+        self.effects = effects
+        self.alive_party = AliveSet(self.party)
+        self.alive_enemies = AliveSet(self.enemies)
+        self._is_enemy = {id(e) for e in self.enemies}
+        self.queue = InitiativeQueue(self.alive_party.units + self.alive_enemies.units)
+        self._front = 0
+        self._next_round = ROUND_TIME
+        self._blocked = NO_ONE
+        self.actions = 0
+        self.dealt = self.taken = self.gold = self.xp = 0
+
+    def _front_enemy(self):
+        enemies, hp = self.enemies, self.hp
+        while self._front < len(enemies) and hp[enemies[self._front].eid] <= 0:
+            self._front += 1
+        return enemies[self._front] if self._front < len(enemies) else None
+
+    def _end_of_round(self):
+        """Advance the effects; only the units they touched are looked at."""
+        effects = self.effects
+        effects.advance()
+        self._blocked = effects.blocked
+        for u in effects.speed_changed:
+            if u.hp > 0:
+                self.queue.reschedule(u)  # ignores units not in this battle
+        for u in effects.hp_changed:
+            if u.hp <= 0:
+                alive = self.alive_enemies if id(u) in self._is_enemy else self.alive_party
+                if u in alive:
+                    alive.discard(u)
+                    self.queue.remove(u)
+
+    def step(self):
+        """Let the next unit act."""
+        unit = self.queue.pop()
+        if unit is None:
+            return
+        effects = self.effects
+        while effects is not None and (len(effects) or effects.blocked) and self.queue.time >= self._next_round:
+            self._next_round += ROUND_TIME
+            self._end_of_round()
+            if unit.hp <= 0:
+                return
+        self.actions += 1
+        if unit.eid in self._blocked:
+            return
+        hp = self.hp
+
+        if id(unit) in self._is_enemy:
+            if not self.alive_party:
+                return
+            t = self.alive_party.choice(self.rng)
+            dmg = unit.attack * t.combat_stats.defense_row.get(unit.damage_type, 1)
+            hp[t.eid] -= dmg
+            self.taken += dmg
+            if hp[t.eid] <= 0:
+                self.alive_party.discard(t)
+                self.queue.remove(t)
+        else:
+            target = self._front_enemy()
+            if target is None:
+                return
+            cs = unit.combat_stats
+            dmg = cs.attack
+            if unit.attack_roll:
+                dmg += int(self.rng.random() * (unit.attack_roll + 1))
+            dmg *= cs.attack_row.get(target.damage_type, 1)
+            hp[target.eid] -= dmg
+            self.dealt += dmg
+            if hp[target.eid] <= 0:
+                self.alive_enemies.discard(target)
+                self.queue.remove(target)
+                self.gold += target.gold_drop
+                self.xp += XP_PER_KILL
+                if not self.alive_enemies:
+                    self.xp += XP_PER_WAVE
+
+    def winner(self) -> int:
+        if self.hp[self.leader.eid] <= 0:
+            return WINNER_ENEMIES
+        if not self.alive_enemies:
+            return WINNER_PARTY
+        return WINNER_NONE
+
+    def run(self, max_actions=100000) -> BattleOutcome:
+        while self.actions < max_actions and self.winner() == WINNER_NONE and len(self.queue):
+            self.step()
+        rounds = int(self.queue.time // ROUND_TIME) + 1
+        return BattleOutcome(self.winner(), rounds, self.dealt, self.taken, self.gold, self.xp)
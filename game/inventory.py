@@ -0,0 +1,278 @@
+# game/inventory.py
+"""
+The player's inventory as an indexed container.
+
+Items are plain item dicts (usually shared templates, see items.py). The
+inventory keeps them in display order, the order they were added in. Each
+add returns a handle, a stable int that only grows, so display order is
+handle order. remove(handle) is O(1) in the tables below. The display
+order itself is a list of blocks of at most ORDER_BLOCK handles: removing
+an entry bisects to its block and shifts only that block, and a 1-based
+lookup walks the block lengths, so neither touches the whole inventory.
+
+Next to the ordered table it keeps
+  - one bucket per item type ({handle: item}, in display order), so "all
+    weapons" or "the usable items" never scan the rest of the inventory,
+  - one bucket per item name, for the ingredient counts crafting checks
+    (a crafted item can be an ingredient too, so this covers every type),
+  - sorted views (by type, rarity, name or sell value; see VIEW_KEYS),
+    each a list of (key, handle) kept in order by bisect on every add and
+    remove. A view is built the first time it is asked for.
+
+sort_by(criterion) makes one of the views the listing order: the 1-based
+positions list_player_inventory shows and sell_item takes (handle_at,
+page). It stays sorted as items come and go, and a page of k entries is
+a slice, not a sort. sort_by(None) goes back to display order.
+
+Stackable items (materials, potions and scrolls that are item templates,
+see items.py) share one entry per template with a quantity: adding a
+second Health Potion bumps the count of the existing entry, and
+remove(handle) takes one unit, dropping the entry at zero. len() and the
+1-based positions count entries, not units.
+"""
+import heapq
+from bisect import bisect_left, bisect_right, insort
+
+from .data import RARITY_ORDER
+from .items import is_stackable, item_ref, item_from_ref
+
+# criterion -> sort key of an item; ties keep the order items were added in
+VIEW_KEYS = {
+    "type": lambda it: it["type"],
+    "rarity": lambda it: RARITY_ORDER.get(it.get("rarity", "Common"), 1),
+    "name": lambda it: it["name"],
+    "value": lambda it: -(it["cost"] // 2),  # most valuable first
+}
+
+# Display order block size: a removal shifts at most this many handles
+ORDER_BLOCK = 512
+
+
+class Inventory:
+    __slots__ = ("_items", "_qty", "_stacks", "_types", "_names", "_next",
+                 "_blocks", "_block_lo", "_views", "sorted_by")
+
+    def __init__(self, items=()):
+        self._items = {}      # handle -> item, in display order
+        self._qty = {}        # handle -> quantity
+        self._stacks = {}     # stackable template name -> handle
+        self._types = {}      # item type -> {handle: item}
+        self._names = {}      # item name -> {handle: item}
+        self._next = 0
+        self._blocks = []       # handles (ascending) by display position, in blocks
+        self._block_lo = []     # lowest handle each block was started with
+        self._views = {}        # criterion -> [(key, handle), ...] sorted
+        self.sorted_by = None   # criterion of the listing order, None = display order
+        for it in items:
+            self.add(it)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __getitem__(self, index):
+        return self._items[self.handle_at(index)]
+
+    def __repr__(self):
+        return f"Inventory({list(self._items.values())!r})"
+
+    # --- adding / removing --------------------------------------------
+
+    def add(self, item, qty=1) -> int:
+        """
+        Add 'qty' of 'item': onto its existing stack if it stacks, else as a
+        new entry at the end of the display order. Returns the handle.
+        """
+        stackable = is_stackable(item)
+        if stackable:
+            h = self._stacks.get(item["name"])
+            if h is not None:
+                self._qty[h] += qty
+                return h
+        h = self._next
+        self._next += 1
+        if stackable:
+            self._stacks[item["name"]] = h
+        self._items[h] = item
+        self._qty[h] = qty
+        self._types.setdefault(item["type"], {})[h] = item
+        self._names.setdefault(item["name"], {})[h] = item
+        blocks = self._blocks
+        if blocks and len(blocks[-1]) < ORDER_BLOCK:
+            blocks[-1].append(h)
+        else:
+            blocks.append([h])
+            self._block_lo.append(h)
+        for criterion, view in self._views.items():
+            insort(view, (VIEW_KEYS[criterion](item), h))
+        return h
+
+    def remove(self, handle, qty=1):
+        """Take 'qty' units of the entry with this handle out; returns the item."""
+        left = self._qty[handle] - qty
+        if left > 0:
+            self._qty[handle] = left
+            return self._items[handle]
+        item = self._items.pop(handle)
+        del self._qty[handle]
+        if self._stacks.get(item["name"]) == handle:
+            del self._stacks[item["name"]]
+        b = bisect_right(self._block_lo, handle) - 1
+        block = self._blocks[b]
+        del block[bisect_left(block, handle)]
+        if not block:
+            del self._blocks[b]
+            del self._block_lo[b]
+        self._unindex(self._types, item["type"], handle)
+        self._unindex(self._names, item["name"], handle)
+        for criterion, view in self._views.items():
+            del view[bisect_left(view, (VIEW_KEYS[criterion](item), handle))]
+        return item
+
+    @staticmethod
+    def _unindex(index, key, handle):
+        bucket = index[key]
+        del bucket[handle]
+        if not bucket:
+            del index[key]
+
+    # --- lookups --------------------------------------------------------
+
+    def get(self, handle):
+        return self._items.get(handle)
+
+    def items(self):
+        """(handle, item) pairs in display order."""
+        return self._items.items()
+
+    def quantity(self, handle) -> int:
+        return self._qty.get(handle, 0)
+
+    def stacks(self):
+        """(item, quantity) pairs in display order."""
+        qty = self._qty
+        return [(item, qty[h]) for h, item in self._items.items()]
+
+    def total(self) -> int:
+        """Number of units, counting every item of every stack."""
+        return sum(self._qty.values())
+
+    def handle_at(self, index) -> int:
+        """Handle of the entry at 0-based position 'index' of the listing order."""
+        if self.sorted_by is not None:
+            return self._views[self.sorted_by][index][1]
+        if index < 0:
+            index += len(self._items)
+        if index >= 0:
+            for block in self._blocks:
+                if index < len(block):
+                    return block[index]
+                index -= len(block)
+        raise IndexError("inventory index out of range")
+
+    def page(self, start=0, count=None) -> list:
+        """(item, quantity) of 'count' entries of the listing order from 'start' on."""
+        stop = None if count is None else start + count
+        if self.sorted_by is None:
+            handles = []
+            for block in self._blocks:
+                if start < len(block):
+                    handles.extend(block[start:None if stop is None else max(stop, 0)])
+                if stop is not None:
+                    stop -= len(block)
+                    if stop <= 0:
+                        break
+                start = max(start - len(block), 0)
+        else:
+            handles = [h for _, h in self._views[self.sorted_by][start:stop]]
+        items, qty = self._items, self._qty
+        return [(items[h], qty[h]) for h in handles]
+
+    def bucket(self, item_type) -> dict:
+        """{handle: item} of one type, in display order. Do not modify it."""
+        return self._types.get(item_type, {})
+
+    def count(self, item_type) -> int:
+        return len(self._types.get(item_type, ()))
+
+    def of_types(self, item_types) -> list:
+        """(handle, item) pairs of any of 'item_types', in display order."""
+        buckets = [self._types[t].items() for t in item_types if t in self._types]
+        if len(buckets) == 1:
+            return list(buckets[0])
+        return list(heapq.merge(*buckets, key=lambda pair: pair[0]))
+
+    def name_count(self, name) -> int:
+        """Units of items called 'name' (all their entries and stacks)."""
+        qty = self._qty
+        return sum(qty[h] for h in self._names.get(name, ()))
+
+    def name_counts(self) -> dict:
+        qty = self._qty
+        return {name: sum(qty[h] for h in bucket) for name, bucket in self._names.items()}
+
+    def take_named(self, name, count) -> list:
+        """Remove the first 'count' units called 'name'; returns them."""
+        taken = []
+        for h in list(self._names.get(name, ())):
+            if len(taken) == count:
+                break
+            n = min(count - len(taken), self._qty[h])
+            item = self.remove(h, n)
+            taken.extend([item] * n)
+        return taken
+
+    # --- sorted views -----------------------------------------------------
+
+    def view(self, criterion) -> list:
+        """Handles sorted by VIEW_KEYS[criterion]; built once, then kept up to date."""
+        return [h for _, h in self._sorted(criterion)]
+
+    def sort_by(self, criterion):
+        """Make the 'criterion' view (or display order, for None) the listing order."""
+        if criterion is not None:
+            self._sorted(criterion)
+        self.sorted_by = criterion
+
+    def _sorted(self, criterion):
+        view = self._views.get(criterion)
+        if view is None:
+            key = VIEW_KEYS[criterion]
+            view = self._views[criterion] = sorted((key(it), h) for h, it in self._items.items())
+        return view
+
+    # --- whole-inventory operations --------------------------------------
+
+    def copy(self):
+        """Independent inventory over the same item dicts (see Game.fork)."""
+        twin = Inventory.__new__(Inventory)
+        twin._items = self._items.copy()
+        twin._qty = self._qty.copy()
+        twin._stacks = self._stacks.copy()
+        twin._types = {t: bucket.copy() for t, bucket in self._types.items()}
+        twin._names = {n: bucket.copy() for n, bucket in self._names.items()}
+        twin._next = self._next
+        twin._blocks = [block[:] for block in self._blocks]
+        twin._block_lo = self._block_lo[:]
+        twin._views = {c: view[:] for c, view in self._views.items()}
+        twin.sorted_by = self.sorted_by
+        return twin
+
+    # --- saving ----------------------------------------------------------
+
+    def to_list(self) -> list:
+        """Save form: an item reference per entry, [reference, quantity] for stacks."""
+        return [item_ref(item) if n == 1 else [item_ref(item), n] for item, n in self.stacks()]
+
+    @staticmethod
+    def from_list(data):
+        """Inverse of to_list; also reads the one-dict-per-item lists of older saves."""
+        inv = Inventory()
+        for entry in data:
+            if isinstance(entry, list):
+                inv.add(item_from_ref(entry[0]), entry[1])
+            else:
+                inv.add(item_from_ref(entry))
+        return inv
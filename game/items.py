@@ -0,0 +1,75 @@
+# game/items.py
+"""
+Item templates and the flyweight item references built on them.
+
+Every item the game can hand out (shop stock, crafting results, materials,
+the merchant's secret potion) has one template dict here, keyed by its
+unique name. Items in play are the template dicts themselves - twenty
+Health Potions are twenty references to one dict, not twenty copies - so
+templates must never be modified in place. An item that differs from its
+template (or has none) is its own dict.
+
+Saves store an item as a reference:
+  "Health Potion"                      - the template as is
+  {"template": "Iron Sword", "damage": 9} - the template plus an overlay
+  {"name": ..., "type": ..., ...}      - a full dict (no template)
+item_from_ref turns all three, and the full dicts of older saves, back
+into items.
+"""
+from .data import SHOP_TIERS, CRAFTING_RECIPES, MATERIALS, SECRET_POTION
+
+# name -> template dict
+ITEM_TEMPLATES = {}
+for _tier_list in SHOP_TIERS.values():
+    for _it in _tier_list:
+        ITEM_TEMPLATES[_it["name"]] = _it
+for _recipe in CRAFTING_RECIPES.values():
+    ITEM_TEMPLATES.setdefault(_recipe["result"]["name"], _recipe["result"])
+for _it in MATERIALS:
+    ITEM_TEMPLATES.setdefault(_it["name"], _it)
+ITEM_TEMPLATES.setdefault(SECRET_POTION["name"], SECRET_POTION)
+
+# Identical items of these types share one inventory entry with a quantity
+STACKABLE_TYPES = frozenset(("material", "potion", "scroll"))
+
+_MISSING = object()
+
+
+def flyweight(item):
+    """The template for 'item' if it is equal to it, else 'item' itself."""
+    template = ITEM_TEMPLATES.get(item["name"])
+    if template is item or template == item:
+        return template
+    return item
+
+
+def is_stackable(item) -> bool:
+    """True for template items of a stackable type."""
+    return item["type"] in STACKABLE_TYPES and ITEM_TEMPLATES.get(item["name"]) is item
+
+
+def item_ref(item):
+    """Compact, JSON-compatible reference to 'item' (None stays None)."""
+    if item is None:
+        return None
+    template = ITEM_TEMPLATES.get(item["name"])
+    if template is None:
+        return item
+    if template is item or template == item:
+        return item["name"]
+    overlay = {k: v for k, v in item.items() if template.get(k, _MISSING) != v}
+    overlay["template"] = item["name"]
+    return overlay
+
+
+def item_from_ref(ref):
+    """The item for a reference made by item_ref (or a full item dict)."""
+    if ref is None:
+        return None
+    if isinstance(ref, str):
+        return ITEM_TEMPLATES[ref]
+    if "template" in ref:
+        item = dict(ITEM_TEMPLATES[ref["template"]])
+        item.update((k, v) for k, v in ref.items() if k != "template")
+        return flyweight(item)
+    return flyweight(ref)
@@ -0,0 +1,121 @@
+# game/loot.py
+"""
+Item drops from defeated enemies.
+
+Each (area, enemy type, shop tier) gets a loot table built from the item
+catalog: the shop stock of every unlocked tier plus crafting materials,
+weighted by rarity. The area's loot_mod, times the enemy's own loot_mod
+(ENEMY_TYPES, default 1.0), raises the chance of any drop and tilts it
+toward rarer items: an item of rarity rank r (Common = 1) has its weight
+multiplied by loot_mod ** (r - 1). "No drop" is an outcome of the table
+like any item.
+
+Tables are compiled on first use into Walker alias tables (Vose's
+construction), so a drop is one random number and two list lookups
+however many items the table holds. sample_many draws a batch, and
+sample_indices draws one with NumPy when it is installed (simulations).
+"""
+from .data import AREA_DATA, ENEMY_TYPES, RARITY_ORDER
+from .catalog import CATALOG
+
+########################################
+#   Attempt to import numpy
+########################################
+try:
+    import numpy as np
+    USE_NUMPY = True
+except ImportError:
+    np = None
+    USE_NUMPY = False
+
+
+# Relative drop weight by rarity, before loot_mod
+RARITY_WEIGHTS = {"Common": 60, "Uncommon": 25, "Rare": 10, "Epic": 4, "Legendary": 1}
+
+# Chance that a defeated enemy drops an item at all, before loot_mod
+DROP_CHANCE = 0.15
+
+
+class AliasTable:
+    """Weighted choice among 'outcomes': O(n) to build, O(1) per sample."""
+
+    __slots__ = ("outcomes", "prob", "alias", "_arrays")
+
+    def __init__(self, outcomes, weights):
+        n = len(outcomes)
+        total = sum(weights)
+        if not n or total <= 0:
+            raise ValueError("an alias table needs at least one positive weight")
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        # Pair every under-full column with an over-full one that tops it up
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Whatever is left is full up to rounding error (prob stays 1.0)
+        self.outcomes = list(outcomes)
+        self.prob = prob
+        self.alias = alias
+        self._arrays = None
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    def sample(self, rng):
+        """One outcome, drawn with rng.random() (a random.Random)."""
+        u = rng.random() * len(self.prob)
+        i = int(u)
+        return self.outcomes[i] if u - i < self.prob[i] else self.outcomes[self.alias[i]]
+
+    def sample_many(self, rng, k) -> list:
+        outcomes, prob, alias = self.outcomes, self.prob, self.alias
+        n = len(prob)
+        drawn = []
+        for _ in range(k):
+            u = rng.random() * n
+            i = int(u)
+            drawn.append(outcomes[i] if u - i < prob[i] else outcomes[alias[i]])
+        return drawn
+
+    def sample_indices(self, np_rng, k):
+        """k outcome indices at once, from a numpy Generator. Requires numpy."""
+        if not USE_NUMPY:
+            raise ImportError("numpy is required for sample_indices")
+        if self._arrays is None:
+            self._arrays = (np.array(self.prob), np.array(self.alias))
+        prob, alias = self._arrays
+        cols = np_rng.integers(0, len(prob), size=k)
+        return np.where(np_rng.random(k) < prob[cols], cols, alias[cols])
+
+
+_TABLES = {}  # (area, enemy type, tier) -> AliasTable
+
+
+def loot_mod(area, enemy_type) -> float:
+    return AREA_DATA.get(area, {}).get("loot_mod", 1.0) * ENEMY_TYPES.get(enemy_type, {}).get("loot_mod", 1.0)
+
+
+def loot_table(area, enemy_type, tier) -> AliasTable:
+    """Drops of an 'enemy_type' beaten in 'area' at shop tier 'tier'; None = no drop."""
+    key = (area, enemy_type, tier)
+    table = _TABLES.get(key)
+    if table is None:
+        mod = loot_mod(area, enemy_type)
+        items = [it for t in sorted(CATALOG.by_tier) if t <= tier for it in CATALOG.by_tier[t]]
+        items.extend(CATALOG.by_type.get("material", ()))
+        weights = []
+        for it in items:
+            rarity = it.get("rarity", "Common")
+            weights.append(RARITY_WEIGHTS.get(rarity, 1) * mod ** (RARITY_ORDER.get(rarity, 1) - 1))
+        drop = min(DROP_CHANCE * mod, 1.0) if items else 0.0
+        total = sum(weights) or 1.0
+        table = AliasTable([None] + items, [1.0 - drop] + [drop * w / total for w in weights])
+        _TABLES[key] = table
+    return table
@@ -0,0 +1,174 @@
+# game/mass_battle.py
+"""
+Mass-battle mode for siege waves with hundreds of units per side.
+
+The normal battle path rebuilds the list of living party members for every
+attacking enemy and calls any(e.is_alive() ...) several times per round,
+which is O(enemies x party) per round. Here each side keeps an AliveSet that
+is updated when a unit dies, so picking a random target, finding the front
+enemy and checking for a winner are all O(1).
+
+Siege rules differ from a normal battle in one way: party members spill
+over to the next enemy once the front one falls, instead of idling for the
+rest of the round.
+"""
+import random
+
+from .combat import BattleOutcome, NO_ONE, WINNER_NONE, WINNER_PARTY, WINNER_ENEMIES, XP_PER_KILL, XP_PER_WAVE
+
+
+class AliveSet:
+    """Living units of one side: O(1) count, random choice and removal."""
+    __slots__ = ("units", "_pos")
+
+    def __init__(self, units=()):
+        self.units = []
+        self._pos = {}
+        for u in units:
+            if u.hp > 0:
+                self.add(u)
+
+    def __len__(self):
+        return len(self.units)
+
+    def __contains__(self, unit):
+        return id(unit) in self._pos
+
+    def add(self, unit):
+        if id(unit) not in self._pos:
+            self._pos[id(unit)] = len(self.units)
+            self.units.append(unit)
+
+    def discard(self, unit):
+        i = self._pos.pop(id(unit), None)
+        if i is None:
+            return
+        last = self.units.pop()
+        if last is not unit:
+            self.units[i] = last
+            self._pos[id(last)] = i
+
+    def choice(self, rng=random):
+        return self.units[int(rng.random() * len(self.units))]
+
+
+class MassBattle:
+    """
+    A headless battle between 'party' (Player/Companion/Pet units) and
+    'enemies'. The first unit of 'party' is treated as the leader: the
+    battle is lost when it falls, as in a normal battle.
+    """
+
+    def __init__(self, party, enemies, rng=random, effects=None):
+        self.party = list(party)
+        self.enemies = list(enemies)
+        self.rng = rng
+        self.effects = effects
+        self.leader = self.party[0]
+        # HP and cached stats are read straight from the world's columns
+        self.hp = self.leader.world.hp
+        self.stats = self.leader.world.stats
+        self.alive_party = AliveSet(self.party)
+        self.alive_enemies = AliveSet(self.enemies)
+        # id(unit) -> (its side's AliveSet, position in its side)
+        self._sides = {}
+        for side, alive in ((self.party, self.alive_party), (self.enemies, self.alive_enemies)):
+            for i, u in enumerate(side):
+                self._sides[id(u)] = (alive, i)
+        self._front = 0
+        self.rounds = 0
+        self.dealt = self.taken = self.gold = self.xp = 0
+
+    def _front_enemy(self):
+        """First living enemy in wave order (amortised O(1))."""
+        enemies, hp = self.enemies, self.hp
+        while self._front < len(enemies) and hp[enemies[self._front].eid] <= 0:
+            self._front += 1
+        return enemies[self._front] if self._front < len(enemies) else None
+
+    def _resync(self, units):
+        """Status effects changed the HP of 'units': they may have died or come back."""
+        hp, sides = self.hp, self._sides
+        for u in units:
+            side = sides.get(id(u))
+            if side is None:
+                continue  # not in this battle
+            alive, i = side
+            if hp[u.eid] > 0:
+                alive.add(u)
+                if alive is self.alive_enemies and i < self._front:
+                    self._front = i
+            else:
+                alive.discard(u)
+
+    def play_round(self):
+        self.rounds += 1
+        blocked = NO_ONE  # eids of stunned units, who skip this round
+        effects = self.effects
+        if effects is not None and (len(effects) or effects.blocked):
+            effects.advance()
+            self._resync(effects.hp_changed)
+            blocked = effects.blocked
+        hp, stats, dtype = self.hp, self.stats, self.leader.world.damage_type
+
+        # Party: everyone hits the front enemy, moving on when it falls
+        alive_enemies = self.alive_enemies
+        target = self._front_enemy()
+        if target is not None:
+            t_id = target.eid
+            t_type = dtype[t_id]
+            rand = self.rng.random
+            # nobody on the party side dies during its own attack phase
+            for m in self.alive_party.units:
+                if m.eid in blocked:
+                    continue
+                cs = stats[m.eid] or m.combat_stats
+                dmg = cs.attack
+                if m.attack_roll:
+                    dmg += int(rand() * (m.attack_roll + 1))
+                dmg *= cs.attack_row.get(t_type, 1)
+                hp[t_id] -= dmg
+                self.dealt += dmg
+                if hp[t_id] <= 0:
+                    alive_enemies.discard(target)
+                    self.gold += target.gold_drop
+                    self.xp += XP_PER_KILL
+                    target = self._front_enemy()
+                    if target is None:
+                        break
+                    t_id = target.eid
+                    t_type = dtype[t_id]
+
+        # Enemies: each living enemy hits a random living party member
+        alive_party = self.alive_party
+        if alive_enemies:
+            rand = self.rng.random
+            for e in alive_enemies.units:
+                if not alive_party:
+                    break
+                if e.eid in blocked:
+                    continue
+                units = alive_party.units
+                t = units[int(rand() * len(units))]
+                t_id = t.eid
+                dmg = e.attack * (stats[t_id] or t.combat_stats).defense_row.get(dtype[e.eid], 1)
+                hp[t_id] -= dmg
+                self.taken += dmg
+                if hp[t_id] <= 0:
+                    alive_party.discard(t)
+        else:
+            self.xp += XP_PER_WAVE
+
+    def winner(self) -> int:
+        if self.hp[self.leader.eid] <= 0:
+            return WINNER_ENEMIES
+        if not self.alive_enemies:
+            return WINNER_PARTY
+        return WINNER_NONE
+
+    def run(self, max_rounds=10000) -> BattleOutcome:
+        while self.rounds < max_rounds:
+            self.play_round()
+            if self.winner() != WINNER_NONE:
+                break
+        return BattleOutcome(self.winner(), self.rounds, self.dealt, self.taken, self.gold, self.xp)
@@ -1,8 +1,15 @@
 # game/pet.py
-from .data import colored_text, COLOR_GREEN, COLOR_RED, PET_EVOLUTIONS
-from .status_effect import StatusEffect
+from .data import PET_EVOLUTIONS
+from .combat import pet_damage
+from .combatant import Combatant
+from .progression import PET_XP_PER_LEVEL
+from .events import PetEvolved
+
+class Pet(Combatant):
+    __slots__ = ("cuteness", "_damage")
+
+    xp_per_level = PET_XP_PER_LEVEL
 
-class Pet:
     def __init__(self, name, hp=30, cuteness=100, damage=3, damage_type="Physical"):
         self.name = name
         self.hp = hp
@@ -18,39 +25,34 @@ class Pet:
 
         self.status_effects = []
 
-    def is_alive(self):
-        return self.hp > 0
-
-    def gain_xp(self, amount):
-        required_xp = 30 * self.level
-        self.xp += amount
-        if self.xp >= required_xp:
-            self.level += 1
-            self.xp = 0
-            self.hp += 5
-            self.damage += 1
-            print(colored_text(
-                f"{self.name} (Pet) leveled up to {self.level}!",
-                COLOR_GREEN
-            ))
-            self.check_evolution()
-
-    def check_evolution(self):
-        if self.name in PET_EVOLUTIONS:
+    @property
+    def damage(self):
+        return self._damage
+
+    @damage.setter
+    def damage(self, value):
+        self._damage = value
+        self.invalidate_stats()
+
+    def base_attack(self) -> int:
+        return pet_damage(self)
+
+    def level_gains(self, levels):
+        gains = {"HP": 5 * levels, "Damage": levels}
+        self.hp += gains["HP"]
+        self.damage += gains["Damage"]
+        return gains, self.check_evolution()
+
+    def check_evolution(self) -> list:
+        """Evolve (possibly several stages after a big level jump); returns PetEvolved events."""
+        logs = []
+        while self.name in PET_EVOLUTIONS:
             evo_name, evo_level, evo_stats = PET_EVOLUTIONS[self.name]
-            if self.level >= evo_level:
-                old_name = self.name
-                self.name = evo_name
-                self.hp += evo_stats["hp_bonus"]
-                self.damage += evo_stats["damage_bonus"]
-                print(colored_text(
-                    f"{old_name} evolved into {self.name}!",
-                    COLOR_RED
-                ))
-                del PET_EVOLUTIONS[old_name]
-
-    def process_status_effects(self):
-        for eff in self.status_effects[:]:
-            eff.apply_effect(self)
-            if eff.duration <= 0:
-                self.status_effects.remove(eff)
+            if self.level < evo_level:
+                break
+            old_name = self.name
+            self.name = evo_name
+            self.hp += evo_stats["hp_bonus"]
+            self.damage += evo_stats["damage_bonus"]
+            logs.append(PetEvolved(old_name, self.name))
+        return logs
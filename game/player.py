@@ -1,14 +1,34 @@
 # game/player.py
-from .data import (
-    colored_text,
-    COLOR_GREEN, COLOR_YELLOW, 
-    TALENT_TREES, SKILLS
-)
-from .status_effect import StatusEffect
+from .data import TALENT_TREES
 from .companion import Companion
 from .pet import Pet
+from .combat import calculate_damage
+from .combatant import Combatant, TrackedStats
+from .progression import LevelUpSummary, PLAYER_XP_PER_LEVEL
+from .decisions import TERMINAL
+from .inventory import Inventory
+from .items import item_ref, item_from_ref
+from .events import TalentLearned
+
+CLASS_BASE_STATS = {
+    "Warrior": {"Strength": 10, "Magic": 2,  "Agility": 5},
+    "Mage":    {"Strength": 2,  "Magic": 10, "Agility": 5},
+    "Thief":   {"Strength": 5,  "Magic": 4,  "Agility": 10},
+    "Cleric":  {"Strength": 4,  "Magic": 8,  "Agility": 6},
+}
+
+def talent_labels(talents) -> list:
+    return [f"{t['name']} - {t['description']}" for t in talents]
+
+
+class Player(Combatant):
+    __slots__ = (
+        "player_class", "karma", "gold", "max_mana", "mana", "_stats",
+        "inventory", "companions", "pets", "skills", "talent_points",
+    )
+
+    xp_per_level = PLAYER_XP_PER_LEVEL
 
-class Player:
     def __init__(self, name, player_class):
         self.name = name
         self.player_class = player_class
@@ -24,7 +44,7 @@ class Player:
         self.init_class_stats()
         self.init_damage_type()
 
-        self.inventory = []
+        self.inventory = Inventory()
         self.companions = []
         self.pets = []
 
@@ -34,17 +54,13 @@ class Player:
 
         self.skills = []
         self.load_class_skills()
+        self.talent_points = 0
 
         self.status_effects = []
 
     def init_class_stats(self):
-        base_stats = {
-            "Warrior": {"Strength": 10, "Magic": 2,  "Agility": 5},
-            "Mage":    {"Strength": 2,  "Magic": 10, "Agility": 5},
-            "Thief":   {"Strength": 5,  "Magic": 4,  "Agility": 10},
-            "Cleric":  {"Strength": 4,  "Magic": 8,  "Agility": 6},
-        }
-        self.stats = base_stats.get(self.player_class, {"Strength":5,"Magic":5,"Agility":5})
+        base = CLASS_BASE_STATS.get(self.player_class, {"Strength":5,"Magic":5,"Agility":5})
+        self.stats = dict(base)
 
     def init_damage_type(self):
         mapping = {
@@ -62,43 +78,88 @@ class Player:
             self.skills = ["Fireball"]
         # etc.
 
-    def is_alive(self):
-        return self.hp > 0
+    @property
+    def stats(self):
+        return self._stats
 
-    def process_status_effects(self):
-        for eff in self.status_effects[:]:
-            eff.apply_effect(self)
-            if eff.duration <= 0:
-                self.status_effects.remove(eff)
+    @stats.setter
+    def stats(self, value):
+        self._stats = TrackedStats(self, value)
+        self.invalidate_stats()
 
-    def gain_xp(self, amount):
-        self.xp += amount
-        required = 100 * self.level
-        if self.xp >= required:
-            self.level_up()
+    def fork(self, memo=None):
+        """
+        Copy with its own stats, lists, companions and pets. Item dicts are
+        never modified in place (buying, equipping and crafting only move
+        them between lists), so both copies keep referencing the same ones.
+        """
+        if memo is None:
+            memo = {}
+        if id(self) in memo:
+            return memo[id(self)]
+        twin = super().fork(memo)
+        twin._stats = TrackedStats(twin, self._stats)
+        twin.inventory = self.inventory.copy()
+        twin.skills = self.skills[:]
+        twin.companions = [c.fork(memo) for c in self.companions]
+        twin.pets = [p.fork(memo) for p in self.pets]
+        return twin
 
-    def level_up(self):
-        self.level += 1
-        self.xp = 0
-        print(colored_text(f"\n*** {self.name} has leveled up to {self.level}! ***", COLOR_GREEN))
-        for stat in self.stats:
-            self.stats[stat] += 1
-        self.pick_talent()
+    def base_attack(self) -> int:
+        return calculate_damage(self)
 
-    def pick_talent(self):
-        talents = TALENT_TREES.get(self.player_class, [])
+    def base_agility(self) -> int:
+        return self.stats.get("Agility", 5)
+
+    def gain_xp(self, amount, pick_talents=True, decisions=None) -> LevelUpSummary:
+        """
+        Add XP and apply every level-up it pays for at once; overflow XP
+        carries over. Each level-up asks 'decisions' (the terminal by
+        default) for a talent; the TalentLearned events end up in the
+        summary's notes. With pick_talents=False, or a deferred provider,
+        the picks are banked in talent_points instead.
+        """
+        summary = super().gain_xp(amount)
+        if summary.levels:
+            decisions = decisions if decisions is not None else TERMINAL
+            if pick_talents and not decisions.deferred:
+                learned = [self.pick_talent(decisions) for _ in range(summary.levels)]
+                summary = summary._replace(notes=summary.notes + tuple(ev for ev in learned if ev))
+            else:
+                self.talent_points += summary.levels
+        return summary
+
+    def level_gains(self, levels):
+        """Every stat goes up by 1 per level."""
+        gains = {stat: levels for stat in self.stats}
+        self.stats.update({stat: v + levels for stat, v in self.stats.items()})
+        return gains, ()
+
+    def talents(self) -> list:
+        return TALENT_TREES.get(self.player_class, [])
+
+    def pick_talent(self, decisions=None):
+        """Ask 'decisions' for one talent and learn it; returns TalentLearned, or None if skipped."""
+        talents = self.talents()
         if not talents:
-            return
-        print("\nChoose a talent:")
-        for i, t in enumerate(talents, start=1):
-            print(f"{i}. {t['name']} - {t['description']}")
-        choice = input("Pick # or 'skip': ").strip()
-        if choice.isdigit():
-            idx = int(choice)-1
-            if 0 <= idx < len(talents):
-                talent = talents[idx]
-                talent["effect"](self)
-                print(colored_text(f"You gained the talent: {talent['name']}", COLOR_YELLOW))
+            return None
+        decisions = decisions if decisions is not None else TERMINAL
+        return self.learn_talent(decisions.choose("Choose a talent:", talent_labels(talents)))
+
+    async def apick_talent(self, decisions):
+        """pick_talent for providers that answer asynchronously."""
+        talents = self.talents()
+        if not talents:
+            return None
+        return self.learn_talent(await decisions.achoose("Choose a talent:", talent_labels(talents)))
+
+    def learn_talent(self, index):
+        talents = self.talents()
+        if index is None or not 0 <= index < len(talents):
+            return None
+        talent = talents[index]
+        talent["effect"](self)
+        return TalentLearned(self.name, talent["name"])
 
     def to_dict(self):
         return {
@@ -112,14 +173,16 @@ class Player:
             "mana": self.mana,
             "max_mana": self.max_mana,
             "stats": self.stats,
-            "inventory": self.inventory,
+            "inventory": self.inventory.to_list(),
+            "inventory_sort": self.inventory.sorted_by,
             "companions": [self.companion_to_dict(c) for c in self.companions],
             "pets": [self.pet_to_dict(p) for p in self.pets],
-            "equipped_weapon": self.equipped_weapon,
-            "equipped_armor": self.equipped_armor,
-            "equipped_relic": self.equipped_relic,
+            "equipped_weapon": item_ref(self.equipped_weapon),
+            "equipped_armor": item_ref(self.equipped_armor),
+            "equipped_relic": item_ref(self.equipped_relic),
             "skills": self.skills,
             "damage_type": self.damage_type,
+            "talent_points": self.talent_points,
         }
 
     def companion_to_dict(self, c: Companion):
@@ -132,9 +195,9 @@ class Player:
             "damage_type": c.damage_type,
             "level": c.level,
             "xp": c.xp,
-            "equipped_weapon": c.equipped_weapon,
-            "equipped_armor": c.equipped_armor,
-            "equipped_relic": c.equipped_relic,
+            "equipped_weapon": item_ref(c.equipped_weapon),
+            "equipped_armor": item_ref(c.equipped_armor),
+            "equipped_relic": item_ref(c.equipped_relic),
         }
 
     def pet_to_dict(self, p: Pet):
@@ -146,9 +209,9 @@ class Player:
             "damage_type": p.damage_type,
             "level": p.level,
             "xp": p.xp,
-            "equipped_weapon": p.equipped_weapon,
-            "equipped_armor": p.equipped_armor,
-            "equipped_relic": p.equipped_relic,
+            "equipped_weapon": item_ref(p.equipped_weapon),
+            "equipped_armor": item_ref(p.equipped_armor),
+            "equipped_relic": item_ref(p.equipped_relic),
         }
 
     @staticmethod
@@ -166,7 +229,8 @@ class Player:
         p.mana = data.get("mana", 10)
         p.max_mana = data.get("max_mana", 10)
         p.stats = data["stats"]
-        p.inventory = data["inventory"]
+        p.inventory = Inventory.from_list(data["inventory"])
+        p.inventory.sort_by(data.get("inventory_sort"))
         # Rebuild companions
         for cdict in data["companions"]:
             c = Companion(
@@ -176,9 +240,9 @@ class Player:
             )
             c.level = cdict["level"]
             c.xp = cdict["xp"]
-            c.equipped_weapon = cdict["equipped_weapon"]
-            c.equipped_armor = cdict["equipped_armor"]
-            c.equipped_relic = cdict["equipped_relic"]
+            c.equipped_weapon = item_from_ref(cdict["equipped_weapon"])
+            c.equipped_armor = item_from_ref(cdict["equipped_armor"])
+            c.equipped_relic = item_from_ref(cdict["equipped_relic"])
             p.companions.append(c)
         # Rebuild pets
         for pdict in data["pets"]:
@@ -188,15 +252,16 @@ class Player:
             )
             pt.level = pdict["level"]
             pt.xp = pdict["xp"]
-            pt.equipped_weapon = pdict["equipped_weapon"]
-            pt.equipped_armor = pdict["equipped_armor"]
-            pt.equipped_relic = pdict["equipped_relic"]
+            pt.equipped_weapon = item_from_ref(pdict["equipped_weapon"])
+            pt.equipped_armor = item_from_ref(pdict["equipped_armor"])
+            pt.equipped_relic = item_from_ref(pdict["equipped_relic"])
             p.pets.append(pt)
 
-        p.equipped_weapon = data["equipped_weapon"]
-        p.equipped_armor = data["equipped_armor"]
-        p.equipped_relic = data["equipped_relic"]
+        p.equipped_weapon = item_from_ref(data["equipped_weapon"])
+        p.equipped_armor = item_from_ref(data["equipped_armor"])
+        p.equipped_relic = item_from_ref(data["equipped_relic"])
         p.skills = data.get("skills", [])
         p.damage_type = data.get("damage_type", "Physical")
+        p.talent_points = data.get("talent_points", 0)
 
         return p
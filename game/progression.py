@@ -0,0 +1,74 @@
+# game/progression.py
+"""
+Closed-form XP application.
+
+Going from level L to L+1 costs per_level * L XP (100/50/30 for player,
+companion and pet). Reaching L+n from L therefore costs
+per_level * (n*L + n*(n-1)/2), so the number of level-ups for any XP total
+is the integer root of a quadratic and no per-level loop is needed.
+"""
+from collections import namedtuple
+from math import isqrt
+
+from .events import LevelUp
+
+PLAYER_XP_PER_LEVEL = 100
+COMPANION_XP_PER_LEVEL = 50
+PET_XP_PER_LEVEL = 30
+
+# Result of one gain_xp call: levels gained, the new level, leftover XP
+# toward the next level, the stat increases that were applied and any extra
+# events (e.g. a pet evolving).
+LevelUpSummary = namedtuple("LevelUpSummary", ["name", "levels", "level", "xp", "gains", "notes"])
+
+
+def xp_to_advance(level, n, per_level) -> int:
+    """XP needed to go from 'level' up 'n' levels."""
+    return per_level * (n * level + n * (n - 1) // 2)
+
+
+def levels_for_xp(level, xp, per_level):
+    """
+    How many levels 'xp' buys starting at 'level', and the XP left over.
+    Solves per_level * (n*L + n*(n-1)/2) <= xp for the largest integer n.
+    """
+    if xp <= 0 or per_level <= 0:
+        return 0, xp
+    budget = xp // per_level
+    b = 2 * level - 1
+    n = (isqrt(b * b + 8 * budget) - b) // 2
+    # isqrt floors, so n is exact or one short at most; nudge to be sure
+    while xp_to_advance(level, n + 1, per_level) <= xp:
+        n += 1
+    while n > 0 and xp_to_advance(level, n, per_level) > xp:
+        n -= 1
+    return n, xp - xp_to_advance(level, n, per_level)
+
+
+def level_up_logs(summary, label="") -> list:
+    """Events for a LevelUpSummary (empty if nothing happened)."""
+    if not summary.levels:
+        return []
+    logs = [LevelUp(summary.name, label, summary.levels, summary.level, summary.gains)]
+    logs.extend(summary.notes)
+    return logs
+
+
+def grant_xp(units, amount) -> list[LevelUpSummary]:
+    """
+    XP system: give 'amount' XP to each of 'units' (Combatant views) working
+    on the world's level/xp columns, with all level-ups applied at once.
+    Kind-specific stat gains come from each unit's level_gains().
+    """
+    out = []
+    for u in units:
+        world, eid = u.world, u.eid
+        level_col, xp_col = world.level, world.xp
+        levels, xp_col[eid] = levels_for_xp(level_col[eid], xp_col[eid] + amount, u.xp_per_level)
+        gains, notes = {}, ()
+        if levels:
+            level_col[eid] += levels
+            world.stats[eid] = None
+            gains, notes = u.level_gains(levels)
+        out.append(LevelUpSummary(u.name, levels, level_col[eid], xp_col[eid], gains, tuple(notes)))
+    return out
@@ -0,0 +1,321 @@
+# game/replay.py
+"""
+Session recording and headless replay.
+
+A Recorder wraps a seeded Game and logs every state-changing command
+called through it (battles, shop, crafting, skills, ...) together with the
+answers its decision provider gave (talent picks). Because all randomness
+comes from the session RNG, the seed plus that log is enough to rebuild the
+session exactly: replay() re-runs it with scripted answers and checks the
+final state hash.
+
+Log file format (JSON lines): a header {"seed": ..., "hash": ...,
+"deferred": ...} (whether the recorded provider banked its picks) followed
+by one [command, args], [command, args, answers] or
+[command, args, answers, kwargs] entry per call, where answers are option
+indices (null = skipped) and kwargs the keyword arguments, if any.
+
+Arguments that are game objects are written as references, each a
+one-key object:
+
+  {"$unit": ["player"]}, ["companion", i], ["pet", i] or ["enemy", i]
+                        a party member, or an enemy of current_enemies
+  {"$enemy": k}         the k-th enemy the session has handed out or taken
+                        in (returned by get_enemy_wave, or passed in fresh)
+  {"$new": [type, turn]} a fresh Enemy(type, turn), which becomes the next k
+  {"$effect": [name, duration, effect type, value]}  a new StatusEffect
+  {"$recipe": name}     a CRAFTING_RECIPES entry
+
+An argument that is none of these and not plain JSON is rejected when the
+command is called, not when the log is saved. A successful load_game_slot
+is recorded as load_state with the state it loaded, so the replay does not
+need the save file.
+
+    rec = Recorder(seed=42)
+    rec.start_new_game("Hero", "1")
+    rec.normal_battle()
+    rec.save("session.jsonl")
+
+    python -m game.replay session.jsonl
+"""
+import argparse
+import hashlib
+import json
+import time
+
+from .game import Game
+from .data import CRAFTING_RECIPES, ENEMY_TYPES
+from .decisions import TerminalDecisions, ScriptedDecisions, RecordingDecisions
+from .enemy import Enemy
+from .events import GameLoaded
+from .status_effect import StatusEffect
+
+# Public Game methods that change the session state (the RNG included)
+COMMANDS = frozenset([
+    "start_new_game", "next_turn", "fast_forward", "random_event_check",
+    "special_merchant", "merchant_buy_secret_potion", "hidden_trap",
+    "gain_random_relic", "travel_to_area", "normal_battle", "special_battle",
+    "siege_battle", "initiative_battle", "get_enemy_wave", "battle_enemies",
+    "set_current_enemies", "roll_loot", "roll_horde_loot", "party_attack",
+    "enemies_attack", "add_status_effect", "simulate_battle", "distribute_xp",
+    "spend_talent_points", "use_skill", "auto_equip_all", "auto_equip_character",
+    "use_item", "buy_item_from_shop", "sell_item", "hire_companion", "hire_pet",
+    "cheat_code", "check_for_new_tier", "load_state", "craft_item_by_name",
+    "do_craft", "sort_inventory",
+])
+
+# Public Game methods that leave the session state alone. A Recorder
+# refuses any other public method, so a new mutator cannot slip past it.
+READ_ONLY = frozenset([
+    "is_game_over", "show_area_info", "calculate_damage", "can_equip", "list_shop_inventory",
+    "list_player_inventory", "fork", "state_dict", "save_game_slot",
+    "list_crafting_recipes", "show_crafting_tree", "can_craft", "max_craftable",
+    "show_help", "display_stats_table",
+])
+
+# Async commands, logged as the sync command they match (a replay answers
+# from a script, so it never needs to await)
+ASYNC_COMMANDS = {"aspend_talent_points": "spend_talent_points"}
+
+_RECIPE_NAMES = {id(recipe): name for name, recipe in CRAFTING_RECIPES.items()}
+
+
+def state_hash(game) -> str:
+    """SHA-256 over the saved state plus what a save file leaves out."""
+    state = game.state_dict()
+    state["running"] = game.running
+    state["enemies"] = [[e.name, e.hp] for e in game.current_enemies]
+    state["effects"] = [game.effects.turn, len(game.effects)]
+    blob = json.dumps(state, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+class SessionLog:
+    """Seed, recorded commands and (once finished) the final state hash."""
+
+    def __init__(self, seed, entries=None, final_hash=None, deferred=False):
+        self.seed = seed
+        self.entries = entries if entries is not None else []
+        self.final_hash = final_hash
+        self.deferred = deferred
+
+    def __len__(self):
+        return len(self.entries)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            header = {"seed": self.seed, "hash": self.final_hash, "deferred": self.deferred}
+            f.write(json.dumps(header) + "\n")
+            for entry in self.entries:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    @staticmethod
+    def load(path):
+        with open(path) as f:
+            header = json.loads(f.readline())
+            entries = [json.loads(line) for line in f if line.strip()]
+        return SessionLog(header["seed"], entries, header.get("hash"), header.get("deferred", False))
+
+
+class Recorder:
+    """
+    A Game stand-in that records commands. Attribute access falls through
+    to the wrapped game, so it can be used wherever a Game is driven.
+    """
+
+    def __init__(self, seed=None, decisions=None):
+        inner = decisions if decisions is not None else TerminalDecisions()
+        self.game = Game(seed, RecordingDecisions(inner))
+        self.log = SessionLog(self.game.seed, deferred=inner.deferred)
+        self.enemies = []  # the "$enemy" table, see the module docstring
+        self._enemy_ids = {}  # id(enemy) -> its index in self.enemies
+
+    def __getattr__(self, name):
+        attr = getattr(self.game, name)
+        if name in ASYNC_COMMANDS:
+            async def acommand(*args, **kwargs):
+                entry = self._entry(ASYNC_COMMANDS[name], args, kwargs)
+                result = await attr(*args, **kwargs)
+                self._log(entry)
+                return result
+            return acommand
+        if name not in COMMANDS:
+            if name in READ_ONLY or name.startswith("_") or not hasattr(Game, name):
+                return attr
+            raise TypeError(f"Game.{name} is not recordable; add it to replay.COMMANDS or READ_ONLY")
+
+        def command(*args, **kwargs):
+            entry = self._entry(name, args, kwargs)
+            result = attr(*args, **kwargs)
+            self._log(entry)
+            _register_enemies(result, self.enemies, self._enemy_ids)
+            return result
+        return command
+
+    def load_game_slot(self, slot):
+        """Game.load_game_slot, recorded as a load_state of what it loaded."""
+        logs = self.game.load_game_slot(slot)
+        if any(isinstance(log, GameLoaded) for log in logs):
+            self._log(["load_state", [self.game.state_dict()]])
+        return logs
+
+    def _entry(self, name, args, kwargs):
+        """The log entry for a call, with its arguments encoded before it runs."""
+        enc = lambda value: encode_arg(value, self.game, self.enemies, self._enemy_ids)
+        entry = [name, [enc(a) for a in args]]
+        if kwargs:
+            entry.append({k: enc(v) for k, v in kwargs.items()})
+        return entry
+
+    def _log(self, entry):
+        answers = self.game.decisions.answers
+        kwargs = entry[2:]
+        del entry[2:]
+        if answers or kwargs:
+            entry.append(answers[:])
+            answers.clear()
+        entry.extend(kwargs)
+        self.log.entries.append(entry)
+
+    def finish(self) -> SessionLog:
+        """Stamp the current state hash on the log and return it."""
+        self.log.final_hash = state_hash(self.game)
+        return self.log
+
+    def save(self, path):
+        self.finish().save(path)
+
+
+def _register_enemies(value, enemies, enemy_ids):
+    """Give every Enemy in 'value' (a command result) the next "$enemy" index."""
+    if isinstance(value, list):
+        for e in value:
+            if isinstance(e, Enemy) and id(e) not in enemy_ids:
+                enemy_ids[id(e)] = len(enemies)
+                enemies.append(e)
+
+
+def _unit_ref(value, game):
+    player = game.player
+    if value is player:
+        return ["player"]
+    for kind, units in (("companion", player.companions if player else ()),
+                        ("pet", player.pets if player else ()),
+                        ("enemy", game.current_enemies)):
+        for i, u in enumerate(units):
+            if u is value:
+                return [kind, i]
+    return None
+
+
+def encode_arg(value, game, enemies, enemy_ids):
+    """JSON form of a command argument (see the module docstring); TypeError if it has none."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [encode_arg(v, game, enemies, enemy_ids) for v in value]
+    if isinstance(value, StatusEffect):
+        if value.expires_at is not None or value.slot is not None:
+            raise TypeError("only a new StatusEffect can be recorded, not one already in effect")
+        return {"$effect": [value.name, value.duration, value.effect_type, value.value]}
+    if isinstance(value, dict):
+        if id(value) in _RECIPE_NAMES:
+            return {"$recipe": _RECIPE_NAMES[id(value)]}
+        if all(isinstance(k, str) and not k.startswith("$") for k in value):
+            return {k: encode_arg(v, game, enemies, enemy_ids) for k, v in value.items()}
+    k = enemy_ids.get(id(value))
+    if k is not None:
+        return {"$enemy": k}
+    ref = _unit_ref(value, game)
+    if ref is not None:
+        return {"$unit": ref}
+    if isinstance(value, Enemy):
+        fresh = _fresh_enemy_args(value)
+        if fresh is None:
+            raise TypeError(f"{value.name} has fought already; only fresh enemies can be recorded")
+        enemy_ids[id(value)] = len(enemies)
+        enemies.append(value)
+        return {"$new": fresh}
+    raise TypeError(f"cannot record an argument of type {type(value).__name__}")
+
+
+def _fresh_enemy_args(enemy):
+    """[type, turn] such that Enemy(type, turn) equals 'enemy', or None."""
+    data = ENEMY_TYPES.get(enemy.name)
+    if data is None or (enemy.hp - data["base_hp"]) % 5:
+        return None
+    turn = (enemy.hp - data["base_hp"]) // 5
+    twin = Enemy(enemy.name, turn)
+    same = (twin.attack, twin.gold_drop, twin.agility, twin.damage_type, twin.status_effects)
+    if turn < 0 or same != (enemy.attack, enemy.gold_drop, enemy.agility, enemy.damage_type, enemy.status_effects):
+        return None
+    return [enemy.name, turn]
+
+
+def decode_arg(value, game, enemies, enemy_ids):
+    """Inverse of encode_arg on the replaying game."""
+    if isinstance(value, list):
+        return [decode_arg(v, game, enemies, enemy_ids) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        (tag, data), = value.items()
+        if tag == "$unit":
+            if data[0] == "player":
+                return game.player
+            units = {"companion": game.player.companions if game.player else [],
+                     "pet": game.player.pets if game.player else [],
+                     "enemy": game.current_enemies}[data[0]]
+            return units[data[1]]
+        if tag == "$enemy":
+            return enemies[data]
+        if tag == "$new":
+            enemy = Enemy(*data)
+            enemy_ids[id(enemy)] = len(enemies)
+            enemies.append(enemy)
+            return enemy
+        if tag == "$effect":
+            return StatusEffect(*data)
+        if tag == "$recipe":
+            return CRAFTING_RECIPES[data]
+    return {k: decode_arg(v, game, enemies, enemy_ids) for k, v in value.items()}
+
+
+def replay(log) -> Game:
+    """Re-run a SessionLog on a fresh Game, answering choices from the log."""
+    game = Game(log.seed)
+    enemies = []
+    enemy_ids = {}
+    for entry in log.entries:
+        name, args = entry[0], entry[1]
+        if name not in COMMANDS:
+            raise ValueError(f"not a recordable command: {name}")
+        game.decisions = ScriptedDecisions(entry[2] if len(entry) > 2 else (), deferred=log.deferred)
+        args = decode_arg(args, game, enemies, enemy_ids)
+        kwargs = decode_arg(entry[3], game, enemies, enemy_ids) if len(entry) > 3 else {}
+        result = getattr(game, name)(*args, **kwargs)
+        _register_enemies(result, enemies, enemy_ids)
+    return game
+
+
+def verify(log) -> bool:
+    """Replay 'log' and compare the final state with the recorded hash."""
+    return state_hash(replay(log)) == log.final_hash
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a recorded session and check its final state")
+    parser.add_argument("log")
+    parser.add_argument("--repeat", type=int, default=1, help="replay N times (perf workload)")
+    args = parser.parse_args()
+
+    log = SessionLog.load(args.log)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        game = replay(log)
+    elapsed = time.perf_counter() - start
+    ok = state_hash(game) == log.final_hash
+    print(f"{len(log)} commands x {args.repeat}: {elapsed:.3f}s "
+          f"({len(log) * args.repeat / elapsed:,.0f} commands/s)")
+    print("state hash OK" if ok else "state hash MISMATCH")
+    raise SystemExit(0 if ok else 1)
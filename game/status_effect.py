@@ -1,34 +1,159 @@
 # game/status_effect.py
-from .data import colored_text, COLOR_GREEN, COLOR_RED
+from collections import namedtuple
+
+from .data import colored_text, COLOR_GREEN, COLOR_RED, COLOR_YELLOW
+
+# One aggregated record per effect type and turn: how many ticks fired,
+# the summed HP change and who was hit. Like the records in events.py it is
+# only formatted (through the type's describe()) when str() is called.
+class EffectEvent(namedtuple("EffectEvent", ["effect_type", "count", "total", "targets"])):
+    __slots__ = ()
+
+    def __str__(self):
+        return EFFECT_TYPES[self.effect_type].describe(self)
+
+
+class EffectType:
+    """
+    How one kind of status effect behaves.
+
+    apply(pairs) applies one turn of the effect to every (effect, target)
+    pair in 'pairs' and returns the summed HP change. Types without apply
+    (e.g. "stun") do nothing to HP.
+    describe(event) turns an EffectEvent into a log line.
+    speed multiplies the action speed of an affected combatant (haste/slow).
+    blocks_action: an affected combatant does not act on the turns the
+    effect is active (stun).
+    """
+    __slots__ = ("name", "apply", "describe", "speed", "blocks_action")
+
+    def __init__(self, name, apply=None, describe=None, speed=1.0, blocks_action=False):
+        self.name = name
+        self.apply = apply
+        self.describe = describe
+        self.speed = speed
+        self.blocks_action = blocks_action
+
+    @property
+    def periodic(self) -> bool:
+        return self.apply is not None
+
+
+EFFECT_TYPES = {}
+
+
+def register_effect_type(name, apply=None, describe=None, speed=1.0, blocks_action=False) -> EffectType:
+    """Add (or replace) an effect type in the registry."""
+    if describe is None:
+        describe = lambda ev: f"{ev.effect_type}: {ev.count} effect(s) on {', '.join(ev.targets)}"
+    et = EFFECT_TYPES[name] = EffectType(name, apply, describe, speed, blocks_action)
+    return et
+
+
+def is_periodic(effect_type) -> bool:
+    et = EFFECT_TYPES.get(effect_type)
+    return et is not None and et.periodic
+
+
+def blocks_action(effect_type) -> bool:
+    et = EFFECT_TYPES.get(effect_type)
+    return et is not None and et.blocks_action
+
+
+def speed_factor(status_effects) -> float:
+    """Combined haste/slow multiplier of a list of active effects."""
+    factor = 1.0
+    for eff in status_effects:
+        et = EFFECT_TYPES.get(eff.effect_type)
+        if et is not None:
+            factor *= et.speed
+    return factor
+
+
+def _damage(pairs):
+    total = 0
+    for eff, target in pairs:
+        target.hp -= eff.value
+        total -= eff.value
+    return total
+
+
+def _heal(pairs):
+    total = 0
+    for eff, target in pairs:
+        target.hp += eff.value
+        total += eff.value
+    return total
+
+
+register_effect_type(
+    "poison", _damage,
+    lambda ev: colored_text(f"Poison deals {-ev.total} damage to {', '.join(ev.targets)}.", COLOR_GREEN),
+)
+register_effect_type(
+    "burn", _damage,
+    lambda ev: colored_text(f"Burns deal {-ev.total} damage to {', '.join(ev.targets)}.", COLOR_RED),
+)
+register_effect_type(
+    "regen", _heal,
+    lambda ev: colored_text(f"{', '.join(ev.targets)} regenerate {ev.total} HP.", COLOR_GREEN),
+)
+register_effect_type(
+    "stun", None,
+    lambda ev: colored_text(f"{', '.join(ev.targets)} stunned.", COLOR_YELLOW),
+    blocks_action=True,
+)
+register_effect_type("haste", speed=1.5)
+register_effect_type("slow", speed=0.5)
+
 
 class StatusEffect:
+    __slots__ = ("name", "duration", "effect_type", "value", "expires_at", "slot")
+
     def __init__(self, name, duration, effect_type, value=0):
         self.name = name
         self.duration = duration
-        self.effect_type = effect_type  # "poison", "burn", "stun", "regen", etc.
+        self.effect_type = effect_type  # key into EFFECT_TYPES: "poison", "burn", "stun", "regen", etc.
         self.value = value
+        # Set by StatusEffectManager while it owns the effect
+        self.expires_at = None
+        self.slot = None
+
+    def clone(self):
+        twin = StatusEffect.__new__(StatusEffect)
+        twin.name = self.name
+        twin.duration = self.duration
+        twin.effect_type = self.effect_type
+        twin.value = self.value
+        twin.expires_at = self.expires_at
+        twin.slot = self.slot
+        return twin
 
-    def apply_effect(self, target):
-        """Apply the effect each turn to 'target'."""
-        if self.effect_type == "poison":
-            target.hp -= self.value
-            print(colored_text(
-                f"{target.name} takes {self.value} poison damage! (HP: {target.hp})",
-                COLOR_GREEN
-            ))
-        elif self.effect_type == "burn":
-            target.hp -= self.value
-            print(colored_text(
-                f"{target.name} suffers {self.value} burn damage! (HP: {target.hp})",
-                COLOR_RED
-            ))
-        elif self.effect_type == "regen":
-            old_hp = target.hp
-            target.hp += self.value
-            print(colored_text(
-                f"{target.name} regenerates {self.value} HP! (from {old_hp} to {target.hp})",
-                COLOR_GREEN
-            ))
+    def tick(self, target):
+        """
+        Apply one turn of the effect to 'target' without any output.
+        Returns the HP change (negative for damage, positive for healing).
+        """
+        delta = 0
+        et = EFFECT_TYPES.get(self.effect_type)
+        if et is not None and et.periodic:
+            delta = et.apply(((self, target),))
 
         # Decrement duration
         self.duration -= 1
+        return delta
+
+    def apply_effect(self, target) -> list:
+        """Apply the effect each turn to 'target'; returns its EffectEvent (if any)."""
+        delta = self.tick(target)
+        if is_periodic(self.effect_type) or blocks_action(self.effect_type):
+            return [EffectEvent(self.effect_type, 1, delta, (target.name,))]
+        return []
+
+
+def fork_effect(effect, memo):
+    """Clone a StatusEffect once per fork (see Combatant.fork)."""
+    twin = memo.get(id(effect))
+    if twin is None:
+        twin = memo[id(effect)] = effect.clone()
+    return twin
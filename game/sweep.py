@@ -0,0 +1,208 @@
+# game/sweep.py
+"""
+Balance sweep over every class x gear tier x area x turn.
+
+The grid is sharded across a process pool. Every cell draws from its own
+NumPy SeedSequence child keyed by the cell itself, so results do not depend
+on how cells were spread over workers and a resumed run produces the same
+numbers. Battles are simulated in chunks with
+batch_sim and folded into running (Welford) statistics, so no more than
+one chunk of battles is in memory per worker.
+
+Results are appended to a CSV table as shards finish; re-running with the
+same output file skips the cells already written (only rows with every
+column count; a line cut off by an interrupted run is dropped first).
+
+Run from the repo root:  python -m game.sweep --out sweep.csv
+"""
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .data import AREA_DATA
+from .catalog import CATALOG
+from .player import Player, CLASS_BASE_STATS
+from . import batch_sim
+
+COLUMNS = [
+    "class", "tier", "area", "turn", "battles",
+    "win_rate", "rounds_mean", "rounds_std", "gold_mean", "xp_mean",
+]
+
+
+class RunningStats:
+    """Streaming mean/variance (Welford), mergeable across chunks."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push_array(self, values):
+        """Fold a whole NumPy array in at once (Chan et al. merge)."""
+        n_b = len(values)
+        if not n_b:
+            return
+        mean_b = float(values.mean())
+        m2_b = float(((values - mean_b) ** 2).sum())
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * self.n * n_b / n
+        self.n = n
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return self.variance ** 0.5
+
+
+def build_grid(turns=range(1, 101)):
+    """Every (class, tier, area, turn) cell, in a fixed order."""
+    return [
+        (cls, tier, area, turn)
+        for cls in CLASS_BASE_STATS
+        for tier in sorted(CATALOG.by_tier)
+        for area in AREA_DATA
+        for turn in turns
+    ]
+
+
+def geared_player(player_class, tier):
+    """A fresh level-1 player wearing the best tier gear their class can use."""
+    player = Player("Sweep", player_class)
+    for slot, key, stat in (("weapon", "equipped_weapon", "damage"),
+                            ("armor", "equipped_armor", "defense")):
+        usable = CATALOG.find(type=slot, tier=tier, player_class=player_class)
+        if usable:
+            setattr(player, key, max(usable, key=lambda it: it.get(stat, 0)))
+    return player
+
+
+def cell_rng(cell, seed):
+    """Independent generator for one cell, stable across runs and shardings."""
+    player_class, tier, area, turn = cell
+    key = (list(CLASS_BASE_STATS).index(player_class), tier, list(AREA_DATA).index(area), turn)
+    np = batch_sim.np
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=key))
+
+
+def run_cell(cell, seed, battles, chunk):
+    """Simulate one grid cell and return its results row."""
+    player_class, tier, area, turn = cell
+    player = geared_player(player_class, tier)
+    rng = cell_rng(cell, seed)
+    wins, rounds, gold, xp = RunningStats(), RunningStats(), RunningStats(), RunningStats()
+    done = 0
+    while done < battles:
+        n = min(chunk, battles - done)
+        res = batch_sim.simulate(player, turn, n, area=area, rng=rng)
+        wins.push_array(res.won.astype(float))
+        rounds.push_array(res.rounds.astype(float))
+        gold.push_array(res.gold.astype(float))
+        xp.push_array(res.xp.astype(float))
+        done += n
+    return {
+        "class": player_class, "tier": tier, "area": area, "turn": turn,
+        "battles": battles,
+        "win_rate": round(wins.mean, 6),
+        "rounds_mean": round(rounds.mean, 4),
+        "rounds_std": round(rounds.std, 4),
+        "gold_mean": round(gold.mean, 4),
+        "xp_mean": round(xp.mean, 4),
+    }
+
+
+def run_shard(shard, seed, battles, chunk):
+    """Worker entry point: 'shard' is a list of grid cells."""
+    return [run_cell(cell, seed, battles, chunk) for cell in shard]
+
+
+def _cell_key(row):
+    return (row["class"], int(row["tier"]), row["area"], int(row["turn"]))
+
+
+def _complete_lines(f) -> list:
+    """The lines of 'f' up to the last newline; an unterminated tail was cut short."""
+    lines = f.read().splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines.pop()
+    return lines
+
+
+def load_done(out_path) -> set:
+    """Cells already present in an existing results table."""
+    if not os.path.exists(out_path):
+        return set()
+    done = set()
+    with open(out_path, newline="") as f:
+        for row in csv.DictReader(_complete_lines(f)):
+            # rows with a missing or extra column were mangled by an interrupted run
+            if None in row or any(row.get(col) in (None, "") for col in COLUMNS):
+                continue
+            try:
+                for col in COLUMNS[4:]:
+                    float(row[col])
+                done.add(_cell_key(row))
+            except ValueError:
+                pass
+    return done
+
+
+def drop_partial_row(out_path):
+    """Truncate 'out_path' after its last complete line, so appended rows start on their own."""
+    if not os.path.exists(out_path):
+        return
+    with open(out_path, "rb+") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            f.truncate(end)
+
+
+def run_sweep(out_path, battles=1000, chunk=10000, workers=None, seed=0,
+              shard_size=25, turns=range(1, 101)) -> int:
+    """
+    Run (or resume) the sweep, appending rows to 'out_path'.
+    Returns the number of cells simulated by this call.
+    """
+    if not batch_sim.USE_NUMPY:
+        raise ImportError("numpy is required for the balance sweep")
+    grid = build_grid(turns)
+    drop_partial_row(out_path)
+    done = load_done(out_path)
+    todo = [cell for cell in grid if cell not in done]
+    shards = [todo[i:i + shard_size] for i in range(0, len(todo), shard_size)]
+
+    new_file = not os.path.exists(out_path) or not os.path.getsize(out_path)
+    written = 0
+    with open(out_path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        if new_file:
+            writer.writeheader()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_shard, sh, seed, battles, chunk) for sh in shards]
+            for fut in as_completed(futures):
+                rows = fut.result()
+                writer.writerows(rows)
+                f.flush()
+                written += len(rows)
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Class/tier/area/turn balance sweep")
+    parser.add_argument("--out", default="sweep.csv")
+    parser.add_argument("--battles", type=int, default=1000, help="battles per cell")
+    parser.add_argument("--chunk", type=int, default=10000, help="battles held in memory at once")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turn", type=int, default=100)
+    args = parser.parse_args()
+    n = run_sweep(args.out, args.battles, args.chunk, args.workers, args.seed,
+                  turns=range(1, args.max_turn + 1))
+    print(f"Simulated {n} cells -> {args.out}")
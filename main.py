@@ -42,14 +42,18 @@ HEIGHT = 250
 # -----------------------------
 # 2) World Generation (Pangea-style)
 # -----------------------------
-def generate_pangea_world(width=WIDTH, height=HEIGHT) -> list[list[str]]:
+def generate_pangea_world(width=WIDTH, height=HEIGHT, rng=None) -> list[list[str]]:
     """
     Generates a 250x250 map with:
       - ~70% land as a single large continent (contiguous).
       - The rest is "Ocean."
       - The land is subdivided among LAND_BIOMES in contiguous lumps.
+    All randomness comes from 'rng' (a random.Random), so a seeded rng
+    always produces the same map.
     Returns a 2D list of biome strings.
     """
+    if rng is None:
+        rng = random.Random()
     world_map = [["Ocean" for _ in range(width)] for _ in range(height)]
 
     total_cells = width * height
@@ -73,19 +77,20 @@ def generate_pangea_world(width=WIDTH, height=HEIGHT) -> list[list[str]]:
         land_count += 1
 
         directions = [(0,1),(0,-1),(1,0),(-1,0)]
-        random.shuffle(directions)
+        rng.shuffle(directions)
         for dx, dy in directions:
             nx, ny = cx + dx, cy + dy
             if 0 <= nx < width and 0 <= ny < height:
                 if not visited[ny][nx]:
                     visited[ny][nx] = True
                     # random chance to expand so shape is not uniform
-                    if random.random() < 0.8:
+                    if rng.random() < 0.8:
                         queue.append((nx, ny))
 
     # Subdivide land among the LAND_BIOMES
-    random.shuffle(LAND_BIOMES)
-    num_biomes = len(LAND_BIOMES)
+    biomes = LAND_BIOMES[:]  # shuffle a copy: the module list is shared
+    rng.shuffle(biomes)
+    num_biomes = len(biomes)
     cells_per_biome = land_count // num_biomes
     leftover = land_count % num_biomes
 
@@ -97,7 +102,7 @@ def generate_pangea_world(width=WIDTH, height=HEIGHT) -> list[list[str]]:
             if 0 <= nx < width and 0 <= ny < height:
                 yield nx, ny
 
-    for i, biome in enumerate(LAND_BIOMES):
+    for i, biome in enumerate(biomes):
         # each biome gets a BFS "lump"
         cells_for_biome = cells_per_biome
         if i < leftover:
@@ -116,7 +121,7 @@ def generate_pangea_world(width=WIDTH, height=HEIGHT) -> list[list[str]]:
         if not land_cells_list:
             break  # no more unassigned land
 
-        start_x, start_y = random.choice(land_cells_list)
+        start_x, start_y = rng.choice(land_cells_list)
         q2 = deque()
         q2.append((start_x, start_y))
         visited_land[start_y][start_x] = True
@@ -178,12 +183,14 @@ def display_world_ascii(world_map: list[list[str]], show_width=80, show_height=4
 # -----------------------------
 # 4) Main Entry (Game Start)
 # -----------------------------
-def start_game():
+def start_game(seed=None):
     print("Starting the game...")
+    game = Game(seed)
+    print(f"World seed: {game.seed}")
     print("Generating a 250x250 Pangea-style world. Please wait...")
 
-    # Generate the world
-    world_map = generate_pangea_world(WIDTH, HEIGHT)
+    # Generate the world from the session's RNG
+    world_map = generate_pangea_world(WIDTH, HEIGHT, game.rng)
 
     # Display the final map (or a portion of it)
     print("\nHere is a portion of the generated world (80 wide x 40 tall):\n")
@@ -192,4 +199,5 @@ def start_game():
     print("\n...Map generation complete. Game world is ready!\n")
 
 if __name__ == "__main__":
-    start_game()
+    import sys
+    start_game(int(sys.argv[1]) if len(sys.argv) > 1 else None)
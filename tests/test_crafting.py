@@ -0,0 +1,51 @@
+# tests/test_crafting.py
+"""max_craftable against a linear search over plan(), and bulk crafting."""
+import random
+
+from game import crafting
+from game.data import CRAFTING_RECIPES
+from game.decisions import ScriptedDecisions
+from game.game import Game
+from game.items import ITEM_TEMPLATES
+
+STOCKED = sorted({ing for r in CRAFTING_RECIPES.values() for ing in r["ingredients"]})
+
+
+def linear_max(recipe_name, have):
+    qty = 0
+    while crafting.plan(recipe_name, qty + 1, have) is not None:
+        qty += 1
+    return qty
+
+
+def test_max_craftable_matches_linear_search():
+    rng = random.Random(1)
+    for _ in range(300):
+        counts = {name: rng.randint(0, 12) for name in STOCKED}
+        have = lambda name: counts.get(name, 0)
+        for recipe_name in CRAFTING_RECIPES:
+            assert crafting.max_craftable(recipe_name, have) == linear_max(recipe_name, have), (recipe_name, counts)
+
+
+def test_bulk_craft_takes_exactly_the_plan():
+    rng = random.Random(2)
+    for _ in range(50):
+        g = Game(seed=1, decisions=ScriptedDecisions())
+        g.start_new_game("Test", "1")
+        inv = g.player.inventory
+        for name in STOCKED:
+            inv.add(ITEM_TEMPLATES[name], rng.randint(1, 12))
+        recipe_name = rng.choice(list(CRAFTING_RECIPES))
+        result = CRAFTING_RECIPES[recipe_name]["result"]["name"]
+        qty = g.max_craftable(recipe_name)
+        if not qty:
+            continue
+        before = inv.name_counts()
+        planned = crafting.plan(recipe_name, qty, inv.name_count)
+        g.craft_item_by_name(recipe_name, qty)
+        after = inv.name_counts()
+        for name, units in planned.take.items():
+            expected = before[name] - units + (qty if name == result else 0)
+            assert after.get(name, 0) == expected, (recipe_name, name)
+        assert after[result] == before.get(result, 0) - planned.take.get(result, 0) + qty
+        assert g.max_craftable(recipe_name) == 0  # the maximum really was the maximum
@@ -0,0 +1,101 @@
+# tests/test_equip.py
+"""equip_party against a brute-force search over every assignment."""
+import random
+
+from game.companion import Companion
+from game.decisions import ScriptedDecisions
+from game.equip import SLOTS
+from game.game import Game
+from game.pet import Pet
+from game.player import Player
+
+
+def allowed(entity, item):
+    """The wear rules, written out independently of equip.py."""
+    if item.get("pet_only") and not isinstance(entity, Pet):
+        return False
+    if item.get("companion_only") and not isinstance(entity, Companion):
+        return False
+    if "class_req" in item:
+        return isinstance(entity, Player) and entity.player_class in item["class_req"]
+    return True
+
+
+def random_item(rng, slot, stat, i):
+    item = {"type": slot, "name": f"{slot} {i}", stat: rng.randint(0, 20), "cost": rng.randint(0, 20)}
+    roll = rng.random()
+    if roll < 0.2:
+        item["class_req"] = rng.sample(["Warrior", "Mage", "Archer", "Thief"], 2)
+    elif roll < 0.35:
+        item["pet_only"] = True
+    elif roll < 0.5:
+        item["companion_only"] = True
+    return item
+
+
+def best_total(party, pool, stat):
+    """Highest summed 'stat' of any valid way to hand out 'pool' (one item each, or none)."""
+    def search(k, free):
+        if k == len(party):
+            return 0
+        best = search(k + 1, free)
+        for i in free:
+            if allowed(party[k], pool[i]):
+                best = max(best, pool[i].get(stat, 0) + search(k + 1, free - {i}))
+        return best
+    return search(0, frozenset(range(len(pool))))
+
+
+def random_party(seed):
+    rng = random.Random(seed)
+    g = Game(seed=seed, decisions=ScriptedDecisions())
+    g.start_new_game("Test", rng.choice("1234"))
+    g.player.gold = 10_000
+    for _ in range(rng.randint(0, 2)):
+        g.hire_companion(rng.choice("123"))
+    for _ in range(rng.randint(0, 2)):
+        g.hire_pet(rng.choice("123"))
+    party = [g.player, *g.player.companions, *g.player.pets]
+    n = 0
+    for slot, stat in SLOTS:
+        for e in party:
+            setattr(e, "equipped_" + slot, None)
+            if rng.random() < 0.5:
+                n += 1
+                item = random_item(rng, slot, stat, n)
+                if allowed(e, item):
+                    setattr(e, "equipped_" + slot, item)
+        for _ in range(rng.randint(0, 5)):
+            n += 1
+            g.player.inventory.add(random_item(rng, slot, stat, n))
+    return g, party
+
+
+def test_equip_party_is_optimal():
+    for seed in range(150):
+        g, party = random_party(seed)
+        inventory = g.player.inventory
+        best = {}
+        before = {}
+        for slot, stat in SLOTS:
+            worn = [getattr(e, "equipped_" + slot) for e in party]
+            pool = [it for it in worn if it] + list(inventory.bucket(slot).values())
+            best[slot] = best_total(party, pool, stat)
+            before[slot] = sorted(id(it) for it in pool)
+
+        g.auto_equip_all()
+
+        for slot, stat in SLOTS:
+            worn = [getattr(e, "equipped_" + slot) for e in party]
+            for e, it in zip(party, worn):
+                assert it is None or allowed(e, it), (seed, slot)
+            assert sum(it.get(stat, 0) for it in worn if it) == best[slot], (seed, slot)
+            after = [it for it in worn if it] + list(inventory.bucket(slot).values())
+            assert sorted(id(it) for it in after) == before[slot], (seed, slot)
+
+
+def test_equip_party_repeat_reports_nothing():
+    for seed in range(50):
+        g, _ = random_party(seed)
+        g.auto_equip_all()
+        assert g.auto_equip_all() == []
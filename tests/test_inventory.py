@@ -0,0 +1,67 @@
+# tests/test_inventory.py
+"""Inventory's sorted views against a full re-sort after every change."""
+import random
+
+from game.decisions import ScriptedDecisions
+from game.game import Game
+from game.inventory import Inventory, VIEW_KEYS
+from game.items import ITEM_TEMPLATES
+
+CATALOG = list(ITEM_TEMPLATES.values())
+
+
+def resorted(inv, criterion):
+    """Handles by VIEW_KEYS[criterion], ties in the order they were added."""
+    key = VIEW_KEYS[criterion]
+    return [h for h, _ in sorted(inv.items(), key=lambda pair: (key(pair[1]), pair[0]))]
+
+
+def test_views_match_full_sort():
+    rng = random.Random(1)
+    inv = Inventory()
+    for step in range(3000):
+        roll = rng.random()
+        if roll < 0.6 or not inv:
+            inv.add(rng.choice(CATALOG), rng.randint(1, 3))
+        elif roll < 0.9:
+            h = inv.handle_at(rng.randrange(len(inv)))
+            inv.remove(h, rng.randint(1, inv.quantity(h)))
+        elif roll < 0.95:
+            inv.take_named(rng.choice(CATALOG)["name"], rng.randint(1, 4))
+        else:
+            inv.sort_by(rng.choice([None, *VIEW_KEYS]))
+        if step % 50 == 0:
+            for criterion in VIEW_KEYS:
+                assert inv.view(criterion) == resorted(inv, criterion), (step, criterion)
+
+
+def test_listing_order_and_pages_follow_the_view():
+    rng = random.Random(2)
+    inv = Inventory(rng.choice(CATALOG) for _ in range(500))
+    for criterion in VIEW_KEYS:
+        inv.sort_by(criterion)
+        for _ in range(50):
+            inv.add(rng.choice(CATALOG))
+            inv.remove(inv.handle_at(rng.randrange(len(inv))))
+        order = resorted(inv, criterion)
+        assert [inv.handle_at(i) for i in range(len(inv))] == order
+        start = rng.randrange(len(inv))
+        assert inv.page(start, 20) == [(inv.get(h), inv.quantity(h)) for h in order[start:start + 20]]
+    inv.sort_by(None)
+    assert [inv.handle_at(i) for i in range(len(inv))] == [h for h, _ in inv.items()]
+
+
+def test_sell_item_uses_the_sorted_numbering():
+    g = Game(seed=1, decisions=ScriptedDecisions())
+    g.start_new_game("Test", "1")
+    rng = random.Random(3)
+    for _ in range(200):
+        g.player.inventory.add(rng.choice(CATALOG))
+    g.sort_inventory("value")
+    inv = g.player.inventory
+    top = inv[0]
+    gold = g.player.gold
+    g.sell_item(1)
+    assert g.player.gold == gold + top["cost"] // 2
+    assert all(it["cost"] <= top["cost"] for it in inv)
+    assert inv.view("value") == resorted(inv, "value")
@@ -0,0 +1,74 @@
+# tests/test_loot.py
+"""Alias tables give every outcome exactly its share of the weight."""
+import random
+from collections import Counter
+
+import pytest
+
+from game.catalog import CATALOG
+from game.data import AREA_DATA, ENEMY_TYPES, RARITY_ORDER
+from game.loot import AliasTable, DROP_CHANCE, RARITY_WEIGHTS, USE_NUMPY, loot_mod, loot_table
+
+
+def exact_probabilities(table):
+    """Chance of each outcome index, read off the prob and alias columns."""
+    n = len(table.prob)
+    p = [0.0] * n
+    for i, (keep, other) in enumerate(zip(table.prob, table.alias)):
+        p[i] += keep / n
+        p[other] += (1.0 - keep) / n
+    return p
+
+
+def test_alias_probabilities_match_weights():
+    rng = random.Random(1)
+    for n in (1, 2, 3, 10, 257, 2000):
+        for _ in range(20):
+            weights = [rng.choice([0.0, rng.random(), rng.random() * 1000]) for _ in range(n)]
+            weights[rng.randrange(n)] += 1.0  # at least one positive weight
+            total = sum(weights)
+            table = AliasTable(list(range(n)), weights)
+            for got, w in zip(exact_probabilities(table), weights):
+                assert got == pytest.approx(w / total, abs=1e-12)
+
+
+def test_samples_follow_the_table():
+    weights = [5, 1, 0, 3, 1]
+    table = AliasTable("abcde", weights)
+    draws = 200_000
+    counts = Counter(table.sample_many(random.Random(2), draws))
+    assert counts["c"] == 0
+    for outcome, w in zip("abcde", weights):
+        assert counts[outcome] / draws == pytest.approx(w / sum(weights), abs=0.005)
+
+
+@pytest.mark.skipif(not USE_NUMPY, reason="numpy is not installed")
+def test_sample_indices_follow_the_table():
+    import numpy as np
+
+    weights = [5, 1, 0, 3, 1]
+    table = AliasTable("abcde", weights)
+    draws = 200_000
+    counts = np.bincount(table.sample_indices(np.random.default_rng(3), draws), minlength=5)
+    assert counts[2] == 0
+    for c, w in zip(counts, weights):
+        assert c / draws == pytest.approx(w / sum(weights), abs=0.005)
+
+
+def test_loot_table_drop_chance_and_rarity_tilt():
+    for area in AREA_DATA:
+        for enemy_type in ENEMY_TYPES:
+            for tier in sorted(CATALOG.by_tier):
+                table = loot_table(area, enemy_type, tier)
+                p = exact_probabilities(table)
+                mod = loot_mod(area, enemy_type)
+                drop = min(DROP_CHANCE * mod, 1.0)
+                assert table.outcomes[0] is None
+                assert p[0] == pytest.approx(1.0 - drop, abs=1e-12)
+                weight = {}
+                for item in table.outcomes[1:]:
+                    rarity = item.get("rarity", "Common")
+                    weight[id(item)] = RARITY_WEIGHTS.get(rarity, 1) * mod ** (RARITY_ORDER.get(rarity, 1) - 1)
+                total = sum(weight.values())
+                for item, got in zip(table.outcomes[1:], p[1:]):
+                    assert got == pytest.approx(drop * weight[id(item)] / total, abs=1e-12)
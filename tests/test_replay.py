@@ -0,0 +1,119 @@
+# tests/test_replay.py
+"""Every state-changing command goes through Recorder and replays exactly."""
+import asyncio
+import random
+
+import pytest
+
+from game.data import CRAFTING_RECIPES
+from game.decisions import AsyncDecisions, RandomDecisions, ScriptedDecisions
+from game.enemy import Enemy
+from game.items import ITEM_TEMPLATES
+from game.replay import COMMANDS, READ_ONLY, Recorder, SessionLog, verify
+from game.game import Game
+from game.status_effect import StatusEffect
+
+
+def saved_and_loaded(rec, tmp_path):
+    path = tmp_path / "session.jsonl"
+    rec.save(path)
+    return SessionLog.load(path)
+
+
+def started(seed=1):
+    rec = Recorder(seed=seed, decisions=RandomDecisions(random.Random(seed)))
+    rec.start_new_game("Test", "1")
+    rec.cheat_code("satoshi")
+    rec.hire_companion("1")
+    rec.hire_pet("1")
+    return rec
+
+
+def test_every_public_method_is_classified():
+    public = {name for name in dir(Game) if not name.startswith("_") and callable(getattr(Game, name))}
+    assert public <= COMMANDS | READ_ONLY | {"aspend_talent_points", "load_game_slot"}
+
+
+def test_helper_commands_replay(tmp_path):
+    rec = started()
+    # Editing the game directly is not recorded; a recorded load_state is
+    stocked = rec.game.fork()
+    stocked.player.inventory.add(ITEM_TEMPLATES["Iron Ore"], 9)
+    rec.load_state(stocked.state_dict())
+    rec.do_craft(CRAFTING_RECIPES["Iron Sword"], 2)
+    rec.auto_equip_character(rec.player)
+    rec.auto_equip_character(rec.player.companions[0])
+    rec.random_event_check()
+    rec.gain_random_relic()
+    rec.hidden_trap()
+    rec.check_for_new_tier()
+    wave = rec.get_enemy_wave()
+    rec.set_current_enemies(wave)
+    rec.add_status_effect(wave[0], StatusEffect("Poison", 3, "poison", 4))
+    rec.add_status_effect(rec.player, StatusEffect("Regen", 2, "regen", 5))
+    rec.party_attack(wave[0])
+    rec.enemies_attack(wave)
+    rec.battle_enemies(wave)
+    rec.battle_enemies(rec.current_enemies)
+    for e in wave:
+        if not e.is_alive():
+            rec.roll_loot(e)
+    rec.roll_horde_loot(wave)
+    assert verify(saved_and_loaded(rec, tmp_path))
+
+
+def test_fresh_enemies_are_encoded(tmp_path):
+    rec = started(2)
+    goblin = Enemy("Goblin", 3)
+    rec.add_status_effect(goblin, StatusEffect("Stun", 1, "stun"))
+    rec.simulate_battle([goblin, Enemy("Zombie", 1)])
+    rec.initiative_battle([Enemy("Skeleton", 2)])
+    rec.battle_enemies([Enemy("Goblin", 1)])
+    assert verify(saved_and_loaded(rec, tmp_path))
+
+
+def test_wounded_enemy_is_rejected_when_called():
+    rec = started(3)
+    goblin = Enemy("Goblin", 1)
+    goblin.hp -= 3
+    with pytest.raises(TypeError):
+        rec.simulate_battle([goblin])
+    with pytest.raises(TypeError):
+        rec.travel_to_area(object())
+
+
+def test_unclassified_method_is_refused(monkeypatch):
+    rec = started(4)
+    monkeypatch.setattr(Game, "sneaky", lambda self: None, raising=False)
+    with pytest.raises(TypeError):
+        rec.sneaky()
+
+
+def test_async_talent_picks_replay(tmp_path):
+    async def ask(prompt, options):
+        return len(options) - 1
+
+    rec = Recorder(seed=5, decisions=AsyncDecisions(ask))
+    rec.start_new_game("Test", "2")
+    rec.distribute_xp(5000)
+    asyncio.run(rec.aspend_talent_points())
+    assert rec.player.talent_points == 0
+    assert verify(saved_and_loaded(rec, tmp_path))
+
+
+def test_load_game_slot_is_a_state_reset(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    other = Game(seed=9, decisions=ScriptedDecisions())
+    other.start_new_game("Saved", "3")
+    other.distribute_xp(800)
+    other.save_game_slot("2")
+
+    rec = started(6)
+    rec.normal_battle()
+    rec.load_game_slot("2")
+    assert rec.player.name == "Saved"
+    rec.normal_battle()
+    rec.load_game_slot("3")  # missing: nothing changes, nothing is recorded
+    log = saved_and_loaded(rec, tmp_path)
+    (tmp_path / "savegame_2.json").unlink()
+    assert verify(log)